@@ -0,0 +1,93 @@
+"""Compare the filled shapes with setting the same pixels one by one."""
+
+##############################################################################
+# Python imports.
+from collections.abc import Callable
+from functools import partial
+from timeit import timeit
+
+##############################################################################
+# Textual imports.
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas
+
+##############################################################################
+# Benchmark settings.
+WIDTH = 800
+HEIGHT = 600
+REPEATS = 5
+CANVAS = Color(0, 0, 0)
+COLOUR = Color(255, 0, 0)
+
+
+##############################################################################
+def seconds(code: Callable[[], object]) -> float:
+    """Time how long some code takes, on average."""
+    return timeit(code, number=REPEATS) / REPEATS
+
+
+##############################################################################
+def pixels_of(draw: Callable[[Canvas], object]) -> list[tuple[int, int]]:
+    """Get the locations of the pixels that some drawing sets."""
+    canvas = Canvas(WIDTH, HEIGHT, CANVAS)
+    draw(canvas)
+    return [
+        (x, y)
+        for y in range(HEIGHT)
+        for x in range(WIDTH)
+        if canvas.get_pixel(x, y) == COLOUR
+    ]
+
+
+##############################################################################
+def main() -> None:
+    """Run the comparison."""
+
+    canvas = Canvas(WIDTH, HEIGHT, CANVAS)
+    shapes: list[tuple[str, Callable[[Canvas], object]]] = [
+        (
+            "rectangle",
+            lambda canvas: canvas.fill_rectangle(
+                50, 50, WIDTH - 100, HEIGHT - 100, COLOUR
+            ),
+        ),
+        (
+            "circle",
+            lambda canvas: canvas.fill_circle(
+                WIDTH // 2, HEIGHT // 2, HEIGHT // 2 - 10, COLOUR
+            ),
+        ),
+        (
+            "ellipse",
+            lambda canvas: canvas.fill_ellipse(
+                WIDTH // 2, HEIGHT // 2, WIDTH // 2 - 10, HEIGHT // 2 - 10, COLOUR
+            ),
+        ),
+        (
+            "polygon",
+            lambda canvas: canvas.fill_polygon(
+                [(10, HEIGHT - 10), (WIDTH // 2, 10), (WIDTH - 10, HEIGHT - 10)],
+                COLOUR,
+            ),
+        ),
+    ]
+
+    print(f"Canvas of {WIDTH}x{HEIGHT} pixels")
+    print(f"{'':<12}{'pixels':>10}{'set_pixels (ms)':>18}{'fill (ms)':>12}")
+    for title, draw in shapes:
+        locations = pixels_of(draw)
+        print(
+            f"{title:<12}{len(locations):>10}"
+            f"{seconds(partial(canvas.set_pixels, locations, COLOUR)) * 1000:>18.2f}"
+            f"{seconds(partial(draw, canvas)) * 1000:>12.2f}"
+        )
+
+
+##############################################################################
+if __name__ == "__main__":
+    main()
+
+### filled.py ends here
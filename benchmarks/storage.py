@@ -0,0 +1,97 @@
+"""Compare the packed pixel storage with the old list-of-lists storage."""
+
+##############################################################################
+# Python imports.
+from collections.abc import Callable
+from timeit import timeit
+from tracemalloc import get_traced_memory, start, stop
+
+##############################################################################
+# Textual imports.
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas.pixels import PixelBuffer, pack_color
+
+##############################################################################
+# Benchmark settings.
+WIDTH = 2000
+HEIGHT = 1000
+REPEATS = 5
+COLOUR = Color(255, 0, 0)
+
+
+##############################################################################
+def lists(width: int, height: int) -> list[list[Color | None]]:
+    """Make a canvas the way the canvas used to be stored."""
+    return [[None for _ in range(width)] for _ in range(height)]
+
+
+##############################################################################
+def memory_of(make: Callable[[], object]) -> int:
+    """Measure the memory needed to make something."""
+    start()
+    kept = make()
+    size, _ = get_traced_memory()
+    stop()
+    del kept
+    return size
+
+
+##############################################################################
+def seconds(code: Callable[[], object]) -> float:
+    """Time how long some code takes, on average."""
+    return timeit(code, number=REPEATS) / REPEATS
+
+
+##############################################################################
+def main() -> None:
+    """Run the comparison."""
+
+    old = lists(WIDTH, HEIGHT)
+    new = PixelBuffer(WIDTH, HEIGHT)
+    packed = pack_color(COLOUR)
+    locations = [(x, y) for y in range(0, HEIGHT, 7) for x in range(0, WIDTH, 3)]
+
+    def set_old() -> None:
+        for x, y in locations:
+            old[y][x] = COLOUR
+
+    def set_new() -> None:
+        data = new.data
+        for x, y in locations:
+            data[y * WIDTH + x] = packed
+
+    print(f"Canvas of {WIDTH}x{HEIGHT} pixels")
+    print(f"{'':<20}{'list[list]':>14}{'PixelBuffer':>14}")
+    for title, old_value, new_value in (
+        (
+            "memory (MiB)",
+            memory_of(lambda: lists(WIDTH, HEIGHT)) / 2**20,
+            memory_of(lambda: PixelBuffer(WIDTH, HEIGHT)) / 2**20,
+        ),
+        (
+            "clear (ms)",
+            seconds(lambda: lists(WIDTH, HEIGHT)) * 1000,
+            seconds(new.fill) * 1000,
+        ),
+        (
+            f"set {len(locations)} (ms)",
+            seconds(set_old) * 1000,
+            seconds(set_new) * 1000,
+        ),
+        (
+            "read all rows (ms)",
+            seconds(lambda: [row[:] for row in old]) * 1000,
+            seconds(lambda: [new.row(y) for y in range(HEIGHT)]) * 1000,
+        ),
+    ):
+        print(f"{title:<20}{old_value:>14.2f}{new_value:>14.2f}")
+
+
+##############################################################################
+if __name__ == "__main__":
+    main()
+
+### storage.py ends here
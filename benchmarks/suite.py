@@ -0,0 +1,464 @@
+"""A benchmark suite for the drawing primitives and the rendering of the canvas.
+
+Each benchmark is timed over a range of canvas sizes and numbers of distinct
+colours, and the peak memory used while setting it up and running it once
+is measured. The results are written as JSON so that they can be compared
+between commits.
+
+Run it as a script:
+
+    python benchmarks/suite.py --output before.json
+    python benchmarks/suite.py --output after.json
+    python benchmarks/suite.py --compare before.json after.json
+
+or with pytest, writing the results to the file named by the
+`BENCHMARK_RESULTS` environment variable:
+
+    BENCHMARK_RESULTS=results.json python -m pytest benchmarks/suite.py
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from argparse import ArgumentParser, Namespace
+from array import array
+from asyncio import Event, new_event_loop
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from json import dumps, loads
+from math import ceil
+from os import environ
+from pathlib import Path
+from platform import platform, python_version
+from random import Random
+from subprocess import SubprocessError, run
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import TYPE_CHECKING
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas
+from textual_canvas.pixels import PIXEL_TYPE, PixelBuffer, pack_color
+
+##############################################################################
+# Type checking imports.
+if TYPE_CHECKING:
+    from pytest import Metafunc
+
+##############################################################################
+# Benchmark settings.
+SIZES = ((100, 100), (1000, 1000), (4000, 2000))
+QUICK_SIZES = ((100, 100), (1000, 1000))
+COLOURS = (1, 256)
+REPEATS = 3
+SEED = 2024
+POINTS = 10_000
+LINES = 200
+CIRCLES = 50
+VIEW_WIDTH = 200
+VIEW_LINES = 50
+UNSET = Color(0, 0, 0)
+
+##############################################################################
+Benchmark = Callable[
+    [int, int, list[Color]], AbstractContextManager[Callable[[], object]]
+]
+"""The type of a benchmark.
+
+This sets up the benchmark for a canvas size and a set of colours, as a
+context manager that gives the code to time and tidies up afterwards.
+"""
+
+
+##############################################################################
+def colours_for(count: int) -> list[Color]:
+    """Make a reproducible set of distinct colours."""
+    random = Random(SEED)
+    colours: dict[Color, None] = {}
+    while len(colours) < count:
+        red, green, blue = (random.randrange(1, 256) for _ in range(3))
+        colours[Color(red, green, blue)] = None
+    return list(colours)
+
+
+##############################################################################
+@contextmanager
+def set_pixels(
+    width: int, height: int, colours: list[Color]
+) -> Iterator[Callable[[], object]]:
+    """Set scattered pixels, one call per colour."""
+    canvas = Canvas(width, height, UNSET)
+    random = Random(SEED)
+    groups = [
+        (
+            [
+                (random.randrange(width), random.randrange(height))
+                for _ in range(POINTS // len(colours))
+            ],
+            colour,
+        )
+        for colour in colours
+    ]
+
+    def benchmark() -> None:
+        for locations, colour in groups:
+            canvas.set_pixels(locations, colour)
+
+    yield benchmark
+
+
+##############################################################################
+@contextmanager
+def draw_line(
+    width: int, height: int, colours: list[Color]
+) -> Iterator[Callable[[], object]]:
+    """Draw lines between random points of the canvas."""
+    canvas = Canvas(width, height, UNSET)
+    random = Random(SEED)
+    lines = [
+        (
+            random.randrange(width),
+            random.randrange(height),
+            random.randrange(width),
+            random.randrange(height),
+            colours[line % len(colours)],
+        )
+        for line in range(LINES)
+    ]
+
+    def benchmark() -> None:
+        for x0, y0, x1, y1, colour in lines:
+            canvas.draw_line(x0, y0, x1, y1, colour)
+
+    yield benchmark
+
+
+##############################################################################
+@contextmanager
+def draw_circle(
+    width: int, height: int, colours: list[Color]
+) -> Iterator[Callable[[], object]]:
+    """Draw circles of random sizes around the canvas."""
+    canvas = Canvas(width, height, UNSET)
+    random = Random(SEED)
+    circles = [
+        (
+            random.randrange(width),
+            random.randrange(height),
+            random.randrange(1, max(min(width, height) // 2, 2)),
+            colours[circle % len(colours)],
+        )
+        for circle in range(CIRCLES)
+    ]
+
+    def benchmark() -> None:
+        for x, y, radius, colour in circles:
+            canvas.draw_circle(x, y, radius, colour)
+
+    yield benchmark
+
+
+##############################################################################
+@contextmanager
+def clear(
+    width: int, height: int, colours: list[Color]
+) -> Iterator[Callable[[], object]]:
+    """Clear a canvas that has been drawn on."""
+    canvas = Canvas(width, height, UNSET)
+    canvas.draw_line(0, 0, width - 1, height - 1, colours[0])
+    yield canvas.clear
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """An application that shows the canvas being benchmarked."""
+
+    def __init__(self, canvas: Canvas) -> None:
+        super().__init__()
+        self._canvas = canvas
+
+    def compose(self) -> ComposeResult:
+        yield self._canvas
+
+
+##############################################################################
+@contextmanager
+def render_line(
+    width: int, height: int, colours: list[Color]
+) -> Iterator[Callable[[], object]]:
+    """Render every line in view of a canvas filled with noise of the colours.
+
+    The canvas is shown by a headless application, so the lines are rendered
+    just as they would be on screen: by the canvas, and only the part of
+    each line that is in view. The canvas's cache of rendered lines is
+    emptied before each run, so that every line is rendered afresh.
+    """
+    random = Random(SEED)
+    packed = [pack_color(colour) for colour in colours]
+    pixels = PixelBuffer(width, height)
+    rows = [
+        array(PIXEL_TYPE, [random.choice(packed) for _ in range(width)])
+        for _ in range(min(height, 64))
+    ]
+    for y in range(height):
+        pixels.set_row(y, 0, rows[y % len(rows)])
+    canvas = Canvas(width, height, UNSET, render_mode="half").put_region(pixels, 0, 0)
+    lines = range(min(ceil(height / 2), VIEW_LINES))
+
+    def benchmark() -> None:
+        canvas._line_cache.clear()
+        for line in lines:
+            canvas.render_line(line)
+
+    shown, done = Event(), Event()
+
+    async def show() -> None:
+        # Leave a line spare for the horizontal scrollbar of a wide canvas.
+        async with CanvasApp(canvas).run_test(size=(VIEW_WIDTH, VIEW_LINES + 1)):
+            shown.set()
+            await done.wait()
+
+    loop = new_event_loop()
+    showing = loop.create_task(show())
+    loop.run_until_complete(shown.wait())
+    try:
+        yield benchmark
+    finally:
+        done.set()
+        loop.run_until_complete(showing)
+        loop.close()
+
+
+##############################################################################
+BENCHMARKS: dict[str, Benchmark] = {
+    "set_pixels": set_pixels,
+    "draw_line": draw_line,
+    "draw_circle": draw_circle,
+    "clear": clear,
+    "render_line": render_line,
+}
+"""The benchmarks in the suite."""
+
+
+##############################################################################
+@dataclass(frozen=True)
+class Case:
+    """A benchmark run on one size of canvas with one number of colours."""
+
+    benchmark: str
+    """The name of the benchmark."""
+    width: int
+    """The width of the canvas."""
+    height: int
+    """The height of the canvas."""
+    colours: int
+    """The number of distinct colours drawn with."""
+
+    def __str__(self) -> str:
+        return f"{self.benchmark}-{self.width}x{self.height}-{self.colours}"
+
+
+##############################################################################
+@dataclass(frozen=True)
+class Result:
+    """The result of running a case."""
+
+    case: str
+    """The name of the case."""
+    benchmark: str
+    """The name of the benchmark."""
+    width: int
+    """The width of the canvas."""
+    height: int
+    """The height of the canvas."""
+    colours: int
+    """The number of distinct colours drawn with."""
+    repeats: int
+    """The number of times the benchmark was timed."""
+    best: float
+    """The quickest time, in seconds."""
+    mean: float
+    """The mean time, in seconds."""
+    per_line: float | None
+    """The quickest time per line in view, for rendering benchmarks."""
+    peak_memory: int
+    """The peak memory, in bytes, used to set up and run the benchmark once."""
+
+
+##############################################################################
+def cases(sizes: tuple[tuple[int, int], ...] = SIZES) -> Iterator[Case]:
+    """Generate all the cases for some sizes of canvas."""
+    for name in BENCHMARKS:
+        for width, height in sizes:
+            for colours in COLOURS:
+                yield Case(name, width, height, colours)
+
+
+##############################################################################
+def measure(case: Case, repeats: int = REPEATS) -> Result:
+    """Run a case and measure it."""
+    colours = colours_for(case.colours)
+    setup = BENCHMARKS[case.benchmark]
+
+    # Measure the memory on its own run, as tracing the memory slows
+    # everything down.
+    start()
+    with setup(case.width, case.height, colours) as benchmark:
+        benchmark()
+    _, peak_memory = get_traced_memory()
+    stop()
+
+    times: list[float] = []
+    with setup(case.width, case.height, colours) as benchmark:
+        for _ in range(repeats):
+            started = perf_counter()
+            benchmark()
+            times.append(perf_counter() - started)
+    best = min(times)
+    return Result(
+        case=str(case),
+        benchmark=case.benchmark,
+        width=case.width,
+        height=case.height,
+        colours=case.colours,
+        repeats=repeats,
+        best=best,
+        mean=sum(times) / len(times),
+        per_line=best / min(ceil(case.height / 2), VIEW_LINES)
+        if case.benchmark == "render_line"
+        else None,
+        peak_memory=peak_memory,
+    )
+
+
+##############################################################################
+def commit() -> str | None:
+    """Get the commit being benchmarked, if it can be found."""
+    try:
+        found = run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, SubprocessError):
+        return None
+    return found.stdout.strip() or None
+
+
+##############################################################################
+def save(results: list[Result], output: Path) -> None:
+    """Save the results of the suite as JSON."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        dumps(
+            {
+                "commit": commit(),
+                "when": datetime.now(timezone.utc).isoformat(),
+                "python": python_version(),
+                "platform": platform(),
+                "results": [asdict(result) for result in results],
+            },
+            indent=2,
+        )
+    )
+
+
+##############################################################################
+def compare(before: Path, after: Path) -> None:
+    """Compare the results of two runs of the suite."""
+    old = {result["case"]: result for result in loads(before.read_text())["results"]}
+    new = {result["case"]: result for result in loads(after.read_text())["results"]}
+    print(f"{'case':<32}{'before (ms)':>14}{'after (ms)':>14}{'change':>10}")
+    for case in (case for case in new if case in old):
+        was, now = old[case]["best"], new[case]["best"]
+        print(f"{case:<32}{was * 1000:>14.3f}{now * 1000:>14.3f}{now / was:>9.2f}x")
+
+
+##############################################################################
+RESULTS: list[Result] = []
+"""The results gathered when the suite is run with pytest."""
+
+
+# The pytest hooks are plain functions, so that pytest is only needed when
+# the suite is run with pytest.
+
+
+def pytest_generate_tests(metafunc: Metafunc) -> None:
+    """Run the test of the suite for every case."""
+    if "case" in metafunc.fixturenames:
+        metafunc.parametrize("case", list(cases()), ids=str)
+
+
+def teardown_module() -> None:
+    """Save the results gathered by pytest, if asked to."""
+    if output := environ.get("BENCHMARK_RESULTS"):
+        save(RESULTS, Path(output))
+
+
+def test_benchmark(case: Case) -> None:
+    """Run a case of the suite."""
+    RESULTS.append(result := measure(case))
+    assert result.best > 0
+
+
+##############################################################################
+def get_args() -> Namespace:
+    """Get the command line arguments."""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(".reports/benchmarks.json"),
+        help="Where to write the results (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Leave out the largest canvas size"
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=REPEATS,
+        help="How many times to time each case (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        type=Path,
+        metavar=("BEFORE", "AFTER"),
+        help="Compare the results of two runs rather than running the suite",
+    )
+    return parser.parse_args()
+
+
+##############################################################################
+def main() -> None:
+    """Run the suite."""
+    args = get_args()
+    if args.compare:
+        compare(*args.compare)
+        return
+    results: list[Result] = []
+    for case in cases(QUICK_SIZES if args.quick else SIZES):
+        results.append(result := measure(case, args.repeats))
+        print(
+            f"{result.case:<32}{result.best * 1000:>12.3f} ms"
+            f"{result.peak_memory / 2**20:>10.2f} MiB"
+        )
+    save(results, args.output)
+    print(f"Results written to {args.output}")
+
+
+##############################################################################
+if __name__ == "__main__":
+    main()
+
+### suite.py ends here
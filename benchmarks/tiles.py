@@ -0,0 +1,89 @@
+"""Compare the tiled pixel storage with the contiguous pixel storage."""
+
+##############################################################################
+# Python imports.
+from collections.abc import Callable
+from timeit import timeit
+from tracemalloc import get_traced_memory, start, stop
+
+##############################################################################
+# Textual imports.
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas.pixels import PixelBuffer, pack_color
+from textual_canvas.tiles import Pixels, TiledPixelBuffer
+
+##############################################################################
+# Benchmark settings.
+WIDTH = 4000
+HEIGHT = 4000
+VIEW = 200
+REPEATS = 5
+COLOUR = Color(255, 0, 0)
+
+
+##############################################################################
+def drawn(pixels: Pixels) -> Pixels:
+    """Draw a sparse scattering of small blocks on some pixels."""
+    packed = pack_color(COLOUR)
+    for top in range(0, HEIGHT, 500):
+        for left in range(0, WIDTH, 500):
+            for y in range(top, top + 20):
+                for x in range(left, left + 20):
+                    pixels.put(x, y, packed)
+    return pixels
+
+
+##############################################################################
+def memory_of(make: Callable[[], object]) -> int:
+    """Measure the memory needed to make something."""
+    start()
+    kept = make()
+    size, _ = get_traced_memory()
+    stop()
+    del kept
+    return size
+
+
+##############################################################################
+def seconds(code: Callable[[], object]) -> float:
+    """Time how long some code takes, on average."""
+    return timeit(code, number=REPEATS) / REPEATS
+
+
+##############################################################################
+def main() -> None:
+    """Run the comparison."""
+
+    flat = drawn(PixelBuffer(WIDTH, HEIGHT))
+    tiled = drawn(TiledPixelBuffer(WIDTH, HEIGHT))
+
+    print(f"Canvas of {WIDTH}x{HEIGHT} pixels, sparsely drawn on")
+    print(f"{'':<24}{'PixelBuffer':>14}{'TiledPixelBuffer':>18}")
+    for title, flat_value, tiled_value in (
+        (
+            "memory (MiB)",
+            memory_of(lambda: drawn(PixelBuffer(WIDTH, HEIGHT))) / 2**20,
+            memory_of(lambda: drawn(TiledPixelBuffer(WIDTH, HEIGHT))) / 2**20,
+        ),
+        (
+            f"read {VIEW} rows of {VIEW} (ms)",
+            seconds(lambda: [flat.row(y, 0, VIEW) for y in range(VIEW)]) * 1000,
+            seconds(lambda: [tiled.row(y, 0, VIEW) for y in range(VIEW)]) * 1000,
+        ),
+        (
+            "clear (ms)",
+            seconds(flat.fill) * 1000,
+            seconds(tiled.fill) * 1000,
+        ),
+    ):
+        print(f"{title:<24}{flat_value:>14.2f}{tiled_value:>18.2f}")
+
+
+##############################################################################
+if __name__ == "__main__":
+    main()
+
+### tiles.py ends here
@@ -0,0 +1,27 @@
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+from textual_canvas import Canvas
+
+
+class FillShapesApp(App[None]):
+    CSS = """
+    Canvas {
+        background: $panel;
+        color: blue;
+    }
+    """
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(60, 30, Color.parse("cornflowerblue"))
+
+    def on_mount(self) -> None:
+        self.query_one(Canvas).fill_rectangle(2, 2, 16, 10).fill_circle(
+            30, 7, 5, Color.parse("red")
+        ).fill_ellipse(48, 7, 9, 5, Color.parse("yellow")).fill_polygon(
+            [(5, 27), (20, 15), (35, 27), (45, 15), (57, 27)], Color.parse("green")
+        )
+
+
+if __name__ == "__main__":
+    FillShapesApp().run()
@@ -1,9 +1,11 @@
 from collections.abc import Iterator
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.color import Color
 
 from textual_canvas.canvas import Canvas
+from textual_canvas.threads import DrawingQueue
 
 BLUE_BROWN = [
     Color(66, 30, 15),
@@ -51,16 +53,24 @@ class MandelbrotApp(App[None]):
         yield Canvas(120, 90)
 
     def on_mount(self) -> None:
-        with (canvas := self.query_one(Canvas)).batch_refresh():
-            for x_pixel, x_point in frange(-2.5, 1.5, canvas.width):
-                for y_pixel, y_point in frange(-1.5, 1.5, canvas.height):
-                    canvas.set_pixel(
-                        x_pixel,
-                        y_pixel,
+        (canvas := self.query_one(Canvas)).segment_cache.warm(
+            [*BLUE_BROWN, Color(0, 0, 0)]
+        )
+        self.draw(canvas.queue_drawing(), canvas.width, canvas.height)
+
+    @work(thread=True)
+    def draw(self, queue: DrawingQueue, width: int, height: int) -> None:
+        with queue:
+            for y_pixel, y_point in frange(-1.5, 1.5, height):
+                queue.set_row(
+                    y_pixel,
+                    [
                         BLUE_BROWN[value % 16]
                         if (value := mandelbrot(x_point, y_point))
-                        else Color(0, 0, 0),
-                    )
+                        else Color(0, 0, 0)
+                        for _, x_point in frange(-2.5, 1.5, width)
+                    ],
+                )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+"""Provides a frame-rate-limited driver for animating a canvas."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections import deque
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from time import monotonic
+from typing import Final, TypeAlias
+
+##############################################################################
+# Textual imports.
+from textual.timer import Timer
+
+##############################################################################
+FrameCallback: TypeAlias = Callable[[float], object]
+"""The type of a callback that draws a frame of an animation.
+
+It is called with the time, in seconds, since the animation started.
+"""
+
+STATS_WINDOW: Final[int] = 60
+"""The number of recent frames that the statistics of an animation cover."""
+
+
+##############################################################################
+@dataclass(frozen=True)
+class AnimationStats:
+    """A snapshot of the statistics of an [`Animation`][textual_canvas.animation.Animation]."""
+
+    frames: int
+    """The number of frames that have been drawn."""
+    dropped: int
+    """The number of frames that were dropped because drawing fell behind."""
+    fps: float
+    """The frame rate achieved over the recent frames."""
+    frame_time: float
+    """The mean time, in seconds, taken to draw the recent frames."""
+    max_frame_time: float
+    """The longest time, in seconds, taken to draw one of the recent frames."""
+
+
+##############################################################################
+class Animation:
+    """Drives an animation of a canvas at a target frame rate.
+
+    Animations are started with
+    [`Canvas.start_animation`][textual_canvas.canvas.Canvas.start_animation].
+    Each frame is drawn within a batch, so however much is drawn the canvas
+    is refreshed once per frame. If drawing a frame takes longer than the
+    time between frames, the frames that should have been drawn in the
+    meantime are dropped rather than queued up.
+    """
+
+    def __init__(
+        self,
+        callback: FrameCallback,
+        fps: float,
+        batch: Callable[[], AbstractContextManager[None]],
+    ) -> None:
+        """Initialise the animation.
+
+        Args:
+            callback: The callback that draws each frame.
+            fps: The target frame rate.
+            batch: Makes the batch that each frame is drawn within.
+
+        Raises:
+            ValueError: If the frame rate isn't positive.
+        """
+        if fps <= 0:
+            raise ValueError(f"The frame rate must be positive, not {fps}")
+        self._callback = callback
+        """The callback that draws each frame."""
+        self._batch = batch
+        """Makes the batch that each frame is drawn within."""
+        self.fps = fps
+        """The target frame rate."""
+        self._timer: Timer | None = None
+        """The timer that drives the animation, once it has started."""
+        self._started = monotonic()
+        """When the animation started."""
+        self._last: float | None = None
+        """When the last frame was drawn, if one has been drawn."""
+        self._frames = 0
+        """The number of frames that have been drawn."""
+        self._dropped = 0
+        """The number of frames that have been dropped."""
+        self._recent: deque[tuple[float, float]] = deque(maxlen=STATS_WINDOW)
+        """When each recent frame started, and how long it took to draw."""
+
+    @property
+    def interval(self) -> float:
+        """The time, in seconds, between frames."""
+        return 1 / self.fps
+
+    @property
+    def running(self) -> bool:
+        """Is the animation running?"""
+        return self._timer is not None
+
+    def start(self, timer: Callable[[float, Callable[[], None]], Timer]) -> None:
+        """Start the animation.
+
+        Args:
+            timer: Makes the timer that calls a callback at an interval.
+        """
+        self._started = monotonic()
+        self._timer = timer(self.interval, self.frame)
+
+    def stop(self) -> None:
+        """Stop the animation."""
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    def frame(self) -> None:
+        """Draw a frame of the animation."""
+        start = monotonic()
+        if self._last is not None:
+            self._dropped += max(round((start - self._last) / self.interval) - 1, 0)
+        self._last = start
+        with self._batch():
+            self._callback(start - self._started)
+        self._frames += 1
+        self._recent.append((start, monotonic() - start))
+
+    @property
+    def stats(self) -> AnimationStats:
+        """A snapshot of the statistics for the animation."""
+        recent = self._recent
+        times = [took for _, took in recent]
+        elapsed = recent[-1][0] - recent[0][0] if len(recent) > 1 else 0.0
+        return AnimationStats(
+            frames=self._frames,
+            dropped=self._dropped,
+            fps=(len(recent) - 1) / elapsed if elapsed else 0.0,
+            frame_time=sum(times) / len(times) if times else 0.0,
+            max_frame_time=max(times, default=0.0),
+        )
+
+    def reset_stats(self) -> None:
+        """Reset the statistics for the animation."""
+        self._frames = self._dropped = 0
+        self._last = None
+        self._recent.clear()
+
+
+### animation.py ends here
@@ -0,0 +1,228 @@
+"""Provides support for working with canvas pixels as NumPy arrays.
+
+This module requires [NumPy](https://numpy.org/), which is an optional
+dependency of `textual-canvas`; install it with:
+
+```sh
+pip install textual-canvas[numpy]
+```
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections.abc import Callable, Sequence
+from typing import Any
+
+##############################################################################
+# NumPy imports.
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+##############################################################################
+# Textual imports.
+from textual.color import Color
+from textual.geometry import Region
+
+##############################################################################
+# Local imports.
+from .pixels import NO_COLOR, PALETTE_TYPE, PixelBuffer, pack_color
+
+
+##############################################################################
+def pixel_view(buffer: PixelBuffer) -> NDArray[np.unsignedinteger[Any]]:
+    """Get a writable view of the pixels in a buffer.
+
+    Args:
+        buffer: The buffer to view.
+
+    Returns:
+        A `(height, width)` array of pixel values that shares its memory
+            with the buffer.
+
+    The array will be of `uint32` packed pixel values, or of `uint8` palette
+    indexes if the buffer holds palette indexes.
+    """
+    view: NDArray[np.unsignedinteger[Any]] = (
+        np.frombuffer(buffer.data, dtype=np.uint8)
+        if buffer.data.typecode == PALETTE_TYPE
+        else np.frombuffer(buffer.data, dtype=np.uint32)
+    )
+    return view.reshape(buffer.height, buffer.width)
+
+
+##############################################################################
+def pack_array(pixels: NDArray[np.generic]) -> NDArray[np.uint32]:
+    """Pack an array of pixels into packed pixel values.
+
+    Args:
+        pixels: The pixels to pack.
+
+    Returns:
+        A `(height, width)` array of packed pixel values.
+
+    Raises:
+        ValueError: If the array isn't of a shape or type that can be packed.
+
+    The pixels can either be a `(height, width)` array of integers that are
+    already packed pixel values, or a `(height, width, 3)` or `(height,
+    width, 4)` array of `uint8` red, green, blue and (optionally) alpha
+    values. As with [`pack_color`][textual_canvas.pixels.pack_color], a
+    pixel with an alpha of zero is packed as
+    [`NO_COLOR`][textual_canvas.pixels.NO_COLOR].
+    """
+    if pixels.ndim == 2 and np.issubdtype(pixels.dtype, np.integer):
+        return pixels.astype(np.uint32, copy=False)
+    if pixels.ndim == 3 and pixels.shape[2] in (3, 4) and pixels.dtype == np.uint8:
+        channels = pixels.astype(np.uint32)
+        packed = (
+            channels[..., 3].copy()
+            if pixels.shape[2] == 4
+            else np.full(pixels.shape[:2], 0xFF, dtype=np.uint32)
+        )
+        packed |= channels[..., 0] << 24
+        packed |= channels[..., 1] << 16
+        packed |= channels[..., 2] << 8
+        if pixels.shape[2] == 4:
+            packed[pixels[..., 3] == 0] = NO_COLOR
+        return packed
+    raise ValueError(
+        f"Can't pack an array of shape {pixels.shape} and type {pixels.dtype}"
+    )
+
+
+##############################################################################
+def pack_colors(colors: Sequence[Color] | NDArray[np.generic]) -> NDArray[np.uint32]:
+    """Pack a collection of colours into packed pixel values.
+
+    Args:
+        colors: The colours to pack.
+
+    Returns:
+        A one-dimensional array of packed pixel values.
+
+    Raises:
+        ValueError: If the colours can't be packed.
+
+    The colours can either be a sequence of
+    [`Color`][textual.color.Color] objects, a one-dimensional array of
+    integers that are already packed pixel values, or an `(n, 3)` or `(n,
+    4)` array of `uint8` red, green, blue and (optionally) alpha values.
+    """
+    if isinstance(colors, np.ndarray):
+        if colors.ndim in (1, 2):
+            return pack_array(colors[np.newaxis]).reshape(-1)
+        raise ValueError(f"Can't pack colours from an array of shape {colors.shape}")
+    return np.fromiter(
+        (pack_color(color) for color in colors), dtype=np.uint32, count=len(colors)
+    )
+
+
+##############################################################################
+def index_array(pixels: NDArray[np.generic]) -> NDArray[np.uint8]:
+    """Turn an array of palette indexes into the form the canvas holds them in.
+
+    Args:
+        pixels: The palette indexes.
+
+    Returns:
+        A `(height, width)` array of `uint8` palette indexes.
+
+    Raises:
+        ValueError: If the array isn't a two-dimensional array of integers.
+    """
+    if pixels.ndim == 2 and np.issubdtype(pixels.dtype, np.integer):
+        return pixels.astype(np.uint8, copy=False)
+    raise ValueError(
+        f"Can't use an array of shape {pixels.shape} and type {pixels.dtype}"
+        " as palette indexes"
+    )
+
+
+##############################################################################
+def palette_indexes(
+    colors: Sequence[Color] | NDArray[np.generic], index_of: Callable[[Color], int]
+) -> NDArray[np.uint8]:
+    """Turn a collection of colours into palette indexes.
+
+    Args:
+        colors: The colours to turn into palette indexes.
+        index_of: A function that gives the palette index for a colour.
+
+    Returns:
+        A one-dimensional array of palette indexes.
+
+    Raises:
+        ValueError: If the colours can't be turned into indexes.
+
+    The colours can either be a sequence of
+    [`Color`][textual.color.Color] objects, or a one-dimensional array of
+    integers that are already palette indexes.
+    """
+    if isinstance(colors, np.ndarray):
+        if colors.ndim == 1 and np.issubdtype(colors.dtype, np.integer):
+            return colors.astype(np.uint8)
+        raise ValueError(
+            f"Can't use an array of shape {colors.shape} and type {colors.dtype}"
+            " as palette indexes"
+        )
+    return np.fromiter(
+        (index_of(color) for color in colors), dtype=np.uint8, count=len(colors)
+    )
+
+
+##############################################################################
+def scatter(
+    buffer: PixelBuffer,
+    xs: ArrayLike,
+    ys: ArrayLike,
+    values: int | NDArray[np.unsignedinteger[Any]],
+    clip: bool,
+) -> tuple[Region, int] | None:
+    """Set pixels at many locations in a buffer in one operation.
+
+    Args:
+        buffer: The buffer to set the pixels in.
+        xs: The horizontal locations of the pixels.
+        ys: The vertical locations of the pixels.
+        values: The value for all the pixels, or for each pixel.
+        clip: Should locations outwith the buffer be ignored?
+
+    Returns:
+        The region of the buffer that was changed along with the number of
+            pixels that were set, or [`None`][None] if nothing was changed.
+
+    Raises:
+        ValueError: If the locations and values don't match in length, or
+            if a location is outwith the buffer and `clip` is `False`.
+
+    Nothing is written if an error is raised.
+    """
+    x = np.asarray(xs, dtype=np.intp)
+    y = np.asarray(ys, dtype=np.intp)
+    if x.ndim != 1 or x.shape != y.shape:
+        raise ValueError("The horizontal and vertical locations must match in length")
+    if not isinstance(values, int) and values.shape != x.shape:
+        raise ValueError("There must be one colour for each location")
+    width, height = buffer.width, buffer.height
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    if not inside.all():
+        if not clip:
+            outwith = int(np.argmin(inside))
+            raise ValueError(
+                f"x={x[outwith]}, y={y[outwith]} is not within 0, 0, {width}, {height}"
+            )
+        x, y = x[inside], y[inside]
+        if not isinstance(values, int):
+            values = values[inside]
+    if not len(x):
+        return None
+    pixel_view(buffer).reshape(-1)[y * width + x] = values
+    left, top = int(x.min()), int(y.min())
+    return Region(left, top, int(x.max()) - left + 1, int(y.max()) - top + 1), len(x)
+
+
+### arrays.py ends here
@@ -6,52 +6,95 @@ from __future__ import annotations
 
 ##############################################################################
 # Python imports.
-from collections.abc import Generator, Iterable
+from array import array
+from collections.abc import Generator, Iterable, Sequence
 from contextlib import contextmanager
-from functools import lru_cache
-from math import ceil
-from typing import Final
-
-##############################################################################
-# Rich imports.
-from rich.segment import Segment
-from rich.style import Style
+from fractions import Fraction
+from itertools import compress, repeat
+from math import ceil, floor, isqrt
+from sys import maxsize
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal, TypeAlias, cast
 
 ##############################################################################
 # Textual imports.
 from textual.color import Color
-from textual.geometry import Size
+from textual.geometry import Region
+from textual.message import Message
 from textual.scroll_view import ScrollView
 from textual.strip import Strip
+from textual.timer import Timer
 
 ##############################################################################
 # Typing extension imports.
 from typing_extensions import Self
 
-
 ##############################################################################
-class CanvasError(Exception):
-    """Type of errors raised by the [`Canvas`][textual_canvas.canvas.Canvas] widget."""
-
+# Local imports.
+from .animation import Animation, FrameCallback
+from .instruments import CanvasStats, Counters
+from .layers import BASE_LAYER, Composite, Layer
+from .pixels import (
+    NO_COLOR,
+    PALETTE_TYPE,
+    PIXEL_TYPE,
+    PixelBuffer,
+    end_of_corridor,
+    end_of_run,
+    pack_color,
+    unpack_color,
+)
+from .render import Renderer, join_runs
+from .segments import DEFAULT_CACHE_SIZE, PaletteSegmentCache, RenderMode, SegmentCache
+from .sprites import Sprite
+from .threads import DrawingQueue
+from .tiles import Pixels, TiledPixelBuffer
 
 ##############################################################################
-_CELL: Final[str] = "\u2584"
-"""The character to use to draw two pixels in one cell in the canvas."""
+# Type checking imports.
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
 
 ##############################################################################
-@lru_cache
-def _segment_of(top: Color, bottom: Color) -> Segment:
-    """Construct a segment to show the two colours in one cell.
+class CanvasError(Exception):
+    """Type of errors raised by the [`Canvas`][textual_canvas.canvas.Canvas] widget."""
 
-    Args:
-        top: The colour for the top pixel.
-        bottom: The colour for the bottom pixel.
 
-    Returns:
-        A `Segment` that will display the two pixels.
-    """
-    return Segment(_CELL, style=Style.from_color(bottom.rich_color, top.rich_color))
+##############################################################################
+_LineKey: TypeAlias = tuple[int, int, Color, Color]
+"""The type of the key that says if a cached display line is still valid.
+
+This is the horizontal scroll position, the visible width, the background
+colour and the canvas colour that were in effect when the line was rendered.
+"""
+
+Anchor: TypeAlias = Literal[
+    "top-left",
+    "top",
+    "top-right",
+    "left",
+    "center",
+    "right",
+    "bottom-left",
+    "bottom",
+    "bottom-right",
+]
+"""The type of the part of the canvas that stays in place when it is resized."""
+
+_ANCHORS: Final[dict[str, tuple[int, int]]] = {
+    "top-left": (0, 0),
+    "top": (1, 0),
+    "top-right": (2, 0),
+    "left": (0, 1),
+    "center": (1, 1),
+    "right": (2, 1),
+    "bottom-left": (0, 2),
+    "bottom": (1, 2),
+    "bottom-right": (2, 2),
+}
+"""How far across and down each anchor is, in halves of the canvas."""
 
 
 ##############################################################################
@@ -61,11 +104,42 @@ class Canvas(ScrollView, can_focus=True):
     The widget is designed such that there are two 'pixels' per character
     cell; one being the top half of the cell, the other being the bottom.
     While not exactly square, this will make it more square than using a
-    whole cell as a simple pixel.
+    whole cell as a simple pixel. Other render modes show more pixels in
+    each cell, with fewer colours per pixel.
 
     The origin of the canvas is the top left corner.
     """
 
+    SEGMENT_CACHE_SIZE: ClassVar[int] = DEFAULT_CACHE_SIZE
+    """The maximum number of segments held in the canvas' segment cache."""
+
+    MAX_PALETTE_SIZE: Final[int] = 255
+    """The maximum number of colours in the palette of a palette canvas."""
+
+    class Stats(Message):
+        """Posted at intervals with the statistics of an instrumented canvas.
+
+        See [`Canvas.instrument`][textual_canvas.canvas.Canvas.instrument].
+        """
+
+        def __init__(self, canvas: Canvas, stats: CanvasStats) -> None:
+            """Initialise the message.
+
+            Args:
+                canvas: The canvas the statistics are for.
+                stats: The statistics of the canvas.
+            """
+            super().__init__()
+            self.canvas = canvas
+            """The canvas the statistics are for."""
+            self.stats = stats
+            """The statistics of the canvas."""
+
+        @property
+        def control(self) -> Canvas:
+            """The canvas the statistics are for."""
+            return self.canvas
+
     def __init__(
         self,
         width: int,
@@ -76,6 +150,9 @@ class Canvas(ScrollView, can_focus=True):
         id: str | None = None,
         classes: str | None = None,
         disabled: bool = False,
+        palette: Sequence[Color] | None = None,
+        tile_size: int | None = None,
+        render_mode: RenderMode = "half",
     ):
         """Initialise the canvas.
 
@@ -88,13 +165,47 @@ class Canvas(ScrollView, can_focus=True):
             id: The ID of the canvas widget in the DOM.
             classes: The CSS classes of the canvas widget.
             disabled: Whether the canvas widget is disabled or not.
+            palette: An optional palette of colours for the canvas.
+            tile_size: An optional tile size for sparse storage of the pixels.
+            render_mode: How the pixels are shown in the cells of the canvas.
+
+        Raises:
+            CanvasError: If the render mode isn't one that is known.
 
         If `canvas_color` is omitted, the widget's `background` styling will
         be used.
 
         If `pen_color` is omitted, the widget's `color` styling will be used.
+
+        If a `palette` is given the canvas is a palette canvas: each pixel
+        is held as a one byte index into the palette, only colours in the
+        palette can be drawn with, and the palette can be changed with
+        [`set_palette`][textual_canvas.canvas.Canvas.set_palette] to recolour
+        the whole canvas without touching the pixels.
+
+        If a `tile_size` is given the canvas is a tiled canvas: its pixels
+        are held in square tiles of that many pixels across, and each tile
+        is only allocated when something is first drawn in it. This allows
+        for canvases far larger than could otherwise be held in memory, as
+        the memory used grows with the area drawn on rather than with the
+        size of the canvas. The pixels of a tiled canvas can't be used as a
+        NumPy array with
+        [`pixel_array`][textual_canvas.canvas.Canvas.pixel_array].
+
+        See [`set_render_mode`][textual_canvas.canvas.Canvas.set_render_mode]
+        for the render modes.
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        try:
+            self._renderer = Renderer(
+                Color(0, 0, 0),
+                palette=None if palette is None else (),
+                render_mode=render_mode,
+                cache_size=self.SEGMENT_CACHE_SIZE,
+            )
+            """The renderer that turns the pixels into lines of the display."""
+        except ValueError as error:
+            raise CanvasError(str(error)) from None
         self._width = width
         """The widget of the canvas."""
         self._height = height
@@ -103,18 +214,281 @@ class Canvas(ScrollView, can_focus=True):
         """The background colour of the canvas itself."""
         self._pen_colour = pen_color
         """The default pen colour, used when drawing pixels."""
-        self._canvas: list[list[Color | None]] = []
-        """The canvas itself."""
+        self._palette: tuple[Color, ...] | None = None
+        """The palette of the canvas, if it is a palette canvas."""
+        self._palette_indexes: dict[int, int] = {}
+        """The palette index for each packed colour in the palette."""
+        self._tile_size = tile_size
+        """The size of the tiles of a tiled canvas, if it is a tiled canvas."""
+        self._canvas = self._new_pixels(PIXEL_TYPE if palette is None else PALETTE_TYPE)
+        """The pixels of the layer that is being drawn on."""
+        self._layer = Layer(BASE_LAYER, self._canvas)
+        """The layer that is being drawn on."""
+        self._layers = {BASE_LAYER: self._layer}
+        """The layers of the canvas, from the bottom up."""
+        self._composite: Composite | None = None
+        """The composite of the layers, if there is more than one layer."""
         self._refreshing = True
         """The current default refresh state."""
+        self._dirty_left = self._dirty_top = maxsize
+        """The top left corner of the pixels waiting to be refreshed."""
+        self._dirty_right = self._dirty_bottom = 0
+        """The bottom right corner, exclusive, of the pixels waiting to be refreshed."""
+        self._dirty_boxes: list[tuple[int, int, int, int]] = []
+        """Boxes of pixels set aside to be refreshed apart from the rest.
+
+        Each is the left, top, right and bottom of the box; the right and
+        bottom are exclusive.
+        """
+        self._refresh_pending = False
+        """Is a refresh of the dirty region waiting to happen?"""
+        self._line_cache: dict[int, tuple[_LineKey, Strip]] = {}
+        """Cache of rendered display lines, keyed by the line within the canvas."""
+        self._segments = self._renderer.segments
+        """Cache of segments used to render the cells."""
+        self._sprites: list[Sprite] = []
+        """The sprites on the canvas, from the bottom up."""
+        self._stale_sprites: int | None = None
+        """The lowest sprite that is waiting to be redrawn, if there is one."""
+        self._counters: Counters | None = None
+        """The counts of the work done by the canvas, if it is instrumented."""
+        self._stats_timer: Timer | None = None
+        """The timer that posts the statistics of the canvas, if there is one."""
+        if palette is not None:
+            self._use_palette(palette)
         self.clear()
 
+    def _new_pixels(self, typecode: str) -> Pixels:
+        """Make a buffer to hold the pixels of a layer of the canvas.
+
+        Args:
+            typecode: The [`array`][array] type code for the pixel values.
+
+        Returns:
+            A buffer the size of the canvas, tiled if this is a tiled canvas.
+        """
+        if self._tile_size is None:
+            return PixelBuffer(self._width, self._height, typecode=typecode)
+        return TiledPixelBuffer(
+            self._width, self._height, typecode=typecode, tile_size=self._tile_size
+        )
+
+    def _use_palette(self, palette: Sequence[Color]) -> None:
+        """Start using a palette.
+
+        Args:
+            palette: The colours of the palette.
+
+        Raises:
+            CanvasError: If the palette has too many colours.
+        """
+        if len(palette) > self.MAX_PALETTE_SIZE:
+            raise CanvasError(
+                f"A palette can have at most {self.MAX_PALETTE_SIZE} colours"
+            )
+        self._palette = tuple(palette)
+        self._palette_indexes = {
+            pack_color(colour): index
+            for index, colour in reversed(list(enumerate(palette, start=1)))
+        }
+        if isinstance(self._segments, PaletteSegmentCache):
+            self._segments.palette = palette
+
     @property
-    def _blank_canvas(self) -> list[list[Color | None]]:
-        """A blank canvas."""
-        return [
-            [self._canvas_colour for _ in range(self.width)] for _ in range(self.height)
-        ]
+    def palette(self) -> tuple[Color, ...] | None:
+        """The palette of the canvas, or [`None`][None] if it isn't a palette canvas."""
+        return self._palette
+
+    def set_palette(self, palette: Sequence[Color]) -> Self:
+        """Change the palette of a palette canvas.
+
+        Args:
+            palette: The new colours of the palette.
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If the canvas isn't a palette canvas, or if the
+                palette has too many colours.
+
+        The pixels of the canvas are left untouched, so every pixel drawn
+        with the colour at a given position in the old palette will be shown
+        in the colour at that position in the new palette.
+        """
+        if self._palette is None:
+            raise CanvasError("The canvas was not created with a palette")
+        self._use_palette(palette)
+        self._line_cache.clear()
+        return self._refresh_all()
+
+    @property
+    def render_mode(self) -> RenderMode:
+        """How the pixels are shown in the cells of the canvas."""
+        return self._renderer.render_mode
+
+    def set_render_mode(self, mode: RenderMode) -> Self:
+        """Change how the pixels are shown in the cells of the canvas.
+
+        Args:
+            mode: The new render mode.
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If the render mode isn't one that is known.
+
+        The render modes are:
+
+        - `"half"`: Each cell shows two pixels, one above the other, each in
+          its own colour. This is the default.
+        - `"quadrant"`: Each cell shows two pixels across by two down, using
+          the quadrant block characters. A cell can only show two colours:
+          the background is the most common pixel value in the cell and the
+          foreground is the most common of the rest, with ties going to
+          whichever pixel comes first in reading order; any pixel that isn't
+          the background value is drawn in the foreground colour.
+        - `"braille"`: Each cell shows two pixels across by four down, using
+          the braille characters. Every pixel that has a colour is a dot,
+          and all the dots of a cell are drawn in the most common colour of
+          those dots, with ties going to whichever dot comes first in reading
+          order; the rest of the cell is the canvas colour.
+
+        Drawing is always done in pixels, whatever the render mode; only how
+        the pixels are shown, and so how much of the canvas fits in the
+        widget, changes.
+        """
+        try:
+            self._renderer.render_mode = mode
+        except ValueError as error:
+            raise CanvasError(str(error)) from None
+        self._size_to_cells()
+        self._forget_dirty()
+        self._line_cache.clear()
+        return self._refresh_all()
+
+    def _size_to_cells(self) -> None:
+        """Set the virtual size of the widget to the cells the canvas needs."""
+        self.virtual_size = self._renderer.size_of(self._width, self._height)
+
+    def _value_of(self, color: Color) -> int:
+        """Get the value to hold in the canvas for a colour.
+
+        Args:
+            color: The colour.
+
+        Returns:
+            The packed colour, or the palette index if this is a palette canvas.
+
+        Raises:
+            CanvasError: If this is a palette canvas and the colour isn't in
+                the palette.
+        """
+        if self._palette is None:
+            return pack_color(color)
+        try:
+            return self._palette_indexes[pack_color(color)]
+        except KeyError:
+            raise CanvasError(f"{color} is not in the palette") from None
+
+    def _colour_of(self, value: int) -> Color | None:
+        """Get the colour for a value held in the canvas.
+
+        Args:
+            value: The value held in the canvas.
+
+        Returns:
+            The colour, or [`None`][None] if the value is for no colour.
+        """
+        if (palette := self._palette) is None:
+            return unpack_color(value)
+        return palette[value - 1] if 0 < value <= len(palette) else None
+
+    @property
+    def segment_cache(self) -> SegmentCache:
+        """The cache of segments used to render pairs of pixels.
+
+        This can be used to check how well the cache is working, to change
+        its size, or to warm it with a palette of colours.
+
+        Example:
+            ```python
+            canvas.segment_cache.maxsize = 1024
+            canvas.segment_cache.warm(PALETTE)
+            ...
+            print(canvas.segment_cache.stats.hit_rate)
+            ```
+        """
+        return self._segments
+
+    def instrument(self, enabled: bool = True, interval: float | None = None) -> Self:
+        """Turn the counting of the work done by the canvas on or off.
+
+        Args:
+            enabled: Should the work done by the canvas be counted?
+            interval: How often, in seconds, to post a
+                [`Stats`][textual_canvas.canvas.Canvas.Stats] message with
+                the statistics of the canvas; by default none are posted.
+
+        Returns:
+            The canvas.
+
+        Instrumentation is off by default, and costs next to nothing while
+        it is off. While it is on, the canvas counts the pixels written and
+        the calls made to each drawing method, the refreshes that drawing
+        asks for and those put off, and the lines of the display rendered
+        and the time taken to render them. The counts start afresh each time
+        instrumentation is turned on; they can be read at any time with
+        [`stats`][textual_canvas.canvas.Canvas.stats].
+
+        Messages can only be posted once the canvas is mounted.
+
+        Example:
+            ```python
+            canvas.instrument(interval=1)
+            ...
+            def on_canvas_stats(self, event: Canvas.Stats) -> None:
+                self.log(event.stats)
+            ```
+        """
+        if self._stats_timer is not None:
+            self._stats_timer.stop()
+            self._stats_timer = None
+        self._counters = Counters(self._segments) if enabled else None
+        if enabled and interval is not None:
+            self._stats_timer = self.set_interval(interval, self._post_stats)
+        return self
+
+    @property
+    def instrumented(self) -> bool:
+        """Is the work done by the canvas being counted?"""
+        return self._counters is not None
+
+    @property
+    def stats(self) -> CanvasStats | None:
+        """A snapshot of the work done by the canvas.
+
+        This is [`None`][None] if the canvas isn't instrumented.
+        """
+        if self._counters is None:
+            return None
+        return self._counters.snapshot(self._segments)
+
+    def reset_stats(self) -> Self:
+        """Start counting the work done by an instrumented canvas afresh.
+
+        Returns:
+            The canvas.
+        """
+        if self._counters is not None:
+            self._counters = Counters(self._segments)
+        return self
+
+    def _post_stats(self) -> None:
+        """Post the statistics of the canvas."""
+        if (stats := self.stats) is not None:
+            self.post_message(self.Stats(self, stats))
 
     @property
     def width(self) -> int:
@@ -127,7 +501,7 @@ class Canvas(ScrollView, can_focus=True):
         return self._height
 
     def notify_style_update(self) -> None:
-        self.refresh()
+        self._refresh_all()
         return super().notify_style_update()
 
     @contextmanager
@@ -141,7 +515,9 @@ class Canvas(ScrollView, can_focus=True):
         between each one would be inefficient given you've not finished
         drawing yet.
 
-        Use this context manager to batch up your drawing operations.
+        Use this context manager to batch up your drawing operations. When
+        the batch ends only the part of the display that shows the pixels
+        that were drawn will be refreshed.
 
         Example:
             ```python
@@ -164,7 +540,224 @@ class Canvas(ScrollView, can_focus=True):
             yield
         finally:
             self._refreshing = refreshing
-            self.refresh()
+            if refreshing:
+                self._refresh_dirty()
+
+    def start_animation(self, callback: FrameCallback, fps: float = 30) -> Animation:
+        """Start animating the canvas at a target frame rate.
+
+        Args:
+            callback: The callback that draws each frame.
+            fps: The target frame rate.
+
+        Returns:
+            The animation, which can be used to stop it or to get its
+                statistics.
+
+        Raises:
+            CanvasError: If the frame rate isn't positive.
+
+        The callback is called with the time, in seconds, since the
+        animation started. Each frame is drawn within
+        [`batch_refresh`][textual_canvas.canvas.Canvas.batch_refresh], so
+        the canvas is refreshed once per frame however much is drawn. If
+        drawing a frame takes longer than the time between frames, the
+        frames that should have been drawn in the meantime are dropped.
+
+        Example:
+            ```python
+            def draw(elapsed: float) -> None:
+                canvas.clear_layer().fill_circle(int(elapsed * 10) % 80, 20, 5, RED)
+
+            animation = canvas.start_animation(draw, fps=60)
+            ...
+            print(animation.stats.fps)
+            animation.stop()
+            ```
+        """
+        try:
+            animation = Animation(callback, fps, self.batch_refresh)
+        except ValueError as error:
+            raise CanvasError(str(error)) from error
+        animation.start(self.set_interval)
+        return animation
+
+    def queue_drawing(
+        self, fps: float = 30, budget: float | None = None
+    ) -> DrawingQueue:
+        """Start a queue of drawing that can be added to from other threads.
+
+        Args:
+            fps: The target frame rate to draw the queue at.
+            budget: The time, in seconds, to spend drawing each frame;
+                defaults to half of the time between frames.
+
+        Returns:
+            The drawing queue.
+
+        Raises:
+            CanvasError: If the frame rate or the budget isn't positive.
+
+        The canvas must only be drawn on from the application's thread, so
+        CPU-heavy drawing done in a [thread
+        worker](https://textual.textualize.io/guide/workers/#thread-workers)
+        should be queued with the
+        [`DrawingQueue`][textual_canvas.threads.DrawingQueue] instead. The
+        queue is drawn at each frame, as a batch, until it is closed and
+        everything queued has been drawn.
+
+        Example:
+            ```python
+            @work(thread=True)
+            def draw(self, queue: DrawingQueue) -> None:
+                with queue:
+                    for y in range(height):
+                        queue.set_row(y, [colour_of(x, y) for x in range(width)])
+            ...
+            self.draw(self.query_one(Canvas).queue_drawing())
+            ```
+        """
+        if budget is not None and budget <= 0:
+            raise CanvasError(f"The drawing budget must be positive, not {budget}")
+        queue = DrawingQueue(self, budget)
+        queue.start(self.start_animation(queue.frame, fps))
+        return queue
+
+    def _mark_dirty(self, region: Region, layer: Layer | None = None) -> None:
+        """Mark a region of the canvas as needing a refresh.
+
+        Args:
+            region: The region of the canvas, in pixels, that has changed.
+            layer: The layer that changed; defaults to the layer being drawn on.
+
+        If no layer is given and a frame is being drawn, nothing is marked;
+        the frame isn't seen until it is presented. Nor is anything marked
+        if the canvas is unmounted and has nothing rendered that would need
+        rendering again. Otherwise this only grows the bounds of what is
+        waiting to be refreshed; they're turned into the cells to refresh
+        when the refresh happens.
+        """
+        if layer is None:
+            if self._in_frame:
+                return
+            layer = self._layer
+        if not (self._line_cache or self._composite is not None or self.is_mounted):
+            # Nothing has been rendered, and there's nothing to refresh.
+            return
+        left, top, width, height = region
+        right, bottom = left + width, top + height
+        if left < self._dirty_left:
+            self._dirty_left = left
+        if top < self._dirty_top:
+            self._dirty_top = top
+        if right > self._dirty_right:
+            self._dirty_right = right
+        if bottom > self._dirty_bottom:
+            self._dirty_bottom = bottom
+        if self._composite is not None:
+            layer.dirty.update(range(top, bottom))
+        if line_cache := self._line_cache:
+            _, down = self._renderer.cell_size
+            for line in range(top // down, ((bottom - 1) // down) + 1):
+                line_cache.pop(line, None)
+
+    def _set_dirty_aside(self) -> None:
+        """Set what is waiting to be refreshed aside, to be refreshed alone.
+
+        Whatever is marked dirty after this grows new bounds, rather than
+        the bounds that were set aside, so that the pixels in between the
+        two don't have to be refreshed too.
+        """
+        if self._dirty_left < self._dirty_right:
+            self._dirty_boxes.append(
+                (
+                    self._dirty_left,
+                    self._dirty_top,
+                    self._dirty_right,
+                    self._dirty_bottom,
+                )
+            )
+            self._dirty_left = self._dirty_top = maxsize
+            self._dirty_right = self._dirty_bottom = 0
+
+    def _forget_dirty(self) -> None:
+        """Forget what is waiting to be refreshed."""
+        self._dirty_left = self._dirty_top = maxsize
+        self._dirty_right = self._dirty_bottom = 0
+        self._dirty_boxes.clear()
+
+    def _refresh_if(self, refresh: bool | None) -> None:
+        """Refresh the dirty region, if a refresh is wanted.
+
+        Args:
+            refresh: Should the widget be refreshed? If [`None`][None] the
+                widget is refreshed unless a batch of drawing is underway.
+        """
+        if self._refreshing if refresh is None else refresh:
+            self._refresh_dirty()
+        elif self._counters is not None:
+            self._counters.suppressed_refreshes += 1
+
+    def _refresh_dirty(self) -> Self:
+        """Refresh the part of the display that covers the dirty region.
+
+        Returns:
+            The canvas.
+
+        Only the character cells that show pixels that have changed since
+        the last refresh will be refreshed; if none of them are within view,
+        or the canvas isn't mounted, then no refresh happens at all. The
+        dirty region is turned into the cells to refresh once, after the
+        current message has been handled, however many times the canvas
+        asks for a refresh before then.
+        """
+        if self._stale_sprites is not None:
+            self._draw_sprites()
+        if self._dirty_right <= self._dirty_left and not self._dirty_boxes:
+            return self
+        if not self.is_mounted:
+            self._forget_dirty()
+            self._refresh_pending = False
+        elif not self._refresh_pending:
+            self._refresh_pending = True
+            self.call_next(self._refresh_cells)
+        return self
+
+    def _refresh_cells(self) -> None:
+        """Refresh the character cells that show the dirty region."""
+        self._refresh_pending = False
+        self._set_dirty_aside()
+        boxes = self._dirty_boxes
+        self._dirty_boxes = []
+        scroll_x, scroll_y = self.scroll_offset
+        across, down = self._renderer.cell_size
+        view = self.size.region
+        regions: list[Region] = []
+        for left, top, right, bottom in boxes:
+            left //= across
+            top //= down
+            if region := Region(
+                left - scroll_x,
+                top - scroll_y,
+                ((right - 1) // across) - left + 1,
+                ((bottom - 1) // down) - top + 1,
+            ).intersection(view):
+                regions.append(region)
+        if not regions:
+            return
+        if self._counters is not None:
+            self._counters.refreshes += 1
+        self.refresh(*regions)
+
+    def _refresh_all(self) -> Self:
+        """Refresh the whole of the display.
+
+        Returns:
+            The canvas.
+        """
+        if self._counters is not None:
+            self._counters.refreshes += 1
+        return self.refresh()
 
     def _outwith_the_canvas(self, x: int, y: int) -> bool:
         """Is the location outwith the canvas?
@@ -207,6 +800,9 @@ class Canvas(ScrollView, can_focus=True):
         Returns:
             The canvas.
 
+        Raises:
+            CanvasError: If a frame is being drawn.
+
         If the color isn't provided, then the color used when first making
         the canvas is used, this in turn becomes the new default color (and
         will then be used for subsequent clears, unless another color is
@@ -217,138 +813,1284 @@ class Canvas(ScrollView, can_focus=True):
 
         If `width` or `height` are omitted then the current value for those
         dimensions will be used.
+
+        The canvas can't be cleared while a frame is being drawn; use
+        [`clear_layer`][textual_canvas.canvas.Canvas.clear_layer] to clear
+        the frame itself.
         """
+        if self._in_frame:
+            raise CanvasError(
+                "The canvas can't be cleared while a frame is being drawn"
+            )
+        if self._counters is not None:
+            self._counters.calls["clear"] += 1
         self._width = self._width if width is None else width
         self._height = self._height if height is None else height
-        self.virtual_size = Size(self._width, ceil(self._height / 2))
+        self._size_to_cells()
         self._canvas_colour = color or self._canvas_colour
-        self._canvas = self._blank_canvas
-        return self.refresh()
-
-    def set_pen(self, color: Color | None) -> Self:
-        """Set the default pen colour.
+        for layer in self._layers.values():
+            if (
+                layer.pixels.width == self._width
+                and layer.pixels.height == self._height
+            ):
+                layer.pixels.fill()
+            else:
+                layer.pixels = self._new_pixels(layer.pixels.typecode)
+        self._canvas = self._layer.pixels
+        if self._composite is not None:
+            self._composite = Composite(self._layers.values())
+        self._forget_sprites()
+        self._draw_sprites()
+        self._forget_dirty()
+        self._line_cache.clear()
+        return self._refresh_all()
+
+    def resize(
+        self,
+        width: int,
+        height: int,
+        anchor: Anchor = "top-left",
+        refresh: bool | None = None,
+    ) -> Self:
+        """Change the size of the canvas, keeping what is drawn on it.
 
         Args:
-            color: A colour to use by default when drawing a pixel.
+            width: The new width of the canvas.
+            height: The new height of the canvas.
+            anchor: The part of the canvas that stays in place.
+            refresh: Should the widget be refreshed?
 
         Returns:
             The canvas.
 
-        Note:
-            Setting the colour to [`None`][None] specifies that the widget's
-            currently-styled [`color`](https://textual.textualize.io/guide/styles/#styles-object)
-            should be used.
+        Raises:
+            CanvasError: If the anchor isn't one that is known.
+
+        The anchor says where the pixels of the canvas end up within the
+        new size; for example, with an anchor of `"center"` whatever was in
+        the middle of the canvas stays in the middle. Pixels that end up
+        outwith the new size are lost, and the new area of the canvas has no
+        colour. Sprites move along with the pixels.
+
+        Unlike [`clear`][textual_canvas.canvas.Canvas.clear], which makes
+        the canvas afresh, the pixels are kept where they are when only the
+        height of the canvas changes and it is anchored to the top, or
+        moved a row at a time otherwise; on a tiled canvas the tiles are
+        moved instead, and no tiles are allocated for the new area. Any
+        frame that is being drawn is thrown away.
         """
-        self._pen_colour = color
+        try:
+            across, down = _ANCHORS[anchor]
+        except KeyError:
+            raise CanvasError(f"{anchor!r} is not a known anchor") from None
+        x = ((width - self._width) * across) // 2
+        y = ((height - self._height) * down) // 2
+        # The sprites come off before the pixels move, and go back on once
+        # they have moved, so that what is under them moves too.
+        for sprite in reversed(self._sprites):
+            sprite.undraw()
+        for layer in self._layers.values():
+            layer.pixels.resize(width, height, x, y)
+            layer.back = None
+        self._canvas = self._layer.pixels
+        for sprite in self._sprites:
+            sprite.x += x
+            sprite.y += y
+        self._forget_sprites()
+        self._width, self._height = width, height
+        self._size_to_cells()
+        if self._composite is not None:
+            self._composite = Composite(self._layers.values())
+        self._forget_dirty()
+        self._line_cache.clear()
+        self._mark_dirty(Region(0, 0, width, height), self._layer)
+        self._refresh_if(refresh)
         return self
 
-    def set_pixels(
-        self,
-        locations: Iterable[tuple[int, int]],
-        color: Color | None = None,
-        refresh: bool | None = None,
-    ) -> Self:
-        """Set the colour of a collection of pixels on the canvas.
+    @property
+    def layers(self) -> tuple[str, ...]:
+        """The names of the layers of the canvas, from the bottom up."""
+        return tuple(self._layers)
+
+    @property
+    def layer(self) -> str:
+        """The name of the layer that is being drawn on."""
+        return self._layer.name
+
+    def _layer_named(self, name: str) -> Layer:
+        """Get a layer by name.
 
         Args:
-            locations: An iterable of tuples of x and y location.
-            color: The color to set the pixel to.
-            refresh: Should the widget be refreshed?
+            name: The name of the layer.
 
         Returns:
-            The canvas.
+            The layer.
 
         Raises:
-            CanvasError: If any pixel location is not within the canvas.
-
-        Note:
-            The origin of the canvas is the top left corner.
+            CanvasError: If there is no layer with that name.
         """
-        color = color or self._pen_colour or self.styles.color
-        _pixel_check = self._pixel_check
-        _canvas = self._canvas
-        for x, y in locations:
-            _pixel_check(x, y)
-            _canvas[y][x] = color
-        if self._refreshing if refresh is None else refresh:
-            self.refresh()
-        return self
+        try:
+            return self._layers[name]
+        except KeyError:
+            raise CanvasError(f"There is no layer called {name!r}") from None
 
-    def clear_pixels(
-        self, locations: Iterable[tuple[int, int]], refresh: bool | None = None
-    ) -> Self:
-        """Clear the colour of a collection of pixels on the canvas.
+    def add_layer(self, name: str) -> Self:
+        """Add a layer on top of the other layers of the canvas.
 
         Args:
-            locations: An iterable of tuples of x and y location.
-            refresh: Should the widget be refreshed?
+            name: The name of the new layer.
 
         Returns:
             The canvas.
 
         Raises:
-            CanvasError: If any pixel location is not within the canvas.
+            CanvasError: If there is already a layer with that name.
 
-        Note:
-            The origin of the canvas is the top left corner.
+        Every pixel of a new layer has no colour, which means it is
+        transparent and the layers below it show through. Use
+        [`use_layer`][textual_canvas.canvas.Canvas.use_layer] to draw on
+        the new layer.
         """
-        return self.set_pixels(locations, self._canvas_colour, refresh)
+        if name in self._layers:
+            raise CanvasError(f"There is already a layer called {name!r}")
+        self._layers[name] = Layer(name, self._canvas.empty())
+        self._composite = Composite(self._layers.values())
+        return self
 
-    def set_pixel(
-        self, x: int, y: int, color: Color | None = None, refresh: bool | None = None
-    ) -> Self:
-        """Set the colour of a specific pixel on the canvas.
+    def remove_layer(self, name: str, refresh: bool | None = None) -> Self:
+        """Remove a layer from the canvas.
 
         Args:
-            x: The horizontal location of the pixel.
-            y: The vertical location of the pixel.
-            color: The color to set the pixel to.
+            name: The name of the layer to remove.
             refresh: Should the widget be refreshed?
 
+        Returns:
+            The canvas.
+
         Raises:
-            CanvasError: If the pixel location is not within the canvas.
+            CanvasError: If there is no layer with that name, or if it is
+                the base layer.
 
-        Note:
-            The origin of the canvas is the top left corner.
+        Any sprites on the layer are removed with it. If the layer was
+        being drawn on, drawing goes back to the base layer, and any frame
+        that was being drawn on the layer is thrown away.
         """
-        return self.set_pixels(
-            ((x, y),), self._pen_colour if color is None else color, refresh
+        if name == BASE_LAYER:
+            raise CanvasError("The base layer can't be removed")
+        layer = self._layer_named(name)
+        del self._layers[name]
+        if any(sprite.layer is layer for sprite in self._sprites):
+            self._sprites = [
+                sprite for sprite in self._sprites if sprite.layer is not layer
+            ]
+            if self._stale_sprites is not None:
+                self._stale_sprites = 0
+        if self._layer is layer:
+            self._layer = self._layers[BASE_LAYER]
+            self._canvas = self._layer.pixels
+        self._composite = (
+            Composite(self._layers.values()) if len(self._layers) > 1 else None
         )
+        self._mark_dirty(Region(0, 0, self._width, self._height), self._layer)
+        self._refresh_if(refresh)
+        return self
 
-    def clear_pixel(self, x: int, y: int, refresh: bool | None = None) -> Self:
-        """Clear the colour of a specific pixel on the canvas.
+    def use_layer(self, name: str) -> Self:
+        """Use a layer for all further drawing.
 
         Args:
-            x: The horizontal location of the pixel.
-            y: The vertical location of the pixel.
-            refresh: Should the widget be refreshed?
+            name: The name of the layer to draw on.
 
-        Raises:
-            CanvasError: If the pixel location is not within the canvas.
+        Returns:
+            The canvas.
 
-        Note:
-            The origin of the canvas is the top left corner.
+        Raises:
+            CanvasError: If there is no layer with that name, or if a frame
+                is being drawn.
+
+        All of the drawing methods, along with
+        [`pixel_array`][textual_canvas.canvas.Canvas.pixel_array],
+        [`set_array`][textual_canvas.canvas.Canvas.set_array] and
+        [`get_region`][textual_canvas.canvas.Canvas.get_region], work on the
+        layer being drawn on;
+        [`get_pixel`][textual_canvas.canvas.Canvas.get_pixel] gives the
+        colour that is seen once all the layers are combined.
         """
-        return self.clear_pixels(((x, y),), refresh)
+        if self._in_frame:
+            raise CanvasError("The layer can't be changed while a frame is being drawn")
+        self._layer = self._layer_named(name)
+        self._canvas = self._layer.pixels
+        return self
 
-    def get_pixel(self, x: int, y: int) -> Color:
-        """Get the pixel at the given location.
+    def clear_layer(self, name: str | None = None, refresh: bool | None = None) -> Self:
+        """Clear a layer of the canvas.
 
         Args:
-            x: The horizontal location of the pixel.
-            y: The vertical location of the pixel.
+            name: The name of the layer to clear; defaults to the layer
+                being drawn on.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If there is no layer with that name.
+
+        Every pixel of the layer is set to have no colour; for any layer
+        other than the base layer this makes the whole layer transparent.
+        The other layers are left untouched. If a frame is being drawn on
+        the layer, it is the frame that is cleared.
+        """
+        layer = self._layer if name is None else self._layer_named(name)
+        if layer is self._layer and self._in_frame:
+            self._canvas.fill()
+            return self
+        layer.pixels.fill()
+        self._forget_sprites(layer)
+        self._mark_dirty(Region(0, 0, self._width, self._height), layer)
+        self._refresh_if(refresh)
+        return self
+
+    def _visible_row(self, y: int, start: int, end: int) -> array[int]:
+        """Get the values of part of a row of the pixels as they are seen.
+
+        Args:
+            y: The row to get.
+            start: The first column to get.
+            end: The column to stop at.
+
+        Returns:
+            The values of the pixels, once all the layers are combined.
+        """
+        if self._composite is None:
+            return self._layer.pixels.row(y, start, end)
+        return self._composite.row(y, start, end)
+
+    @property
+    def _in_frame(self) -> bool:
+        """Is a frame being drawn?"""
+        return self._canvas is not self._layer.pixels
+
+    def start_frame(self, clear: bool = False) -> Self:
+        """Start drawing a frame in the back buffer of the current layer.
+
+        Args:
+            clear: Should the frame start out clear, rather than as a copy
+                of what is on the layer?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If a frame is already being drawn.
+
+        Until the frame is
+        [presented][textual_canvas.canvas.Canvas.present], all drawing
+        goes to the back buffer and the layer is seen as it was when the
+        frame started. Nothing is refreshed while the frame is drawn.
+
+        Sprites stay on the layer itself; they aren't part of the frame and
+        are drawn on top of it when it is presented.
+        """
+        if self._in_frame:
+            raise CanvasError("A frame is already being drawn")
+        layer = self._layer
+        front = layer.pixels
+        back = layer.back
+        if back is None or (back.width, back.height) != (front.width, front.height):
+            back = front.empty()
+        if clear:
+            back.fill()
+        else:
+            back.copy_from(front)
+            for sprite in reversed(self._sprites):
+                if sprite.layer is layer:
+                    sprite.uncover(back)
+        self._canvas = back
+        return self
+
+    def present(self, refresh: bool | None = None) -> Self:
+        """Show the frame that is being drawn.
+
+        Args:
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If no frame is being drawn.
+
+        The back buffer and the pixels of the layer are swapped, so
+        presenting a frame doesn't copy it. The new pixels are then compared
+        with the old, row by row, and only the rows that differ are
+        refreshed; each run of rows that differ is refreshed as a region of
+        its own. Drawing then goes back to the layer itself.
+        """
+        if not self._in_frame:
+            raise CanvasError("No frame is being drawn")
+        layer = self._layer
+        layer.pixels, layer.back = self._canvas, layer.pixels
+        for top, bottom in layer.pixels.changed_rows(layer.back):
+            self._mark_dirty(Region(0, top, self._width, bottom - top), layer)
+            self._set_dirty_aside()
+        self._forget_sprites(layer)
+        self._refresh_if(refresh)
+        return self
+
+    @contextmanager
+    def frame(self, clear: bool = False) -> Generator[None, None, None]:
+        """A context manager that draws a frame and presents it at the end.
+
+        Args:
+            clear: Should the frame start out clear, rather than as a copy
+                of what is on the layer?
+
+        Example:
+            ```python
+            canvas = self.query_one(Canvas)
+            with canvas.frame(clear=True):
+                canvas.fill_circle(x, y, 10, Color(255, 0, 0))
+                canvas.fill_circle(x + 20, y, 10, Color(0, 255, 0))
+            ```
+
+        See [`start_frame`][textual_canvas.canvas.Canvas.start_frame] and
+        [`present`][textual_canvas.canvas.Canvas.present] for the details.
+        If an exception is raised while the frame is drawn, the frame is
+        thrown away.
+        """
+        self.start_frame(clear)
+        try:
+            yield
+        except BaseException:
+            self._canvas = self._layer.pixels
+            raise
+        self.present()
+
+    def set_pen(self, color: Color | None) -> Self:
+        """Set the default pen colour.
+
+        Args:
+            color: A colour to use by default when drawing a pixel.
+
+        Returns:
+            The canvas.
+
+        Note:
+            Setting the colour to [`None`][None] specifies that the widget's
+            currently-styled [`color`](https://textual.textualize.io/guide/styles/#styles-object)
+            should be used.
+        """
+        self._pen_colour = color
+        return self
+
+    def set_pixels(
+        self,
+        locations: Iterable[tuple[int, int]],
+        color: Color | None = None,
+        refresh: bool | None = None,
+    ) -> Self:
+        """Set the colour of a collection of pixels on the canvas.
+
+        Args:
+            locations: An iterable of tuples of x and y location.
+            color: The color to set the pixel to.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If any pixel location is not within the canvas.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["set_pixels"] += 1
+        return self._set_pixels(locations, color, refresh)
+
+    def _set_pixels(
+        self,
+        locations: Iterable[tuple[int, int]],
+        color: Color | None,
+        refresh: bool | None,
+    ) -> Self:
+        """Set the colour of a collection of pixels, without counting the call.
+
+        Args:
+            locations: An iterable of tuples of x and y location.
+            color: The color to set the pixel to.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If any pixel location is not within the canvas.
+
+        This is what the drawing methods that are built on setting pixels
+        use, so that only the method that was called is counted.
+        """
+        return self._plot(
+            locations,
+            repeat(self._value_of(color or self._pen_colour or self.styles.color)),
+            refresh,
+        )
+
+    def _plot(
+        self,
+        locations: Iterable[tuple[int, int]],
+        values: Iterable[int],
+        refresh: bool | None,
+    ) -> Self:
+        """Set a collection of pixels on the canvas to packed values.
+
+        Args:
+            locations: An iterable of tuples of x and y location.
+            values: The packed pixel values to set the pixels to.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If any pixel location is not within the canvas.
+        """
+        if self._counters is not None:
+            locations = list(locations)
+            self._counters.pixels += len(locations)
+        _pixel_check = self._pixel_check
+        canvas = self._canvas
+        data = canvas.data if isinstance(canvas, PixelBuffer) else None
+        put = canvas.put
+        width = self._width
+        left = top = maxsize
+        right = bottom = -1
+        try:
+            for (x, y), value in zip(locations, values, strict=False):
+                _pixel_check(x, y)
+                if data is None:
+                    put(x, y, value)
+                else:
+                    data[y * width + x] = value
+                if x < left:
+                    left = x
+                if x > right:
+                    right = x
+                if y < top:
+                    top = y
+                if y > bottom:
+                    bottom = y
+        finally:
+            if right >= 0:
+                self._mark_dirty(Region(left, top, right - left + 1, bottom - top + 1))
+        self._refresh_if(refresh)
+        return self
+
+    def set_points(
+        self,
+        xs: Sequence[int] | NDArray[np.integer],
+        ys: Sequence[int] | NDArray[np.integer],
+        color: Color | None = None,
+        colors: Sequence[Color] | NDArray[np.generic] | None = None,
+        clip: bool = False,
+        refresh: bool | None = None,
+    ) -> Self:
+        """Set the colour of many pixels, given as parallel sequences of locations.
+
+        Args:
+            xs: The horizontal locations of the pixels.
+            ys: The vertical locations of the pixels.
+            color: The colour to set all of the pixels to.
+            colors: The colour to set each of the pixels to.
+            clip: Should locations outwith the canvas be ignored?
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If the locations and colours don't match in length,
+                or if any pixel location is not within the canvas and `clip`
+                is `False`.
+
+        If `colors` is given it must have one colour per location, and
+        `color` is ignored. When NumPy is installed the locations can be
+        NumPy arrays, `colors` can be an array of
+        [packed pixel values][textual_canvas.pixels.pack_color] or an `(n, 3)`
+        or `(n, 4)` array of `uint8` colour components, and all of the
+        pixels are set in one vectorised operation. On a palette canvas an
+        array of colours must be an array of palette indexes. On a tiled
+        canvas the colours are packed in one go but the pixels are then set
+        one at a time. Nothing is drawn if an error is raised.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["set_points"] += 1
+        try:
+            from .arrays import pack_colors, palette_indexes, scatter
+        except ImportError:
+            # Without NumPy there can't be any arrays in what we were given.
+            return self._set_points(
+                cast("Sequence[int]", xs),
+                cast("Sequence[int]", ys),
+                color,
+                None
+                if colors is None
+                else [
+                    self._value_of(colour) for colour in cast("Sequence[Color]", colors)
+                ],
+                clip,
+                refresh,
+            )
+        try:
+            values = (
+                None
+                if colors is None
+                else pack_colors(colors)
+                if self._palette is None
+                else palette_indexes(colors, self._value_of)
+            )
+        except ValueError as error:
+            raise CanvasError(str(error)) from error
+        if not isinstance(self._canvas, PixelBuffer):
+            # A tiled canvas can't be scattered into in one go, so the
+            # points have to be set one at a time, from plain integers.
+            return self._set_points(
+                list(map(int, xs)),
+                list(map(int, ys)),
+                color,
+                None if values is None else values.tolist(),
+                clip,
+                refresh,
+            )
+        try:
+            changed = scatter(
+                self._canvas,
+                xs,
+                ys,
+                self._value_of(color or self._pen_colour or self.styles.color)
+                if values is None
+                else values,
+                clip,
+            )
+        except ValueError as error:
+            raise CanvasError(str(error)) from error
+        if changed is not None:
+            dirty, written = changed
+            self._mark_dirty(dirty)
+            if self._counters is not None:
+                self._counters.pixels += written
+        self._refresh_if(refresh)
+        return self
+
+    def _set_points(
+        self,
+        xs: Sequence[int],
+        ys: Sequence[int],
+        color: Color | None,
+        values: Sequence[int] | None,
+        clip: bool,
+        refresh: bool | None,
+    ) -> Self:
+        """Set the colour of many pixels, one pixel at a time.
+
+        Args:
+            xs: The horizontal locations of the pixels.
+            ys: The vertical locations of the pixels.
+            color: The colour to set all of the pixels to.
+            values: The pixel value to set each of the pixels to.
+            clip: Should locations outwith the canvas be ignored?
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If the locations and colours don't match in length,
+                or if any pixel location is not within the canvas and `clip`
+                is `False`.
+        """
+        if len(xs) != len(ys):
+            raise CanvasError(
+                "The horizontal and vertical locations must match in length"
+            )
+        if values is not None and len(values) != len(xs):
+            raise CanvasError("There must be one colour for each location")
+        locations: Iterable[tuple[int, int]] = zip(xs, ys, strict=True)
+        pixels: Iterable[int] = (
+            repeat(self._value_of(color or self._pen_colour or self.styles.color))
+            if values is None
+            else values
+        )
+        outwith_the_canvas = self._outwith_the_canvas
+        inside = [not outwith_the_canvas(x, y) for x, y in zip(xs, ys, strict=True)]
+        if clip:
+            locations = compress(locations, inside)
+            if values is not None:
+                pixels = compress(pixels, inside)
+        elif False in inside:
+            # Check every location before any are set, so that nothing is
+            # drawn if one of them is outwith the canvas.
+            outwith = inside.index(False)
+            self._pixel_check(xs[outwith], ys[outwith])
+        return self._plot(locations, pixels, refresh)
+
+    def clear_pixels(
+        self, locations: Iterable[tuple[int, int]], refresh: bool | None = None
+    ) -> Self:
+        """Clear the colour of a collection of pixels on the canvas.
+
+        Args:
+            locations: An iterable of tuples of x and y location.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If any pixel location is not within the canvas.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["clear_pixels"] += 1
+        return self._plot(locations, repeat(NO_COLOR), refresh)
+
+    def set_pixel(
+        self, x: int, y: int, color: Color | None = None, refresh: bool | None = None
+    ) -> Self:
+        """Set the colour of a specific pixel on the canvas.
+
+        Args:
+            x: The horizontal location of the pixel.
+            y: The vertical location of the pixel.
+            color: The color to set the pixel to.
+            refresh: Should the widget be refreshed?
+
+        Raises:
+            CanvasError: If the pixel location is not within the canvas.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["set_pixel"] += 1
+            self._counters.pixels += 1
+        if x < 0 or y < 0 or x >= self._width or y >= self._height:
+            self._pixel_check(x, y)
+        self._canvas.put(
+            x, y, self._value_of(color or self._pen_colour or self.styles.color)
+        )
+        self._mark_dirty(Region(x, y, 1, 1))
+        self._refresh_if(refresh)
+        return self
+
+    def clear_pixel(self, x: int, y: int, refresh: bool | None = None) -> Self:
+        """Clear the colour of a specific pixel on the canvas.
+
+        Args:
+            x: The horizontal location of the pixel.
+            y: The vertical location of the pixel.
+            refresh: Should the widget be refreshed?
+
+        Raises:
+            CanvasError: If the pixel location is not within the canvas.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["clear_pixel"] += 1
+        return self._plot(((x, y),), repeat(NO_COLOR), refresh)
+
+    def get_pixel(self, x: int, y: int) -> Color:
+        """Get the pixel at the given location.
+
+        Args:
+            x: The horizontal location of the pixel.
+            y: The vertical location of the pixel.
+
+        Returns:
+            The colour of the pixel at that location.
+
+        Raises:
+            CanvasError: If the pixel location is not within the canvas.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        self._pixel_check(x, y)
+        return (
+            self._colour_of(self._visible_row(y, x, x + 1)[0])
+            or self._canvas_colour
+            or self.styles.background
+        )
+
+    @contextmanager
+    def pixel_array(
+        self, refresh: bool | None = None
+    ) -> Generator[NDArray[np.unsignedinteger[Any]], None, None]:
+        """A context manager that gives direct access to the pixels as a NumPy array.
+
+        Args:
+            refresh: Should the widget be refreshed at the end?
+
+        Raises:
+            CanvasError: If NumPy isn't installed, or if this is a tiled
+                canvas.
+
+        The array is a `(height, width)` array of
+        [packed pixel values][textual_canvas.pixels.pack_color] that shares
+        its memory with the canvas, so any changes made to it are made to
+        the canvas itself. At the end of the context the whole canvas is
+        treated as having changed. On a palette canvas the array is a
+        `(height, width)` array of `uint8` palette indexes.
+
+        Values written to the array should be made with
+        [`pack_color`][textual_canvas.pixels.pack_color],
+        [`pack_array`][textual_canvas.arrays.pack_array] or
+        [`pack_colors`][textual_canvas.arrays.pack_colors]; packed values
+        with an alpha of zero, other than
+        [`NO_COLOR`][textual_canvas.pixels.NO_COLOR], are reserved for
+        the colours that are held by reference.
+
+        Example:
+            ```python
+            with canvas.pixel_array() as pixels:
+                pixels[10:20, :] = pack_color(Color(255, 0, 0))
+            ```
+
+        Note:
+            The array should not be used once the context has ended.
+        """
+        try:
+            from .arrays import pixel_view
+        except ImportError as error:
+            raise CanvasError("NumPy is needed to work with pixel arrays") from error
+        if not isinstance(canvas := self._canvas, PixelBuffer):
+            raise CanvasError("The pixels of a tiled canvas can't be used as an array")
+        try:
+            yield pixel_view(canvas)
+        finally:
+            self._mark_dirty(Region(0, 0, self._width, self._height))
+            self._refresh_if(refresh)
+
+    def set_array(
+        self,
+        pixels: NDArray[np.generic],
+        x: int = 0,
+        y: int = 0,
+        refresh: bool | None = None,
+    ) -> Self:
+        """Set a block of pixels on the canvas from a NumPy array.
+
+        Args:
+            pixels: The array of pixels to place on the canvas.
+            x: Horizontal location of the top left corner of the block.
+            y: Vertical location of the top left corner of the block.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If NumPy isn't installed, or if the array can't be
+                used as pixels.
+
+        The array can either be a `(height, width)` array of
+        [packed pixel values][textual_canvas.pixels.pack_color], or a
+        `(height, width, 3)` or `(height, width, 4)` array of `uint8` red,
+        green, blue and (optionally) alpha values. On a palette canvas the
+        array must be a `(height, width)` array of palette indexes.
+
+        Any part of the block that falls outwith the canvas is ignored.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["set_array"] += 1
+        try:
+            from .arrays import index_array, pack_array, pixel_view
+        except ImportError as error:
+            raise CanvasError("NumPy is needed to work with pixel arrays") from error
+        try:
+            packed = (
+                pack_array(pixels) if self._palette is None else index_array(pixels)
+            )
+        except ValueError as error:
+            raise CanvasError(str(error)) from error
+        height, width = packed.shape
+        left, top = max(x, 0), max(y, 0)
+        right, bottom = min(x + width, self._width), min(y + height, self._height)
+        if left < right and top < bottom:
+            block = packed[top - y : bottom - y, left - x : right - x]
+            if isinstance(canvas := self._canvas, PixelBuffer):
+                pixel_view(canvas)[top:bottom, left:right] = block
+            else:
+                for row, pixels in enumerate(block, start=top):
+                    values = array(canvas.typecode)
+                    values.frombytes(pixels.tobytes())
+                    canvas.set_row(row, left, values)
+            self._mark_dirty(Region(left, top, right - left, bottom - top))
+            if self._counters is not None:
+                self._counters.pixels += (right - left) * (bottom - top)
+        self._refresh_if(refresh)
+        return self
+
+    def get_region(self, x: int, y: int, width: int, height: int) -> PixelBuffer:
+        """Get a copy of a rectangular block of the canvas.
+
+        Args:
+            x: Horizontal location of the top left corner of the block.
+            y: Vertical location of the top left corner of the block.
+            width: The width of the block.
+            height: The height of the block.
+
+        Returns:
+            A [`PixelBuffer`][textual_canvas.pixels.PixelBuffer] holding a
+                copy of the pixels in the block.
+
+        The block can be placed back on this, or any other canvas that
+        holds the same type of pixel values, with
+        [`put_region`][textual_canvas.canvas.Canvas.put_region]. Any part of
+        the block that is outwith the canvas will have no colour.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        return self._canvas.region(x, y, width, height)
+
+    def _transparent_value(self, transparent: Color | None) -> int | None:
+        """Get the value held in the canvas for a transparent colour.
+
+        Args:
+            transparent: The transparent colour, if there is one.
+
+        Returns:
+            The value to treat as transparent, or [`None`][None] if nothing
+                is transparent.
+
+        Raises:
+            CanvasError: If this is a palette canvas and the colour isn't in
+                the palette.
+
+        `Color(0, 0, 0, 0)` is taken to mean pixels that have no colour.
+        """
+        if transparent is None:
+            return None
+        if pack_color(transparent) == NO_COLOR:
+            return NO_COLOR
+        return self._value_of(transparent)
+
+    def put_region(
+        self,
+        block: PixelBuffer,
+        x: int,
+        y: int,
+        transparent: Color | None = None,
+        refresh: bool | None = None,
+    ) -> Self:
+        """Place a block of pixels on the canvas.
+
+        Args:
+            block: The block of pixels to place.
+            x: Horizontal location of the top left corner of the block.
+            y: Vertical location of the top left corner of the block.
+            transparent: An optional colour in the block to not place.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If the block can't be placed on the canvas.
+
+        The block will normally have come from
+        [`get_region`][textual_canvas.canvas.Canvas.get_region]. Any part of
+        the block that falls outwith the canvas is ignored.
+
+        To not place the pixels of the block that have no colour, use
+        `Color(0, 0, 0, 0)` as the transparent colour.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["put_region"] += 1
+        try:
+            region = self._canvas.blit(
+                block, x, y, self._transparent_value(transparent)
+            )
+        except ValueError as error:
+            raise CanvasError(str(error)) from error
+        if region is not None:
+            self._mark_dirty(region)
+            if self._counters is not None:
+                self._counters.pixels += region.area
+        self._refresh_if(refresh)
+        return self
+
+    def shift_pixels(self, x: int, y: int, refresh: bool | None = None) -> Self:
+        """Shift the pixels of the canvas.
+
+        Args:
+            x: The number of pixels to shift right by; negative shifts left.
+            y: The number of pixels to shift down by; negative shifts up.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Pixels shifted off the edge of the canvas are lost, and the pixels
+        exposed by the shift have no colour, so they show the canvas
+        colour. Only the layer being drawn on is shifted; any sprites on it
+        stay where they are.
+
+        This is much cheaper than drawing everything again one pixel to
+        the side, which makes it useful for charts that scroll as new
+        values arrive:
+
+        Example:
+            ```python
+            canvas.shift_pixels(-1, 0)
+            canvas.set_pixel(canvas.width - 1, value_to_y(sample), GREEN)
+            ```
+        """
+        if self._counters is not None:
+            self._counters.calls["shift_pixels"] += 1
+        reuse_lines = False
+        if not self._in_frame:
+            sprites = [
+                sprite for sprite in self._sprites if sprite.layer is self._layer
+            ]
+            for sprite in reversed(sprites):
+                sprite.undraw()
+            self._forget_sprites(self._layer)
+            reuse_lines = self._composite is None and not sprites
+        self._canvas.shift(x, y)
+        shifted_lines = self._shift_lines(x, y) if reuse_lines else {}
+        self._mark_dirty(Region(0, 0, self._width, self._height))
+        self._line_cache.update(shifted_lines)
+        self._refresh_if(refresh)
+        return self
+
+    def _shift_lines(self, x: int, y: int) -> dict[int, tuple[_LineKey, Strip]]:
+        """Shift the rendered lines of the canvas along with its pixels.
+
+        Args:
+            x: The number of pixels the pixels were shifted right by.
+            y: The number of pixels the pixels were shifted down by.
+
+        Returns:
+            The rendered lines, keyed by where they are now.
+
+        Only a shift of a whole number of character cells moves whole
+        cells, so any other shift leaves every line to be rendered again.
+        Otherwise each rendered line is moved down with its pixels, and the
+        cells that are still in view are moved across; only the cells that
+        show the pixels exposed by the shift are rendered. Cells that are
+        partly outwith the canvas, at its right and bottom edges, are never
+        moved, as they wouldn't look the same anywhere else.
+        """
+        renderer = self._renderer
+        across, down = renderer.cell_size
+        if x % across or y % down:
+            return {}
+        full_cells, full_lines = self._width // across, self._height // down
+        across, down = x // across, y // down
+        pixels = self._canvas
+        shifted: dict[int, tuple[_LineKey, Strip]] = {}
+        for line, (key, strip) in self._line_cache.items():
+            if line >= full_lines or not 0 <= (moved := line + down) < full_lines:
+                continue
+            if across:
+                scroll_x, _, background_colour, canvas_colour = key
+                width = strip.cell_length
+                full_width = min(width, full_cells - scroll_x)
+                start = max(across, 0)
+                end = min(full_width, full_width + across)
+                if start >= end:
+                    continue
+                renderer.use_colours(canvas_colour, background_colour)
+                strip = join_runs(
+                    [
+                        renderer.strip(pixels, moved, scroll_x, scroll_x + start),
+                        strip.crop(start - across, end - across),
+                        renderer.strip(pixels, moved, scroll_x + end, scroll_x + width),
+                    ]
+                )
+            shifted[moved] = (key, strip)
+        return shifted
+
+    def add_sprite(
+        self,
+        block: PixelBuffer,
+        x: int,
+        y: int,
+        transparent: Color | None = None,
+        refresh: bool | None = None,
+    ) -> Sprite:
+        """Add a sprite to the canvas.
+
+        Args:
+            block: The pixels of the sprite.
+            x: Horizontal location of the top left corner of the sprite.
+            y: Vertical location of the top left corner of the sprite.
+            transparent: An optional colour in the block to not draw.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The sprite.
+
+        Raises:
+            CanvasError: If the block can't be drawn on the canvas.
+
+        The block will normally have come from
+        [`get_region`][textual_canvas.canvas.Canvas.get_region]; as with
+        [`put_region`][textual_canvas.canvas.Canvas.put_region], use
+        `Color(0, 0, 0, 0)` as the transparent colour to not draw the pixels
+        of the block that have no colour. The new sprite is drawn on top of
+        any other sprites.
+
+        Sprites save the pixels of the canvas that they cover, and put them
+        back when they move or are removed; anything drawn on the canvas
+        beneath a sprite will be lost when the sprite moves.
+
+        Changes to sprites are drawn when the canvas is next refreshed, so
+        moving many sprites within
+        [`batch_refresh`][textual_canvas.canvas.Canvas.batch_refresh] draws
+        them all in one go.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if block.typecode != self._canvas.typecode:
+            raise CanvasError(
+                f"Can't use a block of type {block.typecode!r}"
+                f" as a sprite on a canvas of type {self._canvas.typecode!r}"
+            )
+        sprite = Sprite(block, x, y, self._transparent_value(transparent), self._layer)
+        self._sprites.append(sprite)
+        self._restack(len(self._sprites) - 1, refresh)
+        return sprite
+
+    def _sprite_index(self, sprite: Sprite) -> int:
+        """Get the position of a sprite in the stack of sprites.
+
+        Args:
+            sprite: The sprite to find.
+
+        Returns:
+            The position of the sprite, from the bottom up.
+
+        Raises:
+            CanvasError: If the sprite isn't on this canvas.
+        """
+        try:
+            return self._sprites.index(sprite)
+        except ValueError:
+            raise CanvasError("The sprite is not on this canvas") from None
+
+    def move_sprite(
+        self, sprite: Sprite, x: int, y: int, refresh: bool | None = None
+    ) -> Self:
+        """Move a sprite on the canvas.
+
+        Args:
+            sprite: The sprite to move.
+            x: Horizontal location to move the top left corner of the sprite to.
+            y: Vertical location to move the top left corner of the sprite to.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If the sprite isn't on this canvas.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        index = self._sprite_index(sprite)
+        sprite.x, sprite.y = x, y
+        return self._restack(index, refresh)
+
+    def remove_sprite(self, sprite: Sprite, refresh: bool | None = None) -> Self:
+        """Remove a sprite from the canvas.
+
+        Args:
+            sprite: The sprite to remove.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If the sprite isn't on this canvas.
+        """
+        index = self._sprite_index(sprite)
+        # Sprites have to be taken off the canvas from the top down, so
+        # that what they saved is put back in the right order.
+        for lifted in reversed(
+            [sprite, *self._affected_sprites(index + 1, sprite.drawn_region)]
+        ):
+            if (region := lifted.undraw()) is not None:
+                self._mark_dirty(region, lifted.layer)
+        del self._sprites[index]
+        return self._restack(index, refresh)
+
+    def _restack(self, index: int, refresh: bool | None) -> Self:
+        """Note that sprites from a given position upwards need redrawing.
+
+        Args:
+            index: The position of the lowest sprite that needs redrawing.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+        """
+        if self._stale_sprites is None or index < self._stale_sprites:
+            self._stale_sprites = index
+        self._refresh_if(refresh)
+        return self
+
+    def _affected_sprites(self, index: int, area: Region | None = None) -> list[Sprite]:
+        """Find the sprites, from a given position upwards, that need redrawing.
+
+        Args:
+            index: The position of the lowest sprite to consider.
+            area: An area of the canvas that is already known to be changing.
 
         Returns:
-            The colour of the pixel at that location.
+            The sprites that need redrawing, from the bottom up.
 
-        Raises:
-            CanvasError: If the pixel location is not within the canvas.
+        A sprite needs redrawing if it has changed since it was drawn, or if
+        it overlaps the area covered by any sprite below it that needs
+        redrawing.
+        """
+        affected: list[Sprite] = []
+        for sprite in self._sprites[index:]:
+            region = sprite.region
+            if sprite.changed or (area is not None and area.overlaps(region)):
+                affected.append(sprite)
+                area = region if area is None else area.union(region)
+                if (drawn := sprite.drawn_region) is not None:
+                    area = area.union(drawn)
+        return affected
+
+    def _draw_sprites(self) -> None:
+        """Redraw any sprites that are waiting to be redrawn.
+
+        The sprites that need redrawing are taken off the canvas, from the
+        top down, and then drawn again, from the bottom up; so overlapping
+        sprites stack correctly.
+        """
+        if (index := self._stale_sprites) is None:
+            return
+        self._stale_sprites = None
+        affected = self._affected_sprites(index)
+        for sprite in reversed(affected):
+            if (region := sprite.undraw()) is not None:
+                self._mark_dirty(region, sprite.layer)
+        for sprite in affected:
+            if (region := sprite.draw()) is not None:
+                self._mark_dirty(region, sprite.layer)
+
+    def _forget_sprites(self, layer: Layer | None = None) -> None:
+        """Forget what was under sprites, and have them drawn again.
 
-        Note:
-            The origin of the canvas is the top left corner.
+        Args:
+            layer: The layer whose sprites should be forgotten; defaults to
+                all sprites.
+
+        This is for when the pixels under the sprites have been replaced.
         """
-        self._pixel_check(x, y)
-        return self._canvas[y][x] or self.styles.background
+        for index, sprite in enumerate(self._sprites):
+            if layer is None or sprite.layer is layer:
+                sprite.forget()
+                if self._stale_sprites is None or index < self._stale_sprites:
+                    self._stale_sprites = index
+
+    def _line_pixels(self, x0: int, y0: int, x1: int, y1: int) -> list[tuple[int, int]]:
+        """Get the pixels of a line that are within the canvas.
+
+        Args:
+            x0: Horizontal location of the starting position.
+            y0: Vertical location of the starting position.
+            x1: Horizontal location of the ending position.
+            y1: Vertical location of the ending position.
+
+        Returns:
+            The locations of the pixels of the line that are within the
+                canvas, in order from the start of the line.
+        """
+
+        # This produces exactly the pixels of the "all cases" version of
+        # Bresenham's line algorithm, as described at
+        # https://en.wikipedia.org/wiki/Bresenham's_line_algorithm#All_cases,
+        # but rather than walk every step from one end of the line to the
+        # other, it works out which steps land within the canvas and only
+        # visits those.
+        #
+        # The line takes one step along its major axis (the axis along
+        # which it travels furthest) for every pixel, and after `step`
+        # steps it has moved `(2 * minor * step + major) // (2 * major)`
+        # along its minor axis; which is what Bresenham's error term works
+        # out incrementally.
+
+        dx = abs(x1 - x0)
+        sx = 1 if x0 < x1 else -1
+        dy = abs(y1 - y0)
+        sy = 1 if y0 < y1 else -1
+
+        # Work in terms of the major and minor axes of the line.
+        if dx >= dy:
+            major, major_from, major_step, major_size = dx, x0, sx, self._width
+            minor, minor_from, minor_step, minor_size = dy, y0, sy, self._height
+        else:
+            major, major_from, major_step, major_size = dy, y0, sy, self._height
+            minor, minor_from, minor_step, minor_size = dx, x0, sx, self._width
+
+        # A line with no length is a single pixel.
+        if not major:
+            return [] if self._outwith_the_canvas(x0, y0) else [(x0, y0)]
+
+        # Clip the steps to those that are within the canvas on the major
+        # axis...
+        first, last = (
+            (-major_from, major_size - 1 - major_from)
+            if major_step > 0
+            else (major_from - major_size + 1, major_from)
+        )
+        first, last = max(first, 0), min(last, major)
+
+        # ...and then to those that are within the canvas on the minor axis.
+        lowest, highest = (
+            (-minor_from, minor_size - 1 - minor_from)
+            if minor_step > 0
+            else (minor_from - minor_size + 1, minor_from)
+        )
+        lowest = max(lowest, 0)
+        if highest < lowest or (not minor and lowest):
+            return []
+        if minor:
+            first = max(first, -((major - 2 * major * lowest) // (2 * minor)))
+            last = min(last, (2 * major * (highest + 1) - major - 1) // (2 * minor))
+
+        pixels = [
+            (
+                major_from + major_step * step,
+                minor_from + minor_step * ((2 * minor * step + major) // (2 * major)),
+            )
+            for step in range(first, last + 1)
+        ]
+        return pixels if dx >= dy else [(x, y) for y, x in pixels]
 
     def draw_line(
         self,
@@ -375,37 +2117,33 @@ class Canvas(ScrollView, can_focus=True):
         Note:
             The origin of the canvas is the top left corner.
         """
+        if self._counters is not None:
+            self._counters.calls["draw_line"] += 1
+        return self._draw_line(x0, y0, x1, y1, color, refresh)
 
-        # Taken from https://en.wikipedia.org/wiki/Bresenham's_line_algorithm#All_cases.
-
-        pixels: list[tuple[int, int]] = []
-        outwith_the_canvas = self._outwith_the_canvas
-        add_pixel = pixels.append
+    def _draw_line(
+        self,
+        x0: int,
+        y0: int,
+        x1: int,
+        y1: int,
+        color: Color | None,
+        refresh: bool | None,
+    ) -> Self:
+        """Draw a line between two points, without counting the call.
 
-        dx = abs(x1 - x0)
-        sx = 1 if x0 < x1 else -1
-        dy = -abs(y1 - y0)
-        sy = 1 if y0 < y1 else -1
-        err = dx + dy
-
-        while True:
-            if not outwith_the_canvas(x0, y0):
-                add_pixel((x0, y0))
-            if x0 == x1 and y0 == y1:
-                break
-            e2 = 2 * err
-            if e2 >= dy:
-                if x0 == x1:
-                    break
-                err += dy
-                x0 += sx
-            if e2 <= dx:
-                if y0 == y1:
-                    break
-                err += dx
-                y0 += sy
+        Args:
+            x0: Horizontal location of the starting position.
+            y0: Vertical location of the starting position.
+            x1: Horizontal location of the ending position.
+            y1: Vertical location of the ending position.
+            color: The color to set the pixel to.
+            refresh: Should the widget be refreshed?
 
-        return self.set_pixels(pixels, color, refresh)
+        Returns:
+            The canvas.
+        """
+        return self._set_pixels(self._line_pixels(x0, y0, x1, y1), color, refresh)
 
     def draw_rectangle(
         self,
@@ -432,15 +2170,17 @@ class Canvas(ScrollView, can_focus=True):
         Note:
             The origin of the canvas is the top left corner.
         """
+        if self._counters is not None:
+            self._counters.calls["draw_rectangle"] += 1
         if width < 1 or height < 1:
             return self
         width -= 1
         height -= 1
         return (
-            self.draw_line(x, y, x + width, y, color, False)
-            .draw_line(x + width, y, x + width, y + height, color, False)
-            .draw_line(x + width, y + height, x, y + height, color, False)
-            .draw_line(x, y + height, x, y, color, refresh)
+            self._draw_line(x, y, x + width, y, color, False)
+            ._draw_line(x + width, y, x + width, y + height, color, False)
+            ._draw_line(x + width, y + height, x, y + height, color, False)
+            ._draw_line(x, y + height, x, y, color, refresh)
         )
 
     @staticmethod
@@ -456,28 +2196,15 @@ class Canvas(ScrollView, can_focus=True):
         """
         return ((x, y), (y, x), (-x, y), (-y, x), (x, -y), (y, -x), (-x, -y), (-y, -x))
 
-    def draw_circle(
-        self,
-        center_x: int,
-        center_y: int,
-        radius: int,
-        color: Color | None = None,
-        refresh: bool | None = None,
-    ) -> Self:
-        """Draw a circle
+    @classmethod
+    def _circle_points(cls, radius: int) -> list[tuple[int, int]]:
+        """Get the points of the outline of a circle.
 
         Args:
-            center_x: The horizontal position of the center of the circle.
-            center_y: The vertical position of the center of the circle.
             radius: The radius of the circle.
-            color: The colour to draw circle in.
-            refresh: Should the widget be refreshed?
 
         Returns:
-            The canvas.
-
-        Note:
-            The origin of the canvas is the top left corner.
+            The points of the outline, relative to the center of the circle.
         """
 
         # Taken from https://funloop.org/post/2021-03-15-bresenham-circle-drawing-algorithm.html.
@@ -490,7 +2217,7 @@ class Canvas(ScrollView, can_focus=True):
         f_m = 1 - radius
         d_e = 3
         d_ne = -(radius << 1) + 5
-        add_pixels(self._circle_mirror(x, y))
+        add_pixels(cls._circle_mirror(x, y))
         while x < -y:
             if f_m <= 0:
                 f_m += d_e
@@ -501,22 +2228,454 @@ class Canvas(ScrollView, can_focus=True):
             d_e += 2
             d_ne += 2
             x += 1
-            add_pixels(self._circle_mirror(x, y))
+            add_pixels(cls._circle_mirror(x, y))
+
+        return pixels
+
+    def draw_circle(
+        self,
+        center_x: int,
+        center_y: int,
+        radius: int,
+        color: Color | None = None,
+        refresh: bool | None = None,
+    ) -> Self:
+        """Draw a circle
+
+        Args:
+            center_x: The horizontal position of the center of the circle.
+            center_y: The vertical position of the center of the circle.
+            radius: The radius of the circle.
+            color: The colour to draw circle in.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
 
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["draw_circle"] += 1
         outwith_the_canvas = self._outwith_the_canvas
-        return self.set_pixels(
+        return self._set_pixels(
             [
                 (center_x + x, center_y + y)
-                for x, y in pixels
+                for x, y in self._circle_points(radius)
                 if not outwith_the_canvas(center_x + x, center_y + y)
             ],
             color,
             refresh,
         )
 
+    def _fill_spans(
+        self,
+        spans: Iterable[tuple[int, int, int]],
+        value: int,
+        refresh: bool | None,
+    ) -> Self:
+        """Fill horizontal spans of pixels on the canvas with a packed value.
+
+        Args:
+            spans: The spans to fill, each a tuple of the row, the first
+                column of the span and the column the span stops at.
+            value: The packed pixel value to fill the spans with.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Each span is written as a single slice of a row of the canvas, or as
+        one slice per tile on a tiled canvas; any part of a span that is
+        outwith the canvas is ignored.
+        """
+        set_row = self._canvas.set_row
+        width, height = self._width, self._height
+        fill = array(self._canvas.typecode, [value]) * width
+        left = top = maxsize
+        right = bottom = -1
+        written = 0
+        for y, start, end in spans:
+            start, end = max(start, 0), min(end, width)
+            if start < end and 0 <= y < height:
+                set_row(y, start, fill[start:end])
+                written += end - start
+                if start < left:
+                    left = start
+                if end > right:
+                    right = end
+                if y < top:
+                    top = y
+                if y > bottom:
+                    bottom = y
+        if right >= 0:
+            self._mark_dirty(Region(left, top, right - left, bottom - top + 1))
+        if self._counters is not None:
+            self._counters.pixels += written
+        self._refresh_if(refresh)
+        return self
+
+    def fill_rectangle(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        color: Color | None = None,
+        refresh: bool | None = None,
+    ) -> Self:
+        """Draw a filled rectangle.
+
+        Args:
+            x: Horizontal location of the top left corner of the rectangle.
+            y: Vertical location of the top left corner of the rectangle.
+            width: The width of the rectangle.
+            height: The height of the rectangle.
+            color: The color to fill the rectangle with.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Any part of the rectangle that is outwith the canvas is ignored.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["fill_rectangle"] += 1
+        return self._fill_spans(
+            (
+                (row, x, x + width)
+                for row in range(max(y, 0), min(y + height, self._height))
+            ),
+            self._value_of(color or self._pen_colour or self.styles.color),
+            refresh,
+        )
+
+    def fill_circle(
+        self,
+        center_x: int,
+        center_y: int,
+        radius: int,
+        color: Color | None = None,
+        refresh: bool | None = None,
+    ) -> Self:
+        """Draw a filled circle.
+
+        Args:
+            center_x: The horizontal position of the center of the circle.
+            center_y: The vertical position of the center of the circle.
+            radius: The radius of the circle.
+            color: The colour to fill the circle with.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        The filled circle covers exactly the pixels of the outline drawn by
+        [`draw_circle`][textual_canvas.canvas.Canvas.draw_circle] and
+        everything within it. Any part of the circle that is outwith the
+        canvas is ignored.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["fill_circle"] += 1
+        rows: dict[int, tuple[int, int]] = {}
+        for x, y in self._circle_points(radius):
+            start, end = rows.get(y, (x, x))
+            rows[y] = (min(start, x), max(end, x))
+        return self._fill_spans(
+            (
+                (center_y + y, center_x + start, center_x + end + 1)
+                for y, (start, end) in rows.items()
+            ),
+            self._value_of(color or self._pen_colour or self.styles.color),
+            refresh,
+        )
+
+    def fill_ellipse(
+        self,
+        center_x: int,
+        center_y: int,
+        radius_x: int,
+        radius_y: int,
+        color: Color | None = None,
+        refresh: bool | None = None,
+    ) -> Self:
+        """Draw a filled ellipse.
+
+        Args:
+            center_x: The horizontal position of the center of the ellipse.
+            center_y: The vertical position of the center of the ellipse.
+            radius_x: The horizontal radius of the ellipse.
+            radius_y: The vertical radius of the ellipse.
+            color: The colour to fill the ellipse with.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        A pixel is filled if its offset from the center, `x`, `y`, satisfies
+        `(x / radius_x) ** 2 + (y / radius_y) ** 2 <= 1`. Any part of the
+        ellipse that is outwith the canvas is ignored.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["fill_ellipse"] += 1
+        if radius_x < 0 or radius_y < 0:
+            return self
+        across, down = radius_x * radius_x, radius_y * radius_y
+        spans: list[tuple[int, int, int]] = []
+        for y in range(
+            max(-radius_y, -center_y), min(radius_y, self._height - 1 - center_y) + 1
+        ):
+            half = isqrt(across * (down - y * y) // down) if down else radius_x
+            spans.append((center_y + y, center_x - half, center_x + half + 1))
+        return self._fill_spans(
+            spans,
+            self._value_of(color or self._pen_colour or self.styles.color),
+            refresh,
+        )
+
+    def fill_polygon(
+        self,
+        points: Sequence[tuple[int, int]],
+        color: Color | None = None,
+        refresh: bool | None = None,
+    ) -> Self:
+        """Draw a filled polygon.
+
+        Args:
+            points: The locations of the corners of the polygon.
+            color: The colour to fill the polygon with.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        The polygon is closed, so there's no need to repeat the first point
+        at the end. Its inside is worked out with the even-odd rule, and the
+        filled polygon includes the pixels of the outline that
+        [`draw_line`][textual_canvas.canvas.Canvas.draw_line] would draw
+        between each pair of corners. Any part of the polygon that is
+        outwith the canvas is ignored.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["fill_polygon"] += 1
+        value = self._value_of(color or self._pen_colour or self.styles.color)
+        if not points:
+            return self._fill_spans((), value, refresh)
+
+        # Each edge that isn't horizontal, as its top and bottom, and the
+        # horizontal location at its top along with how far it moves
+        # horizontally for every row it moves down.
+        edges = [
+            (y0, y1, x0, Fraction(x1 - x0, y1 - y0))
+            for (x0, y0), (x1, y1) in (
+                sorted(edge, key=lambda point: point[1])
+                for edge in zip(points, (*points[1:], points[0]), strict=True)
+            )
+            if y0 != y1
+        ]
+
+        # For every row, find where it crosses the edges and fill between
+        # alternate pairs of those crossings. Edges include their top row
+        # but not their bottom row, so that a corner shared by two edges is
+        # only counted once.
+        spans: list[tuple[int, int, int]] = []
+        if edges:
+            for y in range(
+                max(min(edge[0] for edge in edges), 0),
+                min(max(edge[1] for edge in edges), self._height),
+            ):
+                crossings = sorted(
+                    x + (y - top) * slope
+                    for top, bottom, x, slope in edges
+                    if top <= y < bottom
+                )
+                spans.extend(
+                    (y, ceil(start), floor(end) + 1)
+                    for start, end in zip(crossings[::2], crossings[1::2], strict=True)
+                )
+
+        # Fill the inside, and then draw the outline.
+        self._fill_spans(spans, value, False)
+        return self._plot(
+            (
+                pixel
+                for (x0, y0), (x1, y1) in zip(
+                    points, (*points[1:], points[0]), strict=True
+                )
+                for pixel in self._line_pixels(x0, y0, x1, y1)
+            ),
+            repeat(value),
+            refresh,
+        )
+
+    def flood_fill(
+        self,
+        x: int,
+        y: int,
+        color: Color | None = None,
+        refresh: bool | None = None,
+    ) -> Self:
+        """Flood fill an area of the canvas, starting at the given location.
+
+        Args:
+            x: The horizontal location to start filling from.
+            y: The vertical location to start filling from.
+            color: The colour to fill the area with.
+            refresh: Should the widget be refreshed?
+
+        Returns:
+            The canvas.
+
+        Raises:
+            CanvasError: If the starting location is not within the canvas.
+
+        The area that is filled is every pixel that can be reached from the
+        starting location, moving up, down, left or right, without crossing
+        a pixel that differs from the pixel at the starting location.
+
+        Note:
+            The origin of the canvas is the top left corner.
+        """
+        if self._counters is not None:
+            self._counters.calls["flood_fill"] += 1
+        self._pixel_check(x, y)
+        value = self._value_of(color or self._pen_colour or self.styles.color)
+        canvas = self._canvas
+        width, height = self._width, self._height
+        if (target := canvas.get(x, y)) == value:
+            return self._fill_spans((), value, refresh)
+        length = max(width, height)
+        targets = array(canvas.typecode, [target]) * length
+        fill = array(canvas.typecode, [value]) * length
+        # The pixels of the whole canvas, unless it is a tiled canvas, whose
+        # rows have to be copied out of their tiles.
+        pixels = canvas.data if isinstance(canvas, PixelBuffer) else None
+        # The rows of a tiled canvas that were copied out most recently.
+        recent: dict[int, array[int]] = {}
+        # The blocks of pixels that are filled, as their top and bottom rows
+        # and their start and end columns.
+        spans: list[tuple[int, int, int, int]] = []
+
+        # Each pending span is part of a row to look for runs of target
+        # pixels in, along with the direction to carry on in from that row.
+        # Each run that is found is filled and then the next row on is
+        # looked at; where the run reaches past either end of the span it
+        # was found in, the row it came from is looked at too. A run that is
+        # a single pixel wide is first followed along its column for as
+        # long as it is walled in, as those rows can be filled in one go.
+        pending = [(y, x, x + 1, 1), (y - 1, x, x + 1, -1)]
+        while pending:
+            row, start, end, direction = pending.pop()
+            if not 0 <= row < height:
+                continue
+            if pixels is not None:
+                data, offset = pixels, row * width
+            elif row in recent:
+                data, offset = recent[row], 0
+            else:
+                if len(recent) >= 8:
+                    del recent[next(iter(recent))]
+                data = recent[row] = canvas.row(row)
+                offset = 0
+            try:
+                left = seed = data.index(target, offset + start, offset + end) - offset
+            except ValueError:
+                continue
+            while left and data[offset + left - 1] == target:
+                left -= 1
+            if left < start:
+                pending.append((row - direction, left, start, -direction))
+            while True:
+                right = seed + 1
+                if right < width and data[offset + right] == target:
+                    right = (
+                        end_of_run(data, offset + right, offset + width, targets)
+                        - offset
+                    )
+                data[offset + left : offset + right] = fill[: right - left]
+                if pixels is None:
+                    canvas.set_row(row, left, fill[: right - left])
+                spans.append((row, row + 1, left, right))
+                after = row
+                if (
+                    right - left == 1
+                    and pixels is not None
+                    and 0 <= row + direction < height
+                    and pixels[next_pixel := offset + left + direction * width]
+                    == target
+                ):
+                    corridor = end_of_corridor(
+                        pixels,
+                        width,
+                        next_pixel,
+                        row if direction < 0 else height - 1 - row,
+                        direction,
+                        targets,
+                    )
+                    if corridor:
+                        top, bottom = (
+                            (row + 1, row + 1 + corridor)
+                            if direction > 0
+                            else (row - corridor, row)
+                        )
+                        pixels[top * width + left : bottom * width + left : width] = (
+                            fill[:corridor]
+                        )
+                        spans.append((top, bottom, left, right))
+                        after += corridor * direction
+                pending.append((after + direction, left, right, direction))
+                if right > end:
+                    pending.append((row - direction, end, right, -direction))
+                try:
+                    left = seed = (
+                        data.index(target, offset + right + 1, offset + end) - offset
+                    )
+                except ValueError:
+                    break
+
+        tops, bottoms, starts, ends = zip(*spans, strict=True)
+        self._mark_dirty(
+            Region.from_corners(min(starts), min(tops), max(ends), max(bottoms))
+        )
+        if self._counters is not None:
+            self._counters.pixels += sum(
+                (bottom - top) * (end - start) for top, bottom, start, end in spans
+            )
+        self._refresh_if(refresh)
+        return self
+
     def render_line(self, y: int) -> Strip:
         """Render a line in the display.
 
+        Args:
+            y: The line to render.
+
+        Returns:
+            A [`Strip`][textual.strip.Strip] that is the line to render.
+        """
+        if (counters := self._counters) is None:
+            return self._render_line(y)
+        started = perf_counter()
+        strip = self._render_line(y)
+        counters.render_time += perf_counter() - started
+        counters.lines_rendered += 1
+        return strip
+
+    def _render_line(self, y: int) -> Strip:
+        """Render a line in the display.
+
         Args:
             y: The line to render.
 
@@ -527,12 +2686,13 @@ class Canvas(ScrollView, can_focus=True):
         # Get where we're scrolled to.
         scroll_x, scroll_y = self.scroll_offset
 
-        # We're going to be drawing two lines from the canvas in one line in
-        # the display. Let's work out the first line first.
-        top_line = (scroll_y + y) * 2
+        # We're going to be drawing a number of lines from the canvas in one
+        # line in the display; how many depends on the render mode.
+        line = scroll_y + y
+        _, down = self._renderer.cell_size
 
         # Is this off the canvas already?
-        if top_line >= self.height:
+        if line * down >= self._height:
             # Yup. Don't bother drawing anything.
             return Strip([])
 
@@ -540,43 +2700,30 @@ class Canvas(ScrollView, can_focus=True):
         background_colour = self.styles.background
         canvas_colour = self._canvas_colour or background_colour
 
-        # Reduce some attribute lookups.
-        height = self._height
-        width = self._width
-        canvas = self._canvas
-
-        # Now, the bottom line is easy enough to work out.
-        bottom_line = top_line + 1
-
-        # Get the pixel values for the top line.
-        top_pixels = canvas[top_line]
-
-        # It's possible that the bottom line might be outwith the canvas
-        # itself; so here we set the bottom line to the widget's background
-        # colour if it is, otherwise we use the line form the canvas.
-        bottom_pixels = (
-            [background_colour for _ in range(width)]
-            if bottom_line >= height
-            else canvas[bottom_line]
-        )
-
-        # At this point we know what colours we're going to be mashing
-        # together into the terminal line we're drawing. So let's get to it.
-        # Note that in every case, if the colour we have is `None` that
-        # means we're using the canvas colour.
-        return (
-            Strip(
-                [
-                    _segment_of(
-                        top_pixels[pixel] or canvas_colour,
-                        bottom_pixels[pixel] or canvas_colour,
-                    )
-                    for pixel in range(width)
-                ]
-            )
-            .crop(scroll_x, scroll_x + self.scrollable_content_region.width)
-            .simplify()
+        # If we've already rendered this line, and nothing that would change
+        # how it looks has changed since, we can reuse what we made last time.
+        visible_width = self.scrollable_content_region.width
+        key = (scroll_x, visible_width, background_colour, canvas_colour)
+        if (cached := self._line_cache.get(line)) is not None and cached[0] == key:
+            if self._counters is not None:
+                self._counters.line_cache_hits += 1
+            return cached[1]
+
+        # The segments we build with depend on the colours we're using, so
+        # make sure the renderer knows what they are.
+        renderer = self._renderer
+        renderer.use_colours(canvas_colour, background_colour)
+
+        # We only need to build the part of the line that can be seen, so
+        # only the columns that are in view are rendered.
+        strip = renderer.strip(
+            self._layer.pixels if self._composite is None else self._composite,
+            line,
+            scroll_x,
+            scroll_x + visible_width,
         )
+        self._line_cache[line] = (key, strip)
+        return strip
 
 
 ### canvas.py ends here
@@ -0,0 +1,140 @@
+"""Provides the optional counting of the work done by a canvas."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from time import monotonic
+from types import MappingProxyType
+
+##############################################################################
+# Local imports.
+from .segments import SegmentCache
+
+
+##############################################################################
+@dataclass(frozen=True)
+class CanvasStats:
+    """A snapshot of the work done by an instrumented canvas.
+
+    Canvases are instrumented with
+    [`Canvas.instrument`][textual_canvas.canvas.Canvas.instrument], and
+    everything is counted from when the instrumentation was turned on, or
+    from when the statistics were last reset.
+    """
+
+    elapsed: float
+    """The time, in seconds, that the statistics cover."""
+    pixels: int
+    """The number of pixels written by drawing."""
+    calls: Mapping[str, int]
+    """The number of calls made to each drawing method.
+
+    Only the methods that were called are counted; drawing methods that are
+    built on others don't count as calls to those, so each call to
+    `draw_rectangle` counts as just that.
+    """
+    refreshes: int
+    """The number of refreshes of the display that drawing asked for."""
+    suppressed_refreshes: int
+    """The number of refreshes put off, by a batch or by `refresh=False`."""
+    lines_rendered: int
+    """The number of lines of the display that were rendered."""
+    line_cache_hits: int
+    """The number of rendered lines that were taken from the line cache."""
+    render_time: float
+    """The total time, in seconds, spent rendering lines of the display."""
+    segment_hits: int
+    """The number of times a segment was found in the segment cache."""
+    segment_misses: int
+    """The number of times a segment had to be built."""
+
+    @property
+    def mean_render_time(self) -> float:
+        """The mean time, in seconds, taken to render a line of the display."""
+        return self.render_time / self.lines_rendered if self.lines_rendered else 0.0
+
+
+##############################################################################
+class Counters:
+    """The running counts of the work done by an instrumented canvas."""
+
+    __slots__ = (
+        "started",
+        "pixels",
+        "calls",
+        "refreshes",
+        "suppressed_refreshes",
+        "lines_rendered",
+        "line_cache_hits",
+        "render_time",
+        "_segment_hits",
+        "_segment_misses",
+    )
+
+    def __init__(self, segments: SegmentCache) -> None:
+        """Initialise the counters.
+
+        Args:
+            segments: The segment cache of the canvas.
+        """
+        self.started = monotonic()
+        """When the counting started."""
+        self.pixels = 0
+        """The number of pixels written by drawing."""
+        self.calls: Counter[str] = Counter()
+        """The number of calls made to each drawing method."""
+        self.refreshes = 0
+        """The number of refreshes of the display that drawing asked for."""
+        self.suppressed_refreshes = 0
+        """The number of refreshes that were put off."""
+        self.lines_rendered = 0
+        """The number of lines of the display that were rendered."""
+        self.line_cache_hits = 0
+        """The number of rendered lines that were taken from the line cache."""
+        self.render_time = 0.0
+        """The total time, in seconds, spent rendering lines of the display."""
+        stats = segments.stats
+        self._segment_hits = stats.hits
+        """The segment cache hits before the counting started."""
+        self._segment_misses = stats.misses
+        """The segment cache misses before the counting started."""
+
+    def snapshot(self, segments: SegmentCache) -> CanvasStats:
+        """Take a snapshot of the counts.
+
+        Args:
+            segments: The segment cache of the canvas.
+
+        Returns:
+            The statistics of the canvas.
+
+        The segment cache keeps its own statistics, so its hits and misses
+        are counted from where they stood when the counting started; if its
+        statistics have been reset since, they are counted from zero.
+        """
+        stats = segments.stats
+        return CanvasStats(
+            elapsed=monotonic() - self.started,
+            pixels=self.pixels,
+            calls=MappingProxyType(dict(self.calls)),
+            refreshes=self.refreshes,
+            suppressed_refreshes=self.suppressed_refreshes,
+            lines_rendered=self.lines_rendered,
+            line_cache_hits=self.line_cache_hits,
+            render_time=self.render_time,
+            segment_hits=stats.hits - self._segment_hits
+            if stats.hits >= self._segment_hits
+            else stats.hits,
+            segment_misses=stats.misses - self._segment_misses
+            if stats.misses >= self._segment_misses
+            else stats.misses,
+        )
+
+
+### instruments.py ends here
@@ -0,0 +1,118 @@
+"""Provides the layers of a canvas, and the compositing of them."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from array import array
+from collections.abc import Iterable
+from typing import Final
+
+##############################################################################
+# Local imports.
+from .pixels import NO_COLOR, overlay
+from .tiles import Pixels
+
+##############################################################################
+BASE_LAYER: Final[str] = "base"
+"""The name of the bottom layer, which every canvas has."""
+
+
+##############################################################################
+class Layer:
+    """A plane of pixels in a stack of layers.
+
+    Pixels of a layer that have no colour are transparent, letting the
+    layers below show through.
+    """
+
+    __slots__ = ("name", "pixels", "back", "dirty")
+
+    def __init__(self, name: str, pixels: Pixels) -> None:
+        """Initialise the layer.
+
+        Args:
+            name: The name of the layer.
+            pixels: The pixels of the layer.
+        """
+        self.name = name
+        """The name of the layer."""
+        self.pixels = pixels
+        """The pixels of the layer."""
+        self.back: Pixels | None = None
+        """The spare buffer that frames of the layer are drawn in, if one has been made."""
+        self.dirty: set[int] = set()
+        """The rows of the layer that have changed since they were composited."""
+
+
+##############################################################################
+class Composite:
+    """A cached composite of a stack of layers.
+
+    Each row of the composite is only rebuilt when it is asked for and one
+    of the layers has changed in that row since it was last built.
+    """
+
+    __slots__ = ("layers", "pixels")
+
+    def __init__(self, layers: Iterable[Layer]) -> None:
+        """Initialise the composite.
+
+        Args:
+            layers: The layers to composite, from the bottom up.
+
+        All the layers must be the same size and hold the same type of
+        pixel value.
+        """
+        self.layers = tuple(layers)
+        """The layers being composited, from the bottom up."""
+        self.pixels = self.layers[0].pixels.empty()
+        """The composited pixels."""
+        for layer in self.layers:
+            layer.dirty.update(range(self.pixels.height))
+
+    @property
+    def width(self) -> int:
+        """The width of the composite."""
+        return self.pixels.width
+
+    @property
+    def height(self) -> int:
+        """The height of the composite."""
+        return self.pixels.height
+
+    def _compose(self, y: int) -> None:
+        """Build a row of the composite.
+
+        Args:
+            y: The row to build.
+        """
+        pixels = self.layers[0].pixels.row(y)
+        for layer in self.layers[1:]:
+            overlay(pixels, 0, layer.pixels.row(y), NO_COLOR)
+        self.pixels.set_row(y, 0, pixels)
+        for layer in self.layers:
+            layer.dirty.discard(y)
+
+    def row(self, y: int, start: int = 0, end: int | None = None) -> array[int]:
+        """Get a copy of some or all of a row of composited pixel values.
+
+        Args:
+            y: The row to get.
+            start: The first column to get.
+            end: The column to stop at; defaults to the width of the layers.
+
+        Returns:
+            The composited values of the row.
+
+        Note:
+            No bounds checking is performed.
+        """
+        if any(y in layer.dirty for layer in self.layers):
+            self._compose(y)
+        return self.pixels.row(y, start, end)
+
+
+### layers.py ends here
@@ -0,0 +1,572 @@
+"""Provides the compact storage used to hold the pixels of a canvas."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from array import array
+from typing import TYPE_CHECKING, Final
+
+##############################################################################
+# Textual imports.
+from textual.color import Color
+from textual.geometry import Region
+
+##############################################################################
+# Type checking imports.
+if TYPE_CHECKING:
+    from .tiles import Pixels
+
+##############################################################################
+PIXEL_TYPE: Final[str] = "I" if array("I").itemsize == 4 else "L"
+"""The [`array`][array] type code used to hold a packed pixel value."""
+
+PALETTE_TYPE: Final[str] = "B"
+"""The [`array`][array] type code used to hold a palette index."""
+
+NO_COLOR: Final[int] = 0
+"""The packed value of a pixel that has no colour of its own.
+
+A pixel with this value will be shown using the canvas colour. Note that
+this is also what any colour that is so transparent that its alpha packs to
+zero is packed as, which means that drawing with `Color(0, 0, 0, 0)` is the
+same as clearing a pixel.
+"""
+
+
+SPECIAL_COLOURS: Final[int] = 4096
+"""The most colours that are held by reference at any one time.
+
+See [`pack_color`][textual_canvas.pixels.pack_color].
+"""
+
+_TAGS: Final[int] = 1 << 24
+"""The number of tags that a colour held by reference can be given."""
+
+_special_colours: dict[int, Color] = {}
+"""The colours that are held by reference, keyed by their tag."""
+
+_special_values: dict[Color, int] = {}
+"""The packed values of the colours that are held by reference.
+
+The colours are kept in the order in which they were last packed, oldest
+first.
+"""
+
+_next_tag = 1
+"""The tag to try to give the next colour that is held by reference."""
+
+
+##############################################################################
+def _special_value(color: Color) -> int:
+    """Get the packed value of a colour that is held by reference.
+
+    Args:
+        color: The colour to get the value of.
+
+    Returns:
+        The packed value of the colour.
+
+    If [`SPECIAL_COLOURS`][textual_canvas.pixels.SPECIAL_COLOURS] colours
+    are already held, the one that was packed longest ago is let go of to
+    make room. A tag isn't given to another colour while its old colour
+    might still be in use, so the packed value of a colour that has been let
+    go of unpacks to no colour rather than to some other colour.
+    """
+    global _next_tag
+    try:
+        value = _special_values.pop(color)
+    except KeyError:
+        pass
+    else:
+        _special_values[color] = value
+        return value
+    if len(_special_values) >= SPECIAL_COLOURS:
+        del _special_colours[_special_values.pop(next(iter(_special_values))) >> 8]
+    tag = _next_tag
+    while tag in _special_colours:
+        tag = tag % (_TAGS - 1) + 1
+    _next_tag = tag % (_TAGS - 1) + 1
+    _special_colours[tag] = color
+    value = _special_values[color] = tag << 8
+    return value
+
+
+##############################################################################
+def pack_color(color: Color | None) -> int:
+    """Pack a colour into a single integer pixel value.
+
+    Args:
+        color: The colour to pack.
+
+    Returns:
+        The colour packed as a 32 bit RGBA value.
+
+    Packing [`None`][None] gives [`NO_COLOR`][textual_canvas.pixels.NO_COLOR],
+    as does packing any colour whose alpha packs to zero.
+
+    Colours that can't be described by their RGBA values alone, ANSI colours
+    and `auto` colours, are instead held by reference: they're given a
+    packed value whose alpha is zero and whose other 24 bits tag the colour,
+    so that they unpack to exactly the colour that was packed. Because of
+    this, every other packed value with an alpha of zero is reserved; all
+    of the ways of packing colours turn a zero alpha into
+    [`NO_COLOR`][textual_canvas.pixels.NO_COLOR].
+
+    Note:
+        The alpha component of the colour is held with 8 bits of
+        precision, so a colour that isn't fully opaque unpacks with its
+        alpha rounded to the nearest 255th; `Color(10, 20, 30, 0.5)`
+        unpacks as `Color(10, 20, 30, 128 / 255)`.
+    """
+    if color is None:
+        return NO_COLOR
+    red, green, blue, alpha, ansi, auto = color
+    if ansi is not None or auto:
+        return _special_value(color)
+    if opacity := round(alpha * 255):
+        return (red << 24) | (green << 16) | (blue << 8) | opacity
+    return NO_COLOR
+
+
+##############################################################################
+def unpack_color(value: int) -> Color | None:
+    """Unpack a pixel value into a colour.
+
+    Args:
+        value: The packed pixel value.
+
+    Returns:
+        The colour, or [`None`][None] if the value has no colour.
+    """
+    if not value & 0xFF:
+        return _special_colours.get(value >> 8)
+    return Color(
+        value >> 24, (value >> 16) & 0xFF, (value >> 8) & 0xFF, (value & 0xFF) / 255
+    )
+
+
+##############################################################################
+def end_of_run(pixels: array[int], start: int, end: int, run: array[int]) -> int:
+    """Find where a run of a pixel value ends.
+
+    Args:
+        pixels: The pixel values to look in.
+        start: Where the run starts.
+        end: Where to stop looking.
+        run: The value of the run, repeated at least `end - start` times.
+
+    Returns:
+        The location of the first pixel from `start` that isn't part of the
+            run, or `end` if the run goes all the way to `end`.
+
+    Rather than looking at one pixel at a time, ever longer slices of the
+    pixels are compared with the run, and then the slice that doesn't match
+    is narrowed down; this keeps the work within [`array`][array].
+    """
+    low, step = start, 1
+    while low < end:
+        high = min(low + step, end)
+        if pixels[low:high] != run[: high - low]:
+            break
+        low, step = high, step * 2
+    else:
+        return end
+    while high - low > 1:
+        middle = (low + high) // 2
+        if pixels[low:middle] == run[: middle - low]:
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+##############################################################################
+def end_of_corridor(
+    pixels: array[int], width: int, start: int, rows: int, step: int, run: array[int]
+) -> int:
+    """Find how far a corridor of a pixel value, one pixel wide, goes.
+
+    Args:
+        pixels: The pixel values to look in, `width` pixels to a row.
+        width: The width of a row of pixels.
+        start: Where the corridor starts.
+        rows: The most rows to follow the corridor for.
+        step: `1` to follow the corridor down, or `-1` to follow it up.
+        run: The value of the corridor, repeated at least `rows` times.
+
+    Returns:
+        The number of rows from `start` that hold the value of the run with
+            no pixel of that value either side of them.
+
+    As with [`end_of_run`][textual_canvas.pixels.end_of_run], ever more rows
+    of the column, and of the columns either side, are compared as slices
+    until they aren't a corridor, and then the rows that don't match are
+    looked in for where the corridor ends.
+    """
+    value, column = run[0], start % width
+    done, size = 0, 1
+    while done < rows:
+        size = min(size, rows - done)
+        top = start + done * step * width - (0 if step > 0 else (size - 1) * width)
+        bottom = top + size * width
+        middle = pixels[top:bottom:width]
+        lefts = pixels[top - 1 : bottom - 1 : width] if column else middle[:0]
+        rights = (
+            pixels[top + 1 : bottom + 1 : width] if column + 1 < width else middle[:0]
+        )
+        if middle == run[:size] and value not in lefts and value not in rights:
+            done, size = done + size, size * 2
+            continue
+        if step < 0:
+            middle, lefts, rights = middle[::-1], lefts[::-1], rights[::-1]
+        walled = end_of_run(middle, 0, size, run)
+        for side in (lefts, rights):
+            if value in side[:walled]:
+                walled = side.index(value)
+        return done + walled
+    return done
+
+
+##############################################################################
+def overlay(
+    target: array[int], offset: int, pixels: array[int], transparent: int
+) -> None:
+    """Copy the pixels that aren't transparent into an array of pixels.
+
+    Args:
+        target: The array of pixels to copy into.
+        offset: Where in the target to copy the pixels to.
+        pixels: The pixels to copy.
+        transparent: The value of the pixels that shouldn't be copied.
+
+    Each run of pixels that aren't transparent is copied as one slice.
+    """
+    end = len(pixels)
+    if transparent not in pixels:
+        target[offset : offset + end] = pixels
+        return
+    clear = array(pixels.typecode, [transparent]) * end
+    start = 0
+    while (start := end_of_run(pixels, start, end, clear)) < end:
+        try:
+            stop = pixels.index(transparent, start)
+        except ValueError:
+            stop = end
+        target[offset + start : offset + stop] = pixels[start:stop]
+        start = stop
+
+
+##############################################################################
+class PixelBuffer:
+    """A contiguous store of packed pixel values.
+
+    The pixels are held row after row in one [`array`][array], so the pixel
+    at `x`, `y` lives at index `y * width + x` of
+    [`data`][textual_canvas.pixels.PixelBuffer.data].
+
+    Normally each pixel is a [packed colour][textual_canvas.pixels.pack_color],
+    but a buffer made with a type code of
+    [`PALETTE_TYPE`][textual_canvas.pixels.PALETTE_TYPE] holds a one byte
+    palette index for each pixel.
+    """
+
+    __slots__ = ("width", "height", "data")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        value: int = NO_COLOR,
+        typecode: str = PIXEL_TYPE,
+    ) -> None:
+        """Initialise the buffer.
+
+        Args:
+            width: The width of the buffer in pixels.
+            height: The height of the buffer in pixels.
+            value: The packed value to initially fill the buffer with.
+            typecode: The [`array`][array] type code for the pixel values.
+        """
+        self.width = width
+        """The width of the buffer in pixels."""
+        self.height = height
+        """The height of the buffer in pixels."""
+        self.data = array(typecode, [value]) * (width * height)
+        """The packed pixel values."""
+
+    @property
+    def typecode(self) -> str:
+        """The [`array`][array] type code for the pixel values."""
+        return self.data.typecode
+
+    def empty(self) -> PixelBuffer:
+        """Make a buffer of the same size and type, with no colour.
+
+        Returns:
+            The new buffer.
+        """
+        return PixelBuffer(self.width, self.height, typecode=self.data.typecode)
+
+    def fill(self, value: int = NO_COLOR) -> None:
+        """Fill the whole buffer with a value.
+
+        Args:
+            value: The packed value to fill the buffer with.
+        """
+        self.data[:] = array(self.data.typecode, [value]) * len(self.data)
+
+    def copy_from(self, other: Pixels) -> None:
+        """Make the buffer a copy of another buffer of the same size.
+
+        Args:
+            other: The buffer to copy.
+        """
+        if isinstance(other, PixelBuffer):
+            self.data[:] = other.data
+        else:
+            for row in range(self.height):
+                self.set_row(row, 0, other.row(row))
+
+    def get(self, x: int, y: int) -> int:
+        """Get the packed value of a pixel.
+
+        Args:
+            x: The horizontal location of the pixel.
+            y: The vertical location of the pixel.
+
+        Returns:
+            The packed value of the pixel.
+
+        Note:
+            No bounds checking is performed.
+        """
+        return self.data[y * self.width + x]
+
+    def put(self, x: int, y: int, value: int) -> None:
+        """Set the packed value of a pixel.
+
+        Args:
+            x: The horizontal location of the pixel.
+            y: The vertical location of the pixel.
+            value: The packed value for the pixel.
+
+        Note:
+            No bounds checking is performed.
+        """
+        self.data[y * self.width + x] = value
+
+    def row(self, y: int, start: int = 0, end: int | None = None) -> array[int]:
+        """Get a copy of some or all of a row of packed pixel values.
+
+        Args:
+            y: The row to get.
+            start: The first column to get.
+            end: The column to stop at; defaults to the width of the buffer.
+
+        Returns:
+            The packed values of the row.
+
+        Note:
+            No bounds checking is performed.
+        """
+        offset = y * self.width
+        return self.data[offset + start : offset + (self.width if end is None else end)]
+
+    def set_row(self, y: int, start: int, pixels: array[int]) -> None:
+        """Set some of a row of packed pixel values.
+
+        Args:
+            y: The row to set.
+            start: The first column to set.
+            pixels: The packed values to set the row to.
+
+        Note:
+            No bounds checking is performed.
+        """
+        offset = y * self.width + start
+        self.data[offset : offset + len(pixels)] = pixels
+
+    def region(self, x: int, y: int, width: int, height: int) -> PixelBuffer:
+        """Get a copy of a rectangular block of the buffer.
+
+        Args:
+            x: Horizontal location of the top left corner of the block.
+            y: Vertical location of the top left corner of the block.
+            width: The width of the block.
+            height: The height of the block.
+
+        Returns:
+            A new buffer holding a copy of the block.
+
+        Any part of the block that is outwith the buffer is
+        [`NO_COLOR`][textual_canvas.pixels.NO_COLOR].
+        """
+        width, height = max(width, 0), max(height, 0)
+        block = PixelBuffer(width, height, NO_COLOR, self.data.typecode)
+        left, top = max(x, 0), max(y, 0)
+        right, bottom = min(x + width, self.width), min(y + height, self.height)
+        if left < right:
+            source, target = self.data, block.data
+            for row in range(top, bottom):
+                offset = row * self.width
+                block_offset = (row - y) * width - x
+                target[block_offset + left : block_offset + right] = source[
+                    offset + left : offset + right
+                ]
+        return block
+
+    def blit(
+        self, block: PixelBuffer, x: int, y: int, transparent: int | None = None
+    ) -> Region | None:
+        """Copy a block of pixels into the buffer.
+
+        Args:
+            block: The block of pixels to copy.
+            x: Horizontal location to place the top left corner of the block.
+            y: Vertical location to place the top left corner of the block.
+            transparent: An optional pixel value in the block to not copy.
+
+        Returns:
+            The region of the buffer that the block was copied to, or
+                [`None`][None] if it was wholly outwith the buffer.
+
+        Raises:
+            ValueError: If the block holds a different type of pixel value.
+
+        Each row of the block is copied as a single slice, or as one slice
+        for each run of pixels that aren't `transparent`. Any part of the
+        block that falls outwith the buffer is ignored.
+        """
+        if block.data.typecode != self.data.typecode:
+            raise ValueError(
+                f"Can't copy a block of type {block.data.typecode!r}"
+                f" into a buffer of type {self.data.typecode!r}"
+            )
+        left, top = max(x, 0), max(y, 0)
+        right = min(x + block.width, self.width)
+        bottom = min(y + block.height, self.height)
+        if left >= right or top >= bottom:
+            return None
+        source, target = block.data, self.data
+        for row in range(top, bottom):
+            block_offset = (row - y) * block.width - x
+            pixels = source[block_offset + left : block_offset + right]
+            offset = row * self.width + left
+            if transparent is None:
+                target[offset : offset + len(pixels)] = pixels
+            else:
+                overlay(target, offset, pixels, transparent)
+        return Region(left, top, right - left, bottom - top)
+
+    def shift(self, x: int, y: int, value: int = NO_COLOR) -> None:
+        """Shift the pixels of the buffer.
+
+        Args:
+            x: The number of pixels to shift right by; negative shifts left.
+            y: The number of pixels to shift down by; negative shifts up.
+            value: The packed value to fill the exposed pixels with.
+
+        Pixels shifted off the edge of the buffer are lost. All of the
+        pixels are moved in place, as one move of memory through a
+        [`memoryview`][memoryview] rather than by copying a slice, after
+        which the exposed rows are filled as one slice and the exposed
+        columns with one slice per row.
+        """
+        width, height, data = self.width, self.height, self.data
+        if abs(x) >= width or abs(y) >= height:
+            self.fill(value)
+            return
+        size = len(data)
+        with memoryview(data) as pixels:
+            if (offset := y * width + x) > 0:
+                pixels[offset:] = pixels[: size - offset]
+            elif offset < 0:
+                pixels[: size + offset] = pixels[-offset:]
+        blank = array(data.typecode, [value])
+        if y > 0:
+            data[: y * width] = blank * (y * width)
+        elif y < 0:
+            data[size + y * width :] = blank * (-y * width)
+        if x:
+            left = 0 if x > 0 else width + x
+            columns = blank * abs(x)
+            for row in range(0, size, width):
+                data[row + left : row + left + abs(x)] = columns
+
+    def resize(self, width: int, height: int, x: int = 0, y: int = 0) -> None:
+        """Change the size of the buffer, keeping its pixels.
+
+        Args:
+            width: The new width of the buffer in pixels.
+            height: The new height of the buffer in pixels.
+            x: Where the left edge of the old pixels goes in the new size.
+            y: Where the top edge of the old pixels goes in the new size.
+
+        Any of the old pixels that fall outwith the new size are lost, and
+        the new pixels have no colour. If the rows keep their width and
+        place, the buffer is only grown or shrunk at its ends; otherwise the
+        old pixels are copied into the new size one row at a time.
+        """
+        data, old_width, old_height = self.data, self.width, self.height
+        blank = array(data.typecode, [NO_COLOR])
+        if width == old_width and x == 0:
+            if y < 0:
+                del data[: -y * width]
+            elif y > 0:
+                data[0:0] = blank * (y * width)
+            if len(data) > (size := width * height):
+                del data[size:]
+            else:
+                data.extend(blank * (size - len(data)))
+        else:
+            resized = blank * (width * height)
+            left, right = max(x, 0), min(x + old_width, width)
+            if left < right:
+                for row in range(max(y, 0), min(y + old_height, height)):
+                    offset = row * width
+                    source = (row - y) * old_width - x
+                    resized[offset + left : offset + right] = data[
+                        source + left : source + right
+                    ]
+            self.data = resized
+        self.width, self.height = width, height
+
+    def changed_rows(self, other: Pixels) -> list[tuple[int, int]]:
+        """Find the rows that differ from those of another buffer.
+
+        Args:
+            other: The buffer to compare with, of the same size as this one.
+
+        Returns:
+            The runs of rows that differ, as the first row of each run and
+                the row after it ends.
+
+        Each row is compared as a single slice, keeping the work within
+        [`array`][array].
+        """
+        mine = self.data
+        theirs = other.data if isinstance(other, PixelBuffer) else None
+        if mine == theirs:
+            return []
+        width = self.width
+        runs: list[tuple[int, int]] = []
+        first: int | None = None
+        for row in range(self.height):
+            offset = row * width
+            if mine[offset : offset + width] != (
+                other.row(row) if theirs is None else theirs[offset : offset + width]
+            ):
+                if first is None:
+                    first = row
+            elif first is not None:
+                runs.append((first, row))
+                first = None
+        if first is not None:
+            runs.append((first, self.height))
+        return runs
+
+
+### pixels.py ends here
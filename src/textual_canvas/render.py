@@ -0,0 +1,296 @@
+"""Provides the rendering of pixels as lines of character cells.
+
+The [`Renderer`][textual_canvas.render.Renderer] is what the
+[`Canvas`][textual_canvas.canvas.Canvas] widget uses to turn its pixels
+into what is shown in the terminal, but it needs nothing more than some
+pixels and the colours to show them in; so it can also be used on its own,
+without a running application, to produce [`Strip`][textual.strip.Strip]s,
+Rich [`Segment`][rich.segment.Segment]s or ANSI text.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections.abc import Sequence
+from math import ceil
+
+##############################################################################
+# Rich imports.
+from rich.color import ColorSystem
+from rich.segment import Segment
+
+##############################################################################
+# Textual imports.
+from textual.color import Color
+from textual.geometry import Size
+from textual.strip import Strip
+
+##############################################################################
+# Local imports.
+from .layers import Composite
+from .segments import (
+    CELL_SIZES,
+    DEFAULT_CACHE_SIZE,
+    OUTSIDE,
+    PaletteSegmentCache,
+    RenderMode,
+    SegmentCache,
+    cell_runs,
+    runs_of,
+)
+from .tiles import Pixels
+
+
+##############################################################################
+def join_runs(strips: Sequence[Strip]) -> Strip:
+    """Join rendered strips into one.
+
+    Args:
+        strips: The strips to join, from left to right.
+
+    Returns:
+        The joined strip.
+
+    Each strip is expected to be made of runs of cells, as rendered by a
+    [`Renderer`][textual_canvas.render.Renderer]; where the runs either side
+    of a join share the same style they're merged into one run, so the
+    joined strip is made of runs too.
+    """
+    segments: list[Segment] = []
+    cell_length = 0
+    for strip in strips:
+        cell_length += strip.cell_length
+        runs = list(strip)
+        if segments and runs and segments[-1].style is runs[0].style:
+            text, style, _ = segments.pop()
+            runs[0] = Segment(text + runs[0].text, style)
+        segments.extend(runs)
+    return Strip(segments, cell_length)
+
+
+##############################################################################
+class Renderer:
+    """Renders pixels as lines of character cells.
+
+    The pixels to render can be a
+    [`PixelBuffer`][textual_canvas.pixels.PixelBuffer], a
+    [`TiledPixelBuffer`][textual_canvas.tiles.TiledPixelBuffer] or a
+    [`Composite`][textual_canvas.layers.Composite] of layers. Pixels that
+    have no colour are shown in the canvas colour, and the parts of cells
+    that are outwith the pixels are shown in the background colour.
+
+    Example:
+        ```python
+        pixels = PixelBuffer(40, 20)
+        ...
+        print(Renderer(Color(0, 0, 0)).ansi(pixels))
+        ```
+    """
+
+    def __init__(
+        self,
+        canvas_color: Color,
+        background_color: Color | None = None,
+        palette: Sequence[Color] | None = None,
+        render_mode: RenderMode = "half",
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Initialise the renderer.
+
+        Args:
+            canvas_color: The colour to show pixels that have no colour in.
+            background_color: The colour to show the area outwith the pixels
+                in; defaults to the canvas colour.
+            palette: The palette, if the pixel values are palette indexes.
+            render_mode: How the pixels are shown in the cells.
+            cache_size: The maximum number of segments to cache.
+
+        Raises:
+            ValueError: If the render mode isn't one that is known.
+        """
+        self._render_mode: RenderMode = "half"
+        """How the pixels are shown in the cells."""
+        self._cell_size = CELL_SIZES["half"]
+        """The number of pixels across and down each cell."""
+        self.render_mode = render_mode
+        self.segments: SegmentCache = (
+            SegmentCache(cache_size)
+            if palette is None
+            else PaletteSegmentCache(palette)
+        )
+        """The cache of segments the cells are built from."""
+        self.use_colours(canvas_color, background_color or canvas_color)
+
+    @property
+    def render_mode(self) -> RenderMode:
+        """How the pixels are shown in the cells.
+
+        See [`Canvas.set_render_mode`][textual_canvas.canvas.Canvas.set_render_mode]
+        for the render modes.
+
+        Raises:
+            ValueError: If the render mode being set isn't one that is known.
+        """
+        return self._render_mode
+
+    @render_mode.setter
+    def render_mode(self, render_mode: RenderMode) -> None:
+        if render_mode not in CELL_SIZES:
+            raise ValueError(f"{render_mode!r} is not a known render mode")
+        self._render_mode = render_mode
+        self._cell_size = CELL_SIZES[render_mode]
+
+    @property
+    def cell_size(self) -> tuple[int, int]:
+        """The number of pixels across and down each cell."""
+        return self._cell_size
+
+    def use_colours(self, canvas_color: Color, background_color: Color) -> None:
+        """Set the colours the pixels are shown in.
+
+        Args:
+            canvas_color: The colour to show pixels that have no colour in.
+            background_color: The colour to show the area outwith the pixels in.
+        """
+        self.segments.use_colours(canvas_color, background_color)
+
+    def size_of(self, width: int, height: int) -> Size:
+        """Get the size, in cells, needed to show an area of pixels.
+
+        Args:
+            width: The width of the area in pixels.
+            height: The height of the area in pixels.
+
+        Returns:
+            The size of the area in cells.
+        """
+        across, down = self._cell_size
+        return Size(ceil(width / across), ceil(height / down))
+
+    def line(
+        self,
+        pixels: Pixels | Composite,
+        y: int,
+        start: int = 0,
+        end: int | None = None,
+    ) -> list[Segment]:
+        """Render a line of cells.
+
+        Args:
+            pixels: The pixels to render.
+            y: The line of cells to render.
+            start: The first column of cells to render.
+            end: The column of cells to stop at; defaults to the last.
+
+        Returns:
+            The segments for the line, one segment per run of cells that
+            look the same; this is empty if the line is outwith the pixels.
+        """
+        across, down = self._cell_size
+        top = y * down
+        if not 0 <= top < (height := pixels.height):
+            return []
+
+        # Work out which columns of pixels are in view.
+        width = pixels.width
+        left = min(start * across, width)
+        right = width if end is None else min(end * across, width)
+
+        # Get the pixel values for each line that goes into the cells. It's
+        # possible that the lower lines might be outwith the pixels; so
+        # here we mark any such line as being outwith, so it'll be shown in
+        # the background colour, otherwise we use the line of pixels.
+        rows = [
+            [OUTSIDE] * (right - left)
+            if pixel_line >= height
+            else pixels.row(pixel_line, left, right)
+            for pixel_line in range(top, top + down)
+        ]
+
+        # At this point we know what pixels we're going to be mashing
+        # together into the line of cells. So let's get to it.
+        if across == 1:
+            return runs_of(self.segments, *rows)
+        return cell_runs(self.segments, rows, self._render_mode)
+
+    def strip(
+        self,
+        pixels: Pixels | Composite,
+        y: int,
+        start: int = 0,
+        end: int | None = None,
+    ) -> Strip:
+        """Render a line of cells as a strip.
+
+        Args:
+            pixels: The pixels to render.
+            y: The line of cells to render.
+            start: The first column of cells to render.
+            end: The column of cells to stop at; defaults to the last.
+
+        Returns:
+            The [`Strip`][textual.strip.Strip] for the line.
+        """
+        across, _ = self._cell_size
+        width = pixels.width
+        left = min(start * across, width)
+        right = width if end is None else min(end * across, width)
+        segments = self.line(pixels, y, start, end)
+        return Strip(segments, ceil((right - left) / across) if segments else 0)
+
+    def lines(self, pixels: Pixels | Composite) -> list[list[Segment]]:
+        """Render all the lines of cells needed to show some pixels.
+
+        Args:
+            pixels: The pixels to render.
+
+        Returns:
+            The segments for each line.
+        """
+        return [
+            self.line(pixels, y)
+            for y in range(self.size_of(pixels.width, pixels.height).height)
+        ]
+
+    def strips(self, pixels: Pixels | Composite) -> list[Strip]:
+        """Render all the lines of cells needed to show some pixels as strips.
+
+        Args:
+            pixels: The pixels to render.
+
+        Returns:
+            The [`Strip`][textual.strip.Strip] for each line.
+        """
+        return [
+            self.strip(pixels, y)
+            for y in range(self.size_of(pixels.width, pixels.height).height)
+        ]
+
+    def ansi(
+        self,
+        pixels: Pixels | Composite,
+        color_system: ColorSystem = ColorSystem.TRUECOLOR,
+    ) -> str:
+        """Render some pixels as ANSI text.
+
+        Args:
+            pixels: The pixels to render.
+            color_system: The colour system to use in the escape sequences.
+
+        Returns:
+            The pixels as text with ANSI escape sequences, one terminal line
+            per line of cells.
+        """
+        return "\n".join(
+            "".join(
+                text if style is None else style.render(text, color_system=color_system)
+                for text, style, _ in line
+            )
+            for line in self.lines(pixels)
+        )
+
+
+### render.py ends here
@@ -0,0 +1,451 @@
+"""Provides the building and caching of the segments used to show pixels."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import Final, Literal, TypeAlias
+
+##############################################################################
+# Rich imports.
+from rich.segment import Segment
+from rich.style import Style
+
+##############################################################################
+# Textual imports.
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from .pixels import NO_COLOR, pack_color, unpack_color
+
+##############################################################################
+CELL: Final[str] = "\u2584"
+"""The character to use to draw two pixels in one cell in the canvas."""
+
+OUTSIDE: Final[int] = -1
+"""Pseudo pixel value for a pixel that is outwith the canvas."""
+
+DEFAULT_CACHE_SIZE: Final[int] = 4096
+"""The default maximum number of segments held in a segment cache."""
+
+RenderMode: TypeAlias = Literal["half", "quadrant", "braille"]
+"""The type of the ways that pixels can be shown in the cells of a canvas."""
+
+CELL_SIZES: Final[dict[str, tuple[int, int]]] = {
+    "half": (1, 2),
+    "quadrant": (2, 2),
+    "braille": (2, 4),
+}
+"""The number of pixels across and down each cell for each render mode."""
+
+QUADRANTS: Final[tuple[str, ...]] = tuple(
+    " \u2598\u259d\u2580\u2596\u258c\u259e\u259b"
+    "\u2597\u259a\u2590\u259c\u2584\u2599\u259f\u2588"
+)
+"""The quadrant block characters, indexed by which quadrants are drawn.
+
+The bits of the index are `1` for the top left quadrant, `2` for the top
+right, `4` for the bottom left and `8` for the bottom right.
+"""
+
+QUADRANT_BITS: Final[tuple[int, ...]] = (1, 2, 4, 8)
+"""The bit for each pixel of a quadrant cell, in reading order."""
+
+BRAILLE: Final[tuple[str, ...]] = (" ", *(chr(0x2800 + bits) for bits in range(1, 256)))
+"""The braille characters, indexed by which dots are drawn.
+
+The bits of the index are those of the Unicode braille patterns, where
+the dots down the left are `1`, `2`, `4` and `64` and the dots down the
+right are `8`, `16`, `32` and `128`. A cell with no dots is a space.
+"""
+
+BRAILLE_BITS: Final[tuple[int, ...]] = (1, 8, 2, 16, 4, 32, 64, 128)
+"""The bit for each pixel of a braille cell, in reading order."""
+
+
+##############################################################################
+def segment_of(top: Color, bottom: Color) -> Segment:
+    """Construct a segment to show the two colours in one cell.
+
+    Args:
+        top: The colour for the top pixel.
+        bottom: The colour for the bottom pixel.
+
+    Returns:
+        A `Segment` that will display the two pixels.
+    """
+    return Segment(CELL, style=Style.from_color(bottom.rich_color, top.rich_color))
+
+
+##############################################################################
+@dataclass(frozen=True)
+class SegmentCacheStats:
+    """A snapshot of the statistics of a [`SegmentCache`][textual_canvas.segments.SegmentCache]."""
+
+    size: int
+    """The number of segments in the cache."""
+    maxsize: int
+    """The maximum number of segments the cache will hold."""
+    hits: int
+    """The number of times a segment was found in the cache."""
+    misses: int
+    """The number of times a segment had to be built."""
+    evictions: int
+    """The number of segments that were dropped to make room for others."""
+
+    @property
+    def hit_rate(self) -> float:
+        """The proportion of lookups that were found in the cache."""
+        return self.hits / lookups if (lookups := self.hits + self.misses) else 0.0
+
+
+##############################################################################
+class SegmentCache(dict[tuple[int, int], Segment]):
+    """A bounded cache of segments for pairs of packed pixel values.
+
+    The key is a pair of packed pixel values, the top pixel first and the
+    bottom pixel second; looking up a pair that isn't in the cache builds
+    the segment for it. When the cache is full the oldest segments are
+    dropped to make room.
+
+    The segments depend on the canvas and background colours, as those are
+    used to show pixels that have no colour of their own and pixels that
+    are outwith the canvas; if either colour changes the cache is emptied.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialise the segment cache.
+
+        Args:
+            maxsize: The maximum number of segments to hold.
+        """
+        super().__init__()
+        self._maxsize = max(maxsize, 1)
+        """The maximum number of segments to hold."""
+        self.canvas_colour = Color(0, 0, 0)
+        """The colour used for pixels that have no colour."""
+        self.background_colour = Color(0, 0, 0)
+        """The colour used for pixels outwith the canvas."""
+        self.lookups = 0
+        """The number of lookups made in the cache."""
+        self._misses = 0
+        """The number of lookups that had to build a segment."""
+        self._evictions = 0
+        """The number of segments dropped to make room."""
+        self._palette: list[int] = []
+        """The packed values of the palette the cache was warmed with."""
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of segments the cache will hold.
+
+        Reducing this drops the oldest segments if the cache is over the
+        new size.
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        self._maxsize = max(maxsize, 1)
+        self._make_room(0)
+
+    @property
+    def stats(self) -> SegmentCacheStats:
+        """A snapshot of the statistics for the cache."""
+        return SegmentCacheStats(
+            size=len(self),
+            maxsize=self._maxsize,
+            hits=self.lookups - self._misses,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+    def reset_stats(self) -> None:
+        """Reset the statistics for the cache."""
+        self.lookups = self._misses = self._evictions = 0
+
+    def use_colours(self, canvas_colour: Color, background_colour: Color) -> None:
+        """Set the colours that the segments are built with.
+
+        Args:
+            canvas_colour: The colour used for pixels that have no colour.
+            background_colour: The colour used for pixels outwith the canvas.
+
+        If either colour differs from those currently in use, the cache is
+        emptied and then warmed again with any palette it was warmed with.
+        """
+        if (
+            canvas_colour != self.canvas_colour
+            or background_colour != self.background_colour
+        ):
+            self.canvas_colour = canvas_colour
+            self.background_colour = background_colour
+            self.clear()
+            self._warm()
+
+    def warm(self, palette: Iterable[Color]) -> None:
+        """Warm the cache with every pairing of the colours in a palette.
+
+        Args:
+            palette: The colours to warm the cache with.
+
+        The segments for every pair of colours in the palette are built,
+        along with the pairings of those colours with pixels that have no
+        colour and with pixels that are outwith the canvas. The palette is
+        remembered, so the cache is warmed again if the canvas or background
+        colours change.
+        """
+        self._palette = list(
+            dict.fromkeys([NO_COLOR, *(pack_color(colour) for colour in palette)])
+        )
+        self._warm()
+
+    def _warm(self) -> None:
+        """Warm the cache with the remembered palette."""
+        palette = self._palette
+        for pair in (*product(palette, palette), *product(palette, (OUTSIDE,))):
+            if pair not in self:
+                self._add(pair)
+
+    def _colour(self, value: int) -> Color:
+        """Get the colour to show for a packed pixel value.
+
+        Args:
+            value: The packed pixel value.
+
+        Returns:
+            The colour to show.
+        """
+        if value == OUTSIDE:
+            return self.background_colour
+        return unpack_color(value) or self.canvas_colour
+
+    def _make_room(self, needed: int) -> None:
+        """Drop the oldest segments to make room for new ones.
+
+        Args:
+            needed: The number of segments that need room.
+        """
+        while self and len(self) + needed > self._maxsize:
+            del self[next(iter(self))]
+            self._evictions += 1
+
+    def _add(self, pair: tuple[int, int]) -> Segment:
+        """Build and add the segment for a pair of pixel values.
+
+        Args:
+            pair: The pair of packed pixel values.
+
+        Returns:
+            The segment for the pair.
+        """
+        self._make_room(1)
+        top, bottom = pair
+        segment = self[pair] = segment_of(self._colour(top), self._colour(bottom))
+        return segment
+
+    def __missing__(self, pair: tuple[int, int]) -> Segment:
+        self._misses += 1
+        return self._add(pair)
+
+
+##############################################################################
+class PaletteSegmentCache(SegmentCache):
+    """A table of segments for every pair of palette indexes.
+
+    Pixel values in the table are palette indexes, where `0` is a pixel
+    with no colour and `n` is the colour at `n - 1` in the palette, along
+    with `OUTSIDE` for a pixel outwith the canvas, which can be on either
+    side of a pair. The table is built in full up front, and again whenever
+    the palette or the canvas or background colours change.
+    """
+
+    def __init__(self, palette: Sequence[Color]) -> None:
+        """Initialise the segment table.
+
+        Args:
+            palette: The colours of the palette.
+        """
+        self._colours: tuple[Color, ...] = ()
+        """The colours of the palette."""
+        super().__init__()
+        self.palette = palette
+
+    @property
+    def palette(self) -> tuple[Color, ...]:
+        """The colours of the palette.
+
+        Setting the palette rebuilds the table.
+        """
+        return self._colours
+
+    @palette.setter
+    def palette(self, palette: Sequence[Color]) -> None:
+        self._colours = tuple(palette)
+        self.maxsize = (len(palette) + 2) ** 2
+        self.clear()
+        self._warm()
+
+    def _warm(self) -> None:
+        """Build the whole table."""
+        values = (*range(len(self._colours) + 1), OUTSIDE)
+        for pair in product(values, values):
+            self._add(pair)
+
+    def _colour(self, value: int) -> Color:
+        """Get the colour to show for a palette index.
+
+        Args:
+            value: The palette index.
+
+        Returns:
+            The colour to show.
+        """
+        if value == OUTSIDE:
+            return self.background_colour
+        if 0 < value <= len(self._colours):
+            return self._colours[value - 1]
+        return self.canvas_colour
+
+
+##############################################################################
+def runs_of(
+    segments: SegmentCache, top: Iterable[int], bottom: Iterable[int]
+) -> list[Segment]:
+    """Build the segments for two rows of pixels, one segment per run of pixels.
+
+    Args:
+        segments: The cache of segments to build from.
+        top: The packed values of the top row of pixels.
+        bottom: The packed values of the bottom row of pixels.
+
+    Returns:
+        The segments, where each segment shows a run of cells that have the
+        same top and bottom pixel values.
+    """
+    runs: list[Segment] = []
+    add_run = runs.append
+    pairs = zip(top, bottom, strict=True)
+    if (last := next(pairs, None)) is None:
+        return runs
+    length = 1
+    for pair in pairs:
+        if pair == last:
+            length += 1
+        else:
+            segment = segments[last]
+            add_run(segment if length == 1 else Segment(CELL * length, segment.style))
+            last = pair
+            length = 1
+    segment = segments[last]
+    add_run(segment if length == 1 else Segment(CELL * length, segment.style))
+    segments.lookups += len(runs)
+    return runs
+
+
+##############################################################################
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def quadrant_cell(pixels: tuple[int, ...]) -> tuple[str, int, int]:
+    """Work out how to show the four pixels of a quadrant cell.
+
+    Args:
+        pixels: The values of the pixels of the cell, in reading order.
+
+    Returns:
+        The character for the cell, and the values of the pixels to use for
+            its background and foreground colours.
+
+    A cell can only show two colours. The background is the most common
+    value in the cell and the foreground is the most common of the rest,
+    with ties going to whichever comes first in reading order. Any pixel
+    that isn't the background value is drawn in the foreground colour.
+    """
+    (background, _), *others = Counter(pixels).most_common()
+    foreground = others[0][0] if others else background
+    mask = sum(
+        bit
+        for bit, value in zip(QUADRANT_BITS, pixels, strict=True)
+        if value != background
+    )
+    return QUADRANTS[mask], background, foreground
+
+
+##############################################################################
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def braille_cell(pixels: tuple[int, ...]) -> tuple[str, int, int]:
+    """Work out how to show the eight pixels of a braille cell.
+
+    Args:
+        pixels: The values of the pixels of the cell, in reading order.
+
+    Returns:
+        The character for the cell, and the values of the pixels to use for
+            its background and foreground colours.
+
+    Every pixel that has a colour is a dot. The dots are all drawn in one
+    colour, the most common colour of the dots in the cell, with ties
+    going to whichever comes first in reading order. The background is
+    always the canvas colour.
+    """
+    dots = [value != NO_COLOR and value != OUTSIDE for value in pixels]
+    if not any(dots):
+        return BRAILLE[0], NO_COLOR, NO_COLOR
+    ((foreground, _),) = Counter(
+        value for value, dot in zip(pixels, dots, strict=True) if dot
+    ).most_common(1)
+    mask = sum(bit for bit, dot in zip(BRAILLE_BITS, dots, strict=True) if dot)
+    return BRAILLE[mask], NO_COLOR, foreground
+
+
+##############################################################################
+def cell_runs(
+    segments: SegmentCache, rows: Sequence[Sequence[int]], mode: RenderMode
+) -> list[Segment]:
+    """Build the segments for the rows of pixels shown in a line of cells.
+
+    Args:
+        segments: The cache of segments to take the styles from.
+        rows: The packed values of the rows of pixels, as many as there are
+            pixels down a cell.
+        mode: The render mode, which must be one with two pixels across
+            each cell.
+
+    Returns:
+        The segments, where each segment shows a run of cells that have the
+        same background and foreground colours.
+
+    A row with an odd number of pixels is treated as if it had one more
+    pixel, outwith the canvas.
+    """
+    cell_of = quadrant_cell if mode == "quadrant" else braille_cell
+    columns: list[Sequence[int]] = []
+    for row in rows:
+        left, right = row[0::2], row[1::2]
+        columns += (left, right if len(right) == len(left) else [*right, OUTSIDE])
+    runs: list[Segment] = []
+    add_run = runs.append
+    glyphs: list[str] = []
+    last: tuple[int, int] | None = None
+    for pixels in zip(*columns, strict=True):
+        glyph, background, foreground = cell_of(pixels)
+        if (pair := (background, foreground)) != last:
+            if last is not None:
+                add_run(Segment("".join(glyphs), segments[last].style))
+            glyphs = []
+            last = pair
+        glyphs.append(glyph)
+    if last is not None:
+        add_run(Segment("".join(glyphs), segments[last].style))
+    segments.lookups += len(runs)
+    return runs
+
+
+### segments.py ends here
@@ -0,0 +1,137 @@
+"""Provides sprites, blocks of pixels that move around on top of a canvas."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Textual imports.
+from textual.geometry import Region
+
+##############################################################################
+# Local imports.
+from .layers import Layer
+from .pixels import PixelBuffer
+from .tiles import Pixels
+
+
+##############################################################################
+class Sprite:
+    """A block of pixels that can be moved around on top of a canvas.
+
+    Sprites are made with
+    [`Canvas.add_sprite`][textual_canvas.canvas.Canvas.add_sprite], moved
+    with [`Canvas.move_sprite`][textual_canvas.canvas.Canvas.move_sprite]
+    and taken off the canvas with
+    [`Canvas.remove_sprite`][textual_canvas.canvas.Canvas.remove_sprite].
+
+    When a sprite is drawn, the pixels of the canvas that it covers are
+    saved, and they are put back when the sprite moves or is removed.
+
+    The location of a sprite should only be changed with
+    [`Canvas.move_sprite`][textual_canvas.canvas.Canvas.move_sprite].
+    """
+
+    __slots__ = ("block", "x", "y", "transparent", "layer", "_under", "_drawn_at")
+
+    def __init__(
+        self,
+        block: PixelBuffer,
+        x: int,
+        y: int,
+        transparent: int | None,
+        layer: Layer,
+    ) -> None:
+        """Initialise the sprite.
+
+        Args:
+            block: The pixels of the sprite.
+            x: Horizontal location of the top left corner of the sprite.
+            y: Vertical location of the top left corner of the sprite.
+            transparent: The pixel value in the block that isn't drawn.
+            layer: The layer the sprite is drawn on.
+        """
+        self.block = block
+        """The pixels of the sprite."""
+        self.x = x
+        """Horizontal location of the top left corner of the sprite."""
+        self.y = y
+        """Vertical location of the top left corner of the sprite."""
+        self.transparent = transparent
+        """The pixel value in the block that isn't drawn, if there is one."""
+        self.layer = layer
+        """The layer the sprite is drawn on."""
+        self._under: PixelBuffer | None = None
+        """The pixels that were under the sprite when it was drawn."""
+        self._drawn_at = (x, y)
+        """Where the sprite was when it was drawn."""
+
+    @property
+    def region(self) -> Region:
+        """The region of the canvas that the sprite covers."""
+        return Region(self.x, self.y, self.block.width, self.block.height)
+
+    @property
+    def changed(self) -> bool:
+        """Has the sprite changed since it was drawn?
+
+        A sprite that isn't drawn is always considered to have changed.
+        """
+        return self._under is None or self._drawn_at != (self.x, self.y)
+
+    @property
+    def drawn_region(self) -> Region | None:
+        """The region of the canvas the sprite covered when it was drawn.
+
+        This is [`None`][None] if the sprite isn't drawn.
+        """
+        if self._under is None:
+            return None
+        return Region(*self._drawn_at, self.block.width, self.block.height)
+
+    def draw(self) -> Region | None:
+        """Draw the sprite on its layer, saving the pixels it covers.
+
+        Returns:
+            The region of the layer that changed, or [`None`][None] if the
+                sprite is wholly outwith the layer.
+        """
+        buffer, block, x, y = self.layer.pixels, self.block, self.x, self.y
+        self._under = buffer.region(x, y, block.width, block.height)
+        self._drawn_at = (x, y)
+        return buffer.blit(block, x, y, self.transparent)
+
+    def undraw(self) -> Region | None:
+        """Put back the pixels that the sprite covered when it was drawn.
+
+        Returns:
+            The region of the layer that changed, or [`None`][None] if
+                nothing changed.
+        """
+        if (under := self._under) is None:
+            return None
+        self._under = None
+        return self.layer.pixels.blit(under, *self._drawn_at)
+
+    def uncover(self, buffer: Pixels) -> None:
+        """Put the pixels that the sprite covered into another buffer.
+
+        Args:
+            buffer: The buffer to put the pixels into.
+
+        This takes the sprite out of a copy of its layer; the sprite is
+        left drawn on the layer itself.
+        """
+        if self._under is not None:
+            buffer.blit(self._under, *self._drawn_at)
+
+    def forget(self) -> None:
+        """Forget the pixels that the sprite covered when it was drawn.
+
+        This is for when whatever was under the sprite has been replaced,
+        such as when its layer is cleared.
+        """
+        self._under = None
+
+
+### sprites.py ends here
@@ -0,0 +1,340 @@
+"""Provides drawing on a canvas from threads other than the application's.
+
+The [`Canvas`][textual_canvas.canvas.Canvas] is a widget, and like all
+widgets it must only be drawn on from the thread that runs the
+application. A [`DrawingQueue`][textual_canvas.threads.DrawingQueue] lets a
+worker thread do the hard work of deciding what to draw, queueing up the
+drawing so that the application's thread can draw it on the canvas in
+batches, once per frame.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from time import perf_counter
+from types import TracebackType
+from typing import TYPE_CHECKING, TypeAlias
+
+##############################################################################
+# Textual imports.
+from textual.color import Color
+
+##############################################################################
+# Typing extension imports.
+from typing_extensions import Self
+
+##############################################################################
+# Local imports.
+from .animation import Animation, AnimationStats
+
+##############################################################################
+# Type checking imports.
+if TYPE_CHECKING:
+    from .canvas import Canvas
+
+##############################################################################
+DrawingOperation: TypeAlias = Callable[["Canvas"], object]
+"""The type of an operation queued to be drawn on a canvas.
+
+It is called, on the application's thread, with the canvas to draw on.
+"""
+
+
+##############################################################################
+class DrawingQueue:
+    """A thread-safe queue of drawing for a canvas.
+
+    Drawing queues are made with
+    [`Canvas.queue_drawing`][textual_canvas.canvas.Canvas.queue_drawing],
+    on the application's thread, and can then be handed to a worker thread.
+    The drawing methods of the queue are safe to call from any thread; they
+    don't draw on the canvas, they queue the drawing up to be done. At each
+    frame the application's thread takes drawing from the queue, in the
+    order it was queued, and draws it on the canvas as a batch; so the
+    canvas is refreshed at most once per frame however much is drawn.
+
+    Each frame only spends so long drawing before it leaves the rest of
+    the queue for the next frame, so that the application stays responsive
+    however much drawing the worker queues up.
+
+    Closing the queue, which can also be done from any thread, tells it
+    that nothing more will be queued; once everything that was queued has
+    been drawn the queue stops.
+
+    Example:
+        ```python
+        @work(thread=True)
+        def draw(self, queue: DrawingQueue) -> None:
+            with queue:
+                for y in range(height):
+                    queue.set_row(y, [colour_of(x, y) for x in range(width)])
+        ...
+        self.draw(self.query_one(Canvas).queue_drawing())
+        ```
+    """
+
+    def __init__(self, canvas: Canvas, budget: float | None = None) -> None:
+        """Initialise the drawing queue.
+
+        Args:
+            canvas: The canvas to draw on.
+            budget: The time, in seconds, to spend drawing each frame;
+                defaults to half of the time between frames.
+        """
+        self._canvas = canvas
+        """The canvas to draw on."""
+        self._budget = budget
+        """The time, in seconds, to spend drawing each frame, if set."""
+        self._operations: deque[DrawingOperation] = deque()
+        """The drawing waiting to be done.
+
+        Appending to, and popping from, opposite ends of a deque are atomic,
+        so the deque needs no lock to be shared between threads.
+        """
+        self._closed = False
+        """Has the queue been closed?"""
+        self._animation: Animation | None = None
+        """The animation that draws the queue, once it has been started."""
+
+    def start(self, animation: Animation) -> None:
+        """Start drawing the queue.
+
+        Args:
+            animation: The animation that draws the queue at each frame.
+        """
+        self._animation = animation
+
+    def stop(self) -> None:
+        """Stop drawing the queue, throwing away any drawing not yet done.
+
+        This must be called from the application's thread.
+        """
+        if self._animation is not None:
+            self._animation.stop()
+        self._operations.clear()
+        self._closed = True
+
+    @property
+    def running(self) -> bool:
+        """Is the queue still being drawn?"""
+        return self._animation is not None and self._animation.running
+
+    @property
+    def closed(self) -> bool:
+        """Has the queue been closed?"""
+        return self._closed
+
+    @property
+    def pending(self) -> int:
+        """The number of drawing operations waiting to be drawn."""
+        return len(self._operations)
+
+    @property
+    def stats(self) -> AnimationStats | None:
+        """The statistics for the frames the queue has been drawn in.
+
+        This is [`None`][None] if the queue hasn't been started.
+        """
+        return None if self._animation is None else self._animation.stats
+
+    def close(self) -> None:
+        """Close the queue.
+
+        Once closed nothing more can be queued; the queue stops when all of
+        the drawing that has already been queued has been drawn.
+        """
+        self._closed = True
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def call(self, operation: DrawingOperation) -> Self:
+        """Queue an operation to be drawn on the canvas.
+
+        Args:
+            operation: The operation to queue.
+
+        Returns:
+            The drawing queue.
+
+        Raises:
+            RuntimeError: If the queue has been closed.
+
+        The operation is called with the canvas, on the application's
+        thread, so it can use any of the methods of the canvas.
+
+        Example:
+            ```python
+            queue.call(lambda canvas: canvas.flood_fill(10, 10, RED))
+            ```
+        """
+        if self._closed:
+            raise RuntimeError("Drawing can't be queued once the queue is closed")
+        self._operations.append(operation)
+        return self
+
+    def set_pixel(self, x: int, y: int, color: Color | None = None) -> Self:
+        """Queue setting the colour of a specific pixel on the canvas.
+
+        Args:
+            x: The horizontal location of the pixel.
+            y: The vertical location of the pixel.
+            color: The optional colour to set the pixel to.
+
+        Returns:
+            The drawing queue.
+
+        See [`Canvas.set_pixel`][textual_canvas.canvas.Canvas.set_pixel].
+        """
+        return self.call(lambda canvas: canvas.set_pixel(x, y, color))
+
+    def set_pixels(
+        self, locations: Iterable[tuple[int, int]], color: Color | None = None
+    ) -> Self:
+        """Queue setting the colour of a collection of pixels on the canvas.
+
+        Args:
+            locations: An iterable of tuples of x and y location.
+            color: The optional colour to set the pixels to.
+
+        Returns:
+            The drawing queue.
+
+        See [`Canvas.set_pixels`][textual_canvas.canvas.Canvas.set_pixels].
+        """
+        pixels = list(locations)
+        return self.call(lambda canvas: canvas.set_pixels(pixels, color))
+
+    def set_row(self, y: int, colors: Sequence[Color], x: int = 0) -> Self:
+        """Queue setting the colours of a run of pixels along a row of the canvas.
+
+        Args:
+            y: The row of the pixels.
+            colors: The colour of each pixel, from left to right.
+            x: The horizontal location of the first pixel.
+
+        Returns:
+            The drawing queue.
+
+        Pixels of the run that fall outwith the canvas are ignored. Queueing
+        whole rows, rather than single pixels, is much the quicker way to
+        hand a large amount of drawing over to the application's thread.
+        """
+        pixels = list(colors)
+        return self.call(
+            lambda canvas: canvas.set_points(
+                range(x, x + len(pixels)), [y] * len(pixels), colors=pixels, clip=True
+            )
+        )
+
+    def draw_line(
+        self, x0: int, y0: int, x1: int, y1: int, color: Color | None = None
+    ) -> Self:
+        """Queue drawing a line between two points.
+
+        Args:
+            x0: Horizontal location of the starting position.
+            y0: Vertical location of the starting position.
+            x1: Horizontal location of the ending position.
+            y1: Vertical location of the ending position.
+            color: The color to draw the line in.
+
+        Returns:
+            The drawing queue.
+
+        See [`Canvas.draw_line`][textual_canvas.canvas.Canvas.draw_line].
+        """
+        return self.call(lambda canvas: canvas.draw_line(x0, y0, x1, y1, color))
+
+    def fill_rectangle(
+        self, x: int, y: int, width: int, height: int, color: Color | None = None
+    ) -> Self:
+        """Queue drawing a filled rectangle.
+
+        Args:
+            x: Horizontal location of the top left corner of the rectangle.
+            y: Vertical location of the top left corner of the rectangle.
+            width: The width of the rectangle.
+            height: The height of the rectangle.
+            color: The color to fill the rectangle with.
+
+        Returns:
+            The drawing queue.
+
+        See [`Canvas.fill_rectangle`][textual_canvas.canvas.Canvas.fill_rectangle].
+        """
+        return self.call(
+            lambda canvas: canvas.fill_rectangle(x, y, width, height, color)
+        )
+
+    def clear(self, color: Color | None = None) -> Self:
+        """Queue clearing the canvas.
+
+        Args:
+            color: Optional default colour for the canvas.
+
+        Returns:
+            The drawing queue.
+
+        See [`Canvas.clear`][textual_canvas.canvas.Canvas.clear].
+        """
+        return self.call(lambda canvas: canvas.clear(color))
+
+    def drain(self, budget: float | None = None) -> int:
+        """Draw the queued drawing on the canvas.
+
+        Args:
+            budget: The time, in seconds, to spend drawing; by default
+                everything that is queued is drawn.
+
+        Returns:
+            The number of drawing operations that were drawn.
+
+        This must be called from the application's thread. The drawing is
+        done as a batch, so the canvas is refreshed once at the end.
+        """
+        operations = self._operations
+        canvas = self._canvas
+        drawn = 0
+        stop_at = None if budget is None else perf_counter() + budget
+        with canvas.batch_refresh():
+            while operations:
+                operations.popleft()(canvas)
+                drawn += 1
+                if stop_at is not None and perf_counter() >= stop_at:
+                    break
+        return drawn
+
+    def frame(self, elapsed: float = 0) -> None:
+        """Draw a frame's worth of the queued drawing on the canvas.
+
+        Args:
+            elapsed: The time, in seconds, since the queue was started.
+        """
+        # Note if the queue was closed before draining it; anything queued
+        # before it was closed will then be drawn by the drain, so if the
+        # queue ends up empty nothing more will come.
+        closed = self._closed
+        animation = self._animation
+        budget = self._budget
+        if budget is None and animation is not None:
+            budget = animation.interval / 2
+        self.drain(budget)
+        if closed and not self._operations and animation is not None:
+            animation.stop()
+
+
+### threads.py ends here
@@ -0,0 +1,428 @@
+"""Provides sparse storage for the pixels of very large canvases."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from array import array
+from typing import Final, TypeAlias
+
+##############################################################################
+# Textual imports.
+from textual.geometry import Region
+
+##############################################################################
+# Local imports.
+from .pixels import NO_COLOR, PIXEL_TYPE, PixelBuffer, overlay
+
+##############################################################################
+DEFAULT_TILE_SIZE: Final[int] = 64
+"""The default width and height of a tile, in pixels."""
+
+
+##############################################################################
+class TiledPixelBuffer:
+    """A sparse store of packed pixel values, held in square tiles.
+
+    A tile is only allocated when a pixel within it is first set to
+    something other than the value the buffer was filled with, so the
+    memory used grows with the area that has been drawn on rather than
+    with the size of the buffer.
+
+    The tile at `tx`, `ty` covers the pixels from `tx * tile_size`,
+    `ty * tile_size`, and holds them row after row in one
+    [`array`][array].
+    """
+
+    __slots__ = ("width", "height", "typecode", "tile_size", "tiles", "blank")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        value: int = NO_COLOR,
+        typecode: str = PIXEL_TYPE,
+        tile_size: int = DEFAULT_TILE_SIZE,
+    ) -> None:
+        """Initialise the buffer.
+
+        Args:
+            width: The width of the buffer in pixels.
+            height: The height of the buffer in pixels.
+            value: The packed value to initially fill the buffer with.
+            typecode: The [`array`][array] type code for the pixel values.
+            tile_size: The width and height of each tile in pixels.
+        """
+        self.width = width
+        """The width of the buffer in pixels."""
+        self.height = height
+        """The height of the buffer in pixels."""
+        self.typecode = typecode
+        """The [`array`][array] type code for the pixel values."""
+        self.tile_size = max(tile_size, 1)
+        """The width and height of each tile in pixels."""
+        self.tiles: dict[tuple[int, int], array[int]] = {}
+        """The tiles that have been allocated, keyed by their location."""
+        self.blank = value
+        """The value of every pixel in a tile that hasn't been allocated."""
+
+    def empty(self) -> TiledPixelBuffer:
+        """Make a buffer of the same size and type, with no colour.
+
+        Returns:
+            The new buffer.
+        """
+        return TiledPixelBuffer(
+            self.width, self.height, typecode=self.typecode, tile_size=self.tile_size
+        )
+
+    def _new_tile(self) -> array[int]:
+        """Make a tile filled with the blank value.
+
+        Returns:
+            The pixels of the tile.
+        """
+        return array(self.typecode, [self.blank]) * (self.tile_size * self.tile_size)
+
+    def fill(self, value: int = NO_COLOR) -> None:
+        """Fill the whole buffer with a value.
+
+        Args:
+            value: The packed value to fill the buffer with.
+
+        All of the tiles are released.
+        """
+        self.tiles.clear()
+        self.blank = value
+
+    def copy_from(self, other: Pixels) -> None:
+        """Make the buffer a copy of another buffer of the same size.
+
+        Args:
+            other: The buffer to copy.
+        """
+        if isinstance(other, TiledPixelBuffer) and other.tile_size == self.tile_size:
+            self.tiles = {key: tile[:] for key, tile in other.tiles.items()}
+            self.blank = other.blank
+        else:
+            self.fill()
+            for row in range(self.height):
+                self.set_row(row, 0, other.row(row))
+
+    def get(self, x: int, y: int) -> int:
+        """Get the packed value of a pixel.
+
+        Args:
+            x: The horizontal location of the pixel.
+            y: The vertical location of the pixel.
+
+        Returns:
+            The packed value of the pixel.
+
+        Note:
+            No bounds checking is performed.
+        """
+        size = self.tile_size
+        if (tile := self.tiles.get((x // size, y // size))) is None:
+            return self.blank
+        return tile[(y % size) * size + x % size]
+
+    def put(self, x: int, y: int, value: int) -> None:
+        """Set the packed value of a pixel.
+
+        Args:
+            x: The horizontal location of the pixel.
+            y: The vertical location of the pixel.
+            value: The packed value for the pixel.
+
+        Note:
+            No bounds checking is performed.
+        """
+        size = self.tile_size
+        key = (x // size, y // size)
+        if (tile := self.tiles.get(key)) is None:
+            if value == self.blank:
+                return
+            tile = self.tiles[key] = self._new_tile()
+        tile[(y % size) * size + x % size] = value
+
+    def row(self, y: int, start: int = 0, end: int | None = None) -> array[int]:
+        """Get a copy of some or all of a row of packed pixel values.
+
+        Args:
+            y: The row to get.
+            start: The first column to get.
+            end: The column to stop at; defaults to the width of the buffer.
+
+        Returns:
+            The packed values of the row.
+
+        Note:
+            No bounds checking is performed.
+        """
+        end = self.width if end is None else end
+        size, tiles = self.tile_size, self.tiles
+        tile_y, offset = divmod(y, size)
+        offset *= size
+        pixels = array(self.typecode)
+        blank = array(self.typecode, [self.blank])
+        column = start
+        while column < end:
+            tile_x, inner = divmod(column, size)
+            stop = min(end, (tile_x + 1) * size)
+            if (tile := tiles.get((tile_x, tile_y))) is None:
+                pixels += blank * (stop - column)
+            else:
+                pixels += tile[offset + inner : offset + inner + stop - column]
+            column = stop
+        return pixels
+
+    def set_row(self, y: int, start: int, pixels: array[int]) -> None:
+        """Set some of a row of packed pixel values.
+
+        Args:
+            y: The row to set.
+            start: The first column to set.
+            pixels: The packed values to set the row to.
+
+        Tiles that would only be given blank values aren't allocated.
+
+        Note:
+            No bounds checking is performed.
+        """
+        size, tiles = self.tile_size, self.tiles
+        tile_y, offset = divmod(y, size)
+        offset *= size
+        blank = array(self.typecode, [self.blank])
+        column, end = start, start + len(pixels)
+        while column < end:
+            tile_x, inner = divmod(column, size)
+            stop = min(end, (tile_x + 1) * size)
+            chunk = pixels[column - start : stop - start]
+            if (tile := tiles.get((tile_x, tile_y))) is None:
+                if chunk == blank * len(chunk):
+                    column = stop
+                    continue
+                tile = tiles[tile_x, tile_y] = self._new_tile()
+            tile[offset + inner : offset + inner + len(chunk)] = chunk
+            column = stop
+
+    def region(self, x: int, y: int, width: int, height: int) -> PixelBuffer:
+        """Get a copy of a rectangular block of the buffer.
+
+        Args:
+            x: Horizontal location of the top left corner of the block.
+            y: Vertical location of the top left corner of the block.
+            width: The width of the block.
+            height: The height of the block.
+
+        Returns:
+            A new, contiguous, buffer holding a copy of the block.
+
+        Any part of the block that is outwith the buffer is
+        [`NO_COLOR`][textual_canvas.pixels.NO_COLOR].
+        """
+        width, height = max(width, 0), max(height, 0)
+        block = PixelBuffer(width, height, NO_COLOR, self.typecode)
+        left, top = max(x, 0), max(y, 0)
+        right, bottom = min(x + width, self.width), min(y + height, self.height)
+        if left < right:
+            for row in range(top, bottom):
+                offset = (row - y) * width - x
+                block.data[offset + left : offset + right] = self.row(row, left, right)
+        return block
+
+    def blit(
+        self, block: PixelBuffer, x: int, y: int, transparent: int | None = None
+    ) -> Region | None:
+        """Copy a block of pixels into the buffer.
+
+        Args:
+            block: The block of pixels to copy.
+            x: Horizontal location to place the top left corner of the block.
+            y: Vertical location to place the top left corner of the block.
+            transparent: An optional pixel value in the block to not copy.
+
+        Returns:
+            The region of the buffer that the block was copied to, or
+                [`None`][None] if it was wholly outwith the buffer.
+
+        Raises:
+            ValueError: If the block holds a different type of pixel value.
+        """
+        if block.typecode != self.typecode:
+            raise ValueError(
+                f"Can't copy a block of type {block.typecode!r}"
+                f" into a buffer of type {self.typecode!r}"
+            )
+        left, top = max(x, 0), max(y, 0)
+        right = min(x + block.width, self.width)
+        bottom = min(y + block.height, self.height)
+        if left >= right or top >= bottom:
+            return None
+        for row in range(top, bottom):
+            offset = (row - y) * block.width - x
+            pixels = block.data[offset + left : offset + right]
+            if transparent is not None:
+                target = self.row(row, left, right)
+                overlay(target, 0, pixels, transparent)
+                pixels = target
+            self.set_row(row, left, pixels)
+        return Region(left, top, right - left, bottom - top)
+
+    def _move(self, x: int, y: int, width: int, height: int) -> None:
+        """Move the pixels of the buffer, into a buffer of a given size.
+
+        Args:
+            x: The number of pixels to move right by; negative moves left.
+            y: The number of pixels to move down by; negative moves up.
+            width: The width of the buffer to move the pixels into.
+            height: The height of the buffer to move the pixels into.
+
+        Pixels that end up outwith the given size are lost, and pixels that
+        nothing is moved into are blank. If the move is a whole number of
+        tiles the tiles themselves are moved, otherwise only the rows of the
+        tiles that have been allocated are copied.
+        """
+        size, tiles = self.tile_size, self.tiles
+        self.tiles = {}
+        blank = array(self.typecode, [self.blank])
+        if x % size == 0 and y % size == 0:
+            for (tile_x, tile_y), tile in tiles.items():
+                left, top = tile_x * size + x, tile_y * size + y
+                if 0 <= left < width and 0 <= top < height:
+                    # Blank whatever part of the tile is now outwith the
+                    # buffer, so that it can't show if the buffer grows.
+                    if (right := width - left) < size:
+                        for offset in range(0, size * size, size):
+                            tile[offset + right : offset + size] = blank * (
+                                size - right
+                            )
+                    if (bottom := height - top) < size:
+                        tile[bottom * size :] = blank * ((size - bottom) * size)
+                    self.tiles[left // size, top // size] = tile
+            return
+        for (tile_x, tile_y), tile in tiles.items():
+            left = tile_x * size
+            start, end = max(left, -x), min(left + size, self.width, width - x)
+            if start >= end:
+                continue
+            for inner in range(size):
+                if (row := tile_y * size + inner) < self.height and (
+                    0 <= row + y < height
+                ):
+                    offset = inner * size - left
+                    self.set_row(
+                        row + y, start + x, tile[offset + start : offset + end]
+                    )
+
+    def shift(self, x: int, y: int, value: int = NO_COLOR) -> None:
+        """Shift the pixels of the buffer.
+
+        Args:
+            x: The number of pixels to shift right by; negative shifts left.
+            y: The number of pixels to shift down by; negative shifts up.
+            value: The packed value to fill the exposed pixels with.
+
+        Pixels shifted off the edge of the buffer are lost. Only the rows of
+        the tiles that have been allocated are moved, or just the tiles
+        themselves if the shift is a whole number of tiles.
+        """
+        width, height = self.width, self.height
+        if abs(x) >= width or abs(y) >= height:
+            self.fill(value)
+            return
+        self._move(x, y, width, height)
+        if value != self.blank:
+            blank = array(self.typecode, [value])
+            rows = range(y) if y > 0 else range(height + y, height)
+            for row in rows:
+                self.set_row(row, 0, blank * width)
+            if x:
+                left = 0 if x > 0 else width + x
+                for row in range(height):
+                    self.set_row(row, left, blank * abs(x))
+
+    def resize(self, width: int, height: int, x: int = 0, y: int = 0) -> None:
+        """Change the size of the buffer, keeping its pixels.
+
+        Args:
+            width: The new width of the buffer in pixels.
+            height: The new height of the buffer in pixels.
+            x: Where the left edge of the old pixels goes in the new size.
+            y: Where the top edge of the old pixels goes in the new size.
+
+        Any of the old pixels that fall outwith the new size are lost, and
+        the new pixels are blank. No tiles are allocated for the new area.
+        """
+        self._move(x, y, width, height)
+        self.width, self.height = width, height
+
+    def changed_rows(self, other: Pixels) -> list[tuple[int, int]]:
+        """Find the rows that differ from those of another buffer.
+
+        Args:
+            other: The buffer to compare with, of the same size as this one.
+
+        Returns:
+            The runs of rows that differ, as the first row of each run and
+                the row after it ends.
+
+        When both buffers are tiled alike, only the tiles that either of
+        them has allocated are compared.
+        """
+        if not (
+            isinstance(other, TiledPixelBuffer)
+            and other.tile_size == self.tile_size
+            and other.blank == self.blank
+        ):
+            return _changed_rows(self, other)
+        size = self.tile_size
+        blank = self._new_tile()
+        changed: set[int] = set()
+        for key in self.tiles.keys() | other.tiles.keys():
+            mine = self.tiles.get(key, blank)
+            theirs = other.tiles.get(key, blank)
+            if mine != theirs:
+                for inner in range(0, size * size, size):
+                    if mine[inner : inner + size] != theirs[inner : inner + size]:
+                        changed.add(key[1] * size + inner // size)
+        runs: list[tuple[int, int]] = []
+        for row in sorted(row for row in changed if row < self.height):
+            if runs and runs[-1][1] == row:
+                runs[-1] = (runs[-1][0], row + 1)
+            else:
+                runs.append((row, row + 1))
+        return runs
+
+
+##############################################################################
+Pixels: TypeAlias = PixelBuffer | TiledPixelBuffer
+"""The type of the storage that can hold the pixels of a canvas."""
+
+
+##############################################################################
+def _changed_rows(mine: Pixels, theirs: Pixels) -> list[tuple[int, int]]:
+    """Find the rows that differ between two buffers, one row at a time.
+
+    Args:
+        mine: The buffer to compare.
+        theirs: The buffer to compare with.
+
+    Returns:
+        The runs of rows that differ, as the first row of each run and the
+            row after it ends.
+    """
+    runs: list[tuple[int, int]] = []
+    for row in range(mine.height):
+        if mine.row(row) != theirs.row(row):
+            if runs and runs[-1][1] == row:
+                runs[-1] = (runs[-1][0], row + 1)
+            else:
+                runs.append((row, row + 1))
+    return runs
+
+
+### tiles.py ends here
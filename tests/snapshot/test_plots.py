@@ -145,4 +145,19 @@ def test_circle(snap_compare: Callable[[Any], bool]) -> None:
     assert snap_compare(CircleApp())
 
 
+##############################################################################
+def test_filled_shapes(snap_compare: Callable[[Any], bool]) -> None:
+    """Snapshot test for plotting filled shapes."""
+
+    class FilledShapesApp(CanvasApp):
+        def on_mount(self) -> None:
+            self.query_one(Canvas).fill_rectangle(2, 2, 10, 6, SET).fill_circle(
+                30, 10, 6, SET
+            ).fill_ellipse(60, 10, 12, 5, SET).fill_polygon(
+                [(5, 40), (20, 20), (35, 40)], SET
+            )
+
+    assert snap_compare(FilledShapesApp())
+
+
 ### test_plots.py ends here
@@ -0,0 +1,56 @@
+"""Snapshot test the render modes that show more than two pixels in each cell."""
+
+##############################################################################
+# Python imports.
+from collections.abc import Callable
+from typing import Any
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas
+from textual_canvas.segments import RenderMode
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+RED = Color(255, 0, 0)
+GREEN = Color(0, 255, 0)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """Base application for render mode tests."""
+
+    def __init__(self, mode: RenderMode) -> None:
+        super().__init__()
+        self._mode = mode
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(100, 100, UNSET, render_mode=self._mode)
+
+    def on_mount(self) -> None:
+        canvas = self.query_one(Canvas)
+        canvas.draw_circle(30, 30, 25, RED)
+        canvas.draw_line(0, 60, 99, 0, GREEN)
+
+
+##############################################################################
+def test_quadrant(snap_compare: Callable[[Any], bool]) -> None:
+    """Snapshot test for drawing in quadrant mode."""
+
+    assert snap_compare(CanvasApp("quadrant"))
+
+
+##############################################################################
+def test_braille(snap_compare: Callable[[Any], bool]) -> None:
+    """Snapshot test for drawing in braille mode."""
+
+    assert snap_compare(CanvasApp("braille"))
+
+
+### test_sub_cells.py ends here
@@ -0,0 +1,35 @@
+"""A canvas that counts the work it is asked to do, for use in the tests."""
+
+##############################################################################
+# Textual imports.
+from textual.color import Color
+from textual.strip import Strip
+
+##############################################################################
+# Typing extension imports.
+from typing_extensions import Self
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas
+
+
+##############################################################################
+class CountingCanvas(Canvas):
+    """A canvas that counts the lines it renders and the times it refreshes."""
+
+    def __init__(self, width: int = 20, height: int = 20) -> None:
+        super().__init__(width, height, Color(0, 0, 0))
+        self.rendered: list[int] = []
+        self.refreshes = 0
+
+    def render_line(self, y: int) -> Strip:
+        self.rendered.append(y)
+        return super().render_line(y)
+
+    def _refresh_dirty(self) -> Self:
+        self.refreshes += 1
+        return super()._refresh_dirty()
+
+
+### counting.py ends here
@@ -0,0 +1,112 @@
+"""Test the animation driver."""
+
+##############################################################################
+# Python imports.
+from collections.abc import Iterator
+from contextlib import nullcontext
+
+##############################################################################
+# Pytest imports.
+from pytest import MonkeyPatch, approx, raises
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import CanvasError
+from textual_canvas import animation as animation_module
+from textual_canvas.animation import Animation
+
+##############################################################################
+# Test helper imports.
+from counting import CountingCanvas
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield CountingCanvas()
+
+
+##############################################################################
+async def test_animation_draws_frames() -> None:
+    """A running animation should keep drawing frames until it is stopped."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        times: list[float] = []
+
+        def draw(elapsed: float) -> None:
+            times.append(elapsed)
+            canvas.set_pixel(len(times) % 20, 0, SET)
+
+        animation = canvas.start_animation(draw, fps=100)
+        assert animation.running
+        await pilot.pause(0.2)
+        animation.stop()
+        assert not animation.running
+        frames = animation.stats.frames
+        assert frames == len(times) > 1
+        assert times == sorted(times)
+        await pilot.pause(0.05)
+        assert animation.stats.frames == frames
+
+
+##############################################################################
+async def test_frame_refreshes_once() -> None:
+    """However much a frame draws, the canvas should be refreshed once."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+
+        def draw(_: float) -> None:
+            for x in range(20):
+                canvas.set_pixel(x, x, SET)
+
+        animation = canvas.start_animation(draw, fps=0.001)
+        refreshes = canvas.refreshes
+        animation.frame()
+        animation.stop()
+        assert canvas.refreshes == refreshes + 1
+        assert canvas.get_pixel(19, 19) == SET
+
+
+##############################################################################
+async def test_bad_frame_rate() -> None:
+    """A frame rate that isn't positive should be an error."""
+
+    async with CanvasApp().run_test() as pilot:
+        with raises(CanvasError):
+            pilot.app.query_one(CountingCanvas).start_animation(print, fps=0)
+
+
+##############################################################################
+def test_dropped_frames_and_stats(monkeypatch: MonkeyPatch) -> None:
+    """Frames that fall behind should be counted as dropped."""
+    clock: Iterator[float] = iter((0.0, 1.0, 1.01, 1.1, 1.12, 1.4, 1.43))
+    monkeypatch.setattr(animation_module, "monotonic", lambda: next(clock))
+    animation = Animation(lambda _: None, 10, nullcontext)
+    for _ in range(3):
+        animation.frame()
+    stats = animation.stats
+    assert stats.frames == 3
+    assert stats.dropped == 2
+    assert stats.fps == approx(5.0)
+    assert stats.frame_time == approx(0.02)
+    assert stats.max_frame_time == approx(0.03)
+    animation.reset_stats()
+    assert animation.stats.frames == 0
+    assert animation.stats.fps == 0.0
+
+
+### test_animation.py ends here
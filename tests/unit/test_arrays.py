@@ -0,0 +1,121 @@
+"""Test working with the canvas via NumPy arrays."""
+
+##############################################################################
+# Pytest imports.
+from pytest import importorskip, raises
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas, CanvasError
+from textual_canvas.pixels import pack_color
+
+##############################################################################
+# NumPy is optional, so only run these tests if it's about.
+np = importorskip("numpy")
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(10, 10, UNSET)
+
+
+##############################################################################
+async def test_pixel_array_is_a_view() -> None:
+    """Writing to the pixel array should write to the canvas."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        with canvas.pixel_array() as pixels:
+            assert pixels.shape == (10, 10)
+            pixels[2, 3] = pack_color(SET)
+        assert canvas.get_pixel(3, 2) == SET
+
+
+##############################################################################
+async def test_set_packed_array() -> None:
+    """Setting a packed array should set the pixels it covers."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.set_array(np.full((2, 3), pack_color(SET), dtype=np.uint32), 1, 1)
+        assert canvas.get_pixel(0, 0) == UNSET
+        assert canvas.get_pixel(1, 1) == SET
+        assert canvas.get_pixel(3, 2) == SET
+        assert canvas.get_pixel(4, 2) == UNSET
+
+
+##############################################################################
+async def test_set_rgb_array_clipped() -> None:
+    """Setting an RGB array partly off the canvas should clip it."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        rgb = np.zeros((4, 4, 3), dtype=np.uint8)
+        rgb[..., 0] = 255
+        canvas.set_array(rgb, -2, 8)
+        assert canvas.get_pixel(0, 9) == Color(255, 0, 0)
+        assert canvas.get_pixel(1, 8) == Color(255, 0, 0)
+        assert canvas.get_pixel(2, 9) == UNSET
+
+
+##############################################################################
+async def test_set_bad_array() -> None:
+    """Setting an array that can't be used as pixels should be an error."""
+
+    async with CanvasApp().run_test() as pilot:
+        with raises(CanvasError):
+            pilot.app.query_one(Canvas).set_array(np.zeros((2, 2, 2)))
+
+
+##############################################################################
+async def test_set_palette_array() -> None:
+    """Setting an array on a palette canvas should use palette indexes."""
+
+    class PaletteApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Canvas(10, 10, UNSET, palette=[SET, Color(255, 0, 0)])
+
+    async with PaletteApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.set_array(np.array([[1, 2]]))
+        assert canvas.get_pixel(0, 0) == SET
+        assert canvas.get_pixel(1, 0) == Color(255, 0, 0)
+        with canvas.pixel_array() as pixels:
+            assert pixels.dtype == np.uint8
+        with raises(CanvasError):
+            canvas.set_array(np.zeros((2, 2, 3), dtype=np.uint8))
+
+
+##############################################################################
+async def test_clear_array_pixels_with_ansi_colours() -> None:
+    """Array pixels with no alpha should have no colour, even beside ANSI colours."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        ansi = Color(128, 0, 0, ansi=1)
+        canvas.set_pixel(0, 0, ansi)
+        canvas.set_array(np.array([[[0, 0, 1, 0], [0, 0, 1, 255]]], dtype=np.uint8), 1)
+        canvas.set_points([3], [0], colors=np.array([[0, 0, 1, 0]], dtype=np.uint8))
+        assert canvas.get_pixel(0, 0) == ansi
+        assert canvas.get_pixel(1, 0) == UNSET
+        assert canvas.get_pixel(2, 0) == Color(0, 0, 1)
+        assert canvas.get_pixel(3, 0) == UNSET
+        with canvas.pixel_array() as pixels:
+            assert pixels[0, 0] == pack_color(ansi)
+            assert not pixels[0, 1] and not pixels[0, 3]
+
+
+### test_arrays.py ends here
@@ -0,0 +1,87 @@
+"""Test that drawing only refreshes the parts of the canvas that changed."""
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Test helper imports.
+from counting import CountingCanvas
+
+##############################################################################
+# Helpful constants.
+SET = Color(255, 255, 255)
+WIDTH = 20
+HEIGHT = 20
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield CountingCanvas(WIDTH, HEIGHT)
+
+
+##############################################################################
+async def test_single_pixel_refreshes_one_line() -> None:
+    """Setting a single pixel should only cause one line to be rendered."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        await pilot.pause()
+        canvas.rendered.clear()
+        canvas.set_pixel(3, 5, SET)
+        await pilot.pause()
+        assert canvas.rendered == [2]
+
+
+##############################################################################
+async def test_line_refreshes_lines_it_covers() -> None:
+    """Drawing a line should only render the lines that the line covers."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        await pilot.pause()
+        canvas.rendered.clear()
+        canvas.draw_line(0, 4, 10, 7, SET)
+        await pilot.pause()
+        assert sorted(canvas.rendered) == [2, 3]
+
+
+##############################################################################
+async def test_batch_refreshes_union() -> None:
+    """A batch should refresh the lines covering everything drawn in it."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        await pilot.pause()
+        canvas.rendered.clear()
+        with canvas.batch_refresh():
+            canvas.set_pixel(0, 0, SET)
+            canvas.set_pixel(0, 5, SET)
+            await pilot.pause()
+            assert canvas.rendered == []
+        await pilot.pause()
+        assert sorted(canvas.rendered) == [0, 1, 2]
+
+
+##############################################################################
+async def test_refreshes_coalesce() -> None:
+    """Pixels set while handling one message should share one refresh."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas).instrument()
+        await pilot.pause()
+        canvas.rendered.clear()
+        canvas.set_pixel(0, 0, SET)
+        canvas.set_pixel(0, 5, SET)
+        canvas.set_pixel(0, 10, SET)
+        await pilot.pause()
+        assert canvas.stats is not None
+        assert canvas.stats.refreshes == 1
+        assert sorted(canvas.rendered) == [0, 1, 2, 3, 4, 5]
+
+
+### test_dirty.py ends here
@@ -0,0 +1,152 @@
+"""Test the drawing of filled shapes on the canvas."""
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas
+
+##############################################################################
+# Helpful constants.
+SIZE = 20
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(SIZE, SIZE, UNSET)
+
+
+##############################################################################
+def set_pixels(canvas: Canvas) -> set[tuple[int, int]]:
+    """Get the locations of all the pixels that are set on a canvas."""
+    return {
+        (x, y)
+        for y in range(canvas.height)
+        for x in range(canvas.width)
+        if canvas.get_pixel(x, y) == SET
+    }
+
+
+##############################################################################
+async def test_fill_rectangle() -> None:
+    """Filling a rectangle should set every pixel within it."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).fill_rectangle(2, 3, 4, 5, SET)
+        assert set_pixels(canvas) == {(x, y) for y in range(3, 8) for x in range(2, 6)}
+
+
+##############################################################################
+async def test_fill_rectangle_clips() -> None:
+    """Filling a rectangle that extends beyond the canvas should clip it."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).fill_rectangle(-5, 15, 10, 100, SET)
+        assert set_pixels(canvas) == {
+            (x, y) for y in range(15, SIZE) for x in range(0, 5)
+        }
+        canvas.clear().fill_rectangle(SIZE, 0, 5, 5, SET)
+        canvas.fill_rectangle(0, 0, 0, 5, SET).fill_rectangle(0, 0, 5, -1, SET)
+        assert set_pixels(canvas) == set()
+
+
+##############################################################################
+async def test_fill_circle_covers_the_outline() -> None:
+    """A filled circle should cover its outline and everything inside it."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).draw_circle(9, 9, 7, SET)
+        outline = set_pixels(canvas)
+        filled = set_pixels(canvas.clear().fill_circle(9, 9, 7, SET))
+        assert outline < filled
+        for y in range(SIZE):
+            row = sorted(x for x, pixel_y in outline if pixel_y == y)
+            assert {x for x, pixel_y in filled if pixel_y == y} == (
+                set(range(row[0], row[-1] + 1)) if row else set()
+            )
+
+
+##############################################################################
+async def test_fill_ellipse() -> None:
+    """A filled ellipse should set the pixels within the ellipse."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).fill_ellipse(9, 9, 8, 4, SET)
+        assert set_pixels(canvas) == {
+            (9 + x, 9 + y)
+            for y in range(-4, 5)
+            for x in range(-8, 9)
+            if (x / 8) ** 2 + (y / 4) ** 2 <= 1
+        }
+
+
+##############################################################################
+async def test_fill_ellipse_clips() -> None:
+    """A filled ellipse that extends beyond the canvas should be clipped."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).fill_ellipse(0, 0, 10**6, 10**6, SET)
+        assert len(set_pixels(canvas)) == SIZE * SIZE
+
+
+##############################################################################
+async def test_fill_polygon_rectangle() -> None:
+    """A rectangular polygon should fill the same pixels as a rectangle."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).fill_rectangle(2, 3, 10, 5, SET)
+        rectangle = set_pixels(canvas)
+        canvas.clear().fill_polygon([(2, 3), (11, 3), (11, 7), (2, 7)], SET)
+        assert set_pixels(canvas) == rectangle
+
+
+##############################################################################
+async def test_fill_polygon_covers_the_outline() -> None:
+    """A filled polygon should cover its outline and what is inside it."""
+
+    triangle = [(1, 18), (10, 1), (18, 15)]
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        for (x0, y0), (x1, y1) in zip(
+            triangle, triangle[1:] + triangle[:1], strict=True
+        ):
+            canvas.draw_line(x0, y0, x1, y1, SET)
+        outline = set_pixels(canvas)
+        filled = set_pixels(canvas.clear().fill_polygon(triangle, SET))
+        assert outline < filled
+        assert (10, 10) in filled
+        assert (1, 1) not in filled
+
+
+##############################################################################
+async def test_fill_polygon_even_odd() -> None:
+    """The inside of a self-crossing polygon should follow the even-odd rule."""
+
+    star = [(10, 0), (16, 19), (0, 7), (19, 7), (3, 19)]
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).fill_polygon(star, SET)
+        assert canvas.get_pixel(10, 4) == SET
+        assert canvas.get_pixel(10, 11) == UNSET
+
+
+##############################################################################
+async def test_fill_polygon_clips() -> None:
+    """A filled polygon that extends beyond the canvas should be clipped."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.fill_polygon([(-100, -100), (100, -100), (100, 100), (-100, 100)], SET)
+        assert len(set_pixels(canvas)) == SIZE * SIZE
+        canvas.clear().fill_polygon([], SET).fill_polygon([(50, 50)], SET)
+        assert set_pixels(canvas) == set()
+
+
+### test_filled.py ends here
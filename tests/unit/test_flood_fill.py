@@ -0,0 +1,197 @@
+"""Test flood filling the canvas."""
+
+##############################################################################
+# Python imports.
+from random import Random
+from time import perf_counter
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas, CanvasError
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+RED = Color(255, 0, 0)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def __init__(
+        self, width: int = 20, height: int = 20, tile_size: int | None = None
+    ) -> None:
+        super().__init__()
+        self._width = width
+        self._height = height
+        self._tile_size = tile_size
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(self._width, self._height, UNSET, tile_size=self._tile_size)
+
+
+##############################################################################
+def colours(canvas: Canvas) -> list[list[Color]]:
+    """Get the colours of all the pixels on a canvas."""
+    return [
+        [canvas.get_pixel(x, y) for x in range(canvas.width)]
+        for y in range(canvas.height)
+    ]
+
+
+##############################################################################
+def reference_fill(pixels: list[list[Color]], x: int, y: int, colour: Color) -> None:
+    """Flood fill a grid of colours the slow and obvious way."""
+    target = pixels[y][x]
+    if target == colour:
+        return
+    todo = [(x, y)]
+    while todo:
+        x, y = todo.pop()
+        if 0 <= y < len(pixels) and 0 <= x < len(pixels[y]) and pixels[y][x] == target:
+            pixels[y][x] = colour
+            todo.extend(((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)))
+
+
+##############################################################################
+async def test_fill_inside_a_shape() -> None:
+    """Filling inside a shape should fill up to its edges and no further."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).draw_rectangle(2, 2, 10, 10, SET)
+        canvas.flood_fill(5, 5, RED)
+        assert canvas.get_pixel(3, 3) == RED
+        assert canvas.get_pixel(10, 10) == RED
+        assert canvas.get_pixel(2, 2) == SET
+        assert canvas.get_pixel(1, 1) == UNSET
+        assert canvas.get_pixel(15, 15) == UNSET
+
+
+##############################################################################
+async def test_fill_does_not_leak_diagonally() -> None:
+    """A fill should not pass between pixels that only touch at a corner."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).draw_line(0, 5, 5, 0, SET)
+        canvas.flood_fill(0, 0, RED)
+        assert canvas.get_pixel(1, 1) == RED
+        assert canvas.get_pixel(6, 6) == UNSET
+
+
+##############################################################################
+async def test_fill_with_same_colour() -> None:
+    """Filling an area with the colour it already has should change nothing."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).draw_rectangle(2, 2, 10, 10, SET)
+        before = colours(canvas)
+        canvas.flood_fill(2, 2, SET)
+        assert colours(canvas) == before
+
+
+##############################################################################
+async def test_fill_outwith_the_canvas() -> None:
+    """Filling from outwith the canvas should be an error."""
+
+    async with CanvasApp().run_test() as pilot:
+        with raises(CanvasError):
+            pilot.app.query_one(Canvas).flood_fill(20, 0, RED)
+
+
+##############################################################################
+async def test_fill_matches_reference() -> None:
+    """Filling should match a simple flood fill on random pictures."""
+
+    random = Random(42)
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        for _ in range(50):
+            canvas.clear()
+            for _ in range(random.randint(0, 300)):
+                canvas.set_pixel(random.randrange(20), random.randrange(20), SET)
+            x, y = random.randrange(20), random.randrange(20)
+            expected = colours(canvas)
+            reference_fill(expected, x, y, RED)
+            canvas.flood_fill(x, y, RED)
+            assert colours(canvas) == expected
+
+
+##############################################################################
+async def test_tiled_fill_matches_reference() -> None:
+    """Filling a tiled canvas should match a simple flood fill."""
+
+    random = Random(42)
+    async with CanvasApp(tile_size=4).run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        for _ in range(50):
+            canvas.clear()
+            for _ in range(random.randint(0, 300)):
+                canvas.set_pixel(random.randrange(20), random.randrange(20), SET)
+            x, y = random.randrange(20), random.randrange(20)
+            expected = colours(canvas)
+            reference_fill(expected, x, y, RED)
+            canvas.flood_fill(x, y, RED)
+            assert colours(canvas) == expected
+
+
+##############################################################################
+async def test_fill_large_canvas() -> None:
+    """Filling a large area should be quick."""
+
+    async with CanvasApp(1000, 1000).run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).draw_circle(500, 500, 400, SET)
+        start = perf_counter()
+        canvas.flood_fill(0, 0, RED)
+        assert perf_counter() - start < 1
+        assert canvas.get_pixel(999, 999) == RED
+        assert canvas.get_pixel(500, 500) == UNSET
+
+
+##############################################################################
+async def test_fill_corridors_matches_reference() -> None:
+    """Filling narrow corridors should match a simple flood fill."""
+
+    random = Random(42)
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        for _ in range(50):
+            canvas.clear()
+            for wall in range(random.randrange(2), 20, 2):
+                canvas.draw_line(wall, 0, wall, 19, SET)
+            for _ in range(random.randint(0, 40)):
+                canvas.clear_pixel(random.randrange(20), random.randrange(20))
+            x, y = random.randrange(20), random.randrange(20)
+            expected = colours(canvas)
+            reference_fill(expected, x, y, RED)
+            canvas.flood_fill(x, y, RED)
+            assert colours(canvas) == expected
+
+
+##############################################################################
+async def test_fill_serpentine() -> None:
+    """Filling a long winding corridor a pixel wide should be quick."""
+
+    async with CanvasApp(1000, 1000).run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        for wall in range(1, 999, 2):
+            canvas.draw_line(wall, 0, wall, 999, SET)
+            canvas.clear_pixel(wall, 999 if wall % 4 == 1 else 0)
+        start = perf_counter()
+        canvas.flood_fill(0, 0, RED)
+        assert perf_counter() - start < 1
+        assert canvas.get_pixel(998, 500) == RED
+        assert canvas.get_pixel(997, 500) == SET
+
+
+### test_flood_fill.py ends here
@@ -0,0 +1,176 @@
+"""Test drawing frames in a back buffer."""
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import CanvasError
+
+##############################################################################
+# Test helper imports.
+from counting import CountingCanvas
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+RED = Color(255, 0, 0)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield CountingCanvas()
+
+
+##############################################################################
+async def test_frame_is_unseen_until_presented() -> None:
+    """Drawing in a frame shouldn't be seen until the frame is presented."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        canvas.set_pixel(0, 0, SET).start_frame()
+        canvas.set_pixel(1, 1, RED)
+        assert canvas.get_pixel(0, 0) == SET
+        assert canvas.get_pixel(1, 1) == UNSET
+        assert canvas.get_region(0, 0, 2, 2).data[3] != 0
+        canvas.present()
+        assert canvas.get_pixel(0, 0) == SET
+        assert canvas.get_pixel(1, 1) == RED
+
+
+##############################################################################
+async def test_cleared_frame() -> None:
+    """A frame that starts clear shouldn't keep what was drawn before."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        canvas.set_pixel(0, 0, SET)
+        with canvas.frame(clear=True):
+            canvas.set_pixel(5, 5, RED)
+        assert canvas.get_pixel(0, 0) == UNSET
+        assert canvas.get_pixel(5, 5) == RED
+
+
+##############################################################################
+async def test_present_swaps_buffers() -> None:
+    """Presenting a frame should swap buffers rather than copy them."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        front = canvas._layer.pixels
+        canvas.start_frame()
+        back = canvas._canvas
+        canvas.present()
+        assert canvas._layer.pixels is back
+        assert canvas._layer.back is front
+        canvas.start_frame()
+        assert canvas._canvas is front
+
+
+##############################################################################
+async def test_present_refreshes_changed_rows() -> None:
+    """Presenting a frame should only re-render the lines that changed."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        canvas.fill_rectangle(0, 0, 20, 20, SET)
+        await pilot.pause()
+        canvas.rendered.clear()
+        with canvas.frame(clear=True):
+            canvas.fill_rectangle(0, 0, 20, 20, SET)
+            canvas.set_pixel(3, 6, RED)
+            assert canvas.rendered == []
+        await pilot.pause()
+        assert canvas.rendered == [3]
+
+
+##############################################################################
+async def test_present_refreshes_each_run() -> None:
+    """Presenting a frame should refresh each run of changed rows apart."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        await pilot.pause()
+        canvas.rendered.clear()
+        with canvas.frame():
+            canvas.set_pixel(3, 0, RED).set_pixel(3, 1, RED)
+            canvas.set_pixel(3, 19, RED)
+        await pilot.pause()
+        assert sorted(canvas.rendered) == [0, 9]
+
+
+##############################################################################
+async def test_sprites_stay_on_top_of_frames() -> None:
+    """Sprites should be drawn on top of each frame that is presented."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        canvas.set_pixel(0, 0, RED)
+        block = canvas.get_region(0, 0, 1, 1)
+        canvas.clear()
+        sprite = canvas.add_sprite(block, 5, 5)
+        with canvas.frame():
+            assert canvas.get_region(5, 5, 1, 1).data[0] == 0
+            canvas.fill_rectangle(0, 0, 10, 10, SET)
+        assert canvas.get_pixel(5, 5) == RED
+        canvas.move_sprite(sprite, 15, 15)
+        assert canvas.get_pixel(5, 5) == SET
+        assert canvas.get_pixel(15, 15) == RED
+
+
+##############################################################################
+async def test_failed_frame_is_thrown_away() -> None:
+    """A frame that raises an exception shouldn't be presented."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        with raises(ZeroDivisionError), canvas.frame():
+            canvas.set_pixel(0, 0, SET)
+            _ = 1 / 0
+        assert canvas.get_pixel(0, 0) == UNSET
+        canvas.set_pixel(1, 1, SET)
+        assert canvas.get_pixel(1, 1) == SET
+
+
+##############################################################################
+async def test_frame_errors() -> None:
+    """Misusing frames should be an error."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas).add_layer("overlay")
+        with raises(CanvasError):
+            canvas.present()
+        canvas.start_frame()
+        with raises(CanvasError):
+            canvas.start_frame()
+        with raises(CanvasError):
+            canvas.use_layer("overlay")
+
+
+##############################################################################
+async def test_clear_in_frame() -> None:
+    """Clearing the canvas while a frame is drawn should be an error."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        canvas.set_pixel(0, 0, SET)
+        canvas.start_frame()
+        canvas.set_pixel(5, 5, RED)
+        with raises(CanvasError):
+            canvas.clear()
+        canvas.present()
+        assert canvas.get_pixel(0, 0) == SET
+        assert canvas.get_pixel(5, 5) == RED
+
+
+### test_frames.py ends here
@@ -0,0 +1,181 @@
+"""Test the instrumentation of the canvas."""
+
+##############################################################################
+# Python imports.
+import sys
+
+##############################################################################
+# Pytest imports.
+from pytest import MonkeyPatch, importorskip, mark
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas
+from textual_canvas.instruments import CanvasStats
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def __init__(self, interval: float | None = None) -> None:
+        super().__init__()
+        self._interval = interval
+        self.reports: list[CanvasStats] = []
+
+    def compose(self) -> ComposeResult:
+        canvas = Canvas(20, 20, UNSET)
+        if self._interval is not None:
+            canvas.instrument(interval=self._interval)
+        yield canvas
+
+    def on_canvas_stats(self, event: Canvas.Stats) -> None:
+        self.reports.append(event.stats)
+
+
+##############################################################################
+def test_off_by_default() -> None:
+    """A canvas should only count its work once it is instrumented."""
+    canvas = Canvas(20, 20, UNSET)
+    canvas.set_pixel(0, 0, SET)
+    assert not canvas.instrumented
+    assert canvas.stats is None
+    assert canvas.instrument().instrumented
+    assert canvas.stats is not None
+    assert canvas.stats.pixels == 0
+    assert not canvas.instrument(False).instrumented
+    assert canvas.stats is None
+
+
+##############################################################################
+def test_drawing() -> None:
+    """Drawing should count the calls made and the pixels written."""
+    canvas = Canvas(20, 20, UNSET).instrument()
+    canvas.set_pixels([(0, 0), (1, 1), (2, 2)], SET)
+    canvas.draw_line(0, 5, 9, 5, SET)
+    canvas.fill_rectangle(0, 10, 4, 5, SET)
+    canvas.flood_fill(19, 0, SET)
+    stats = canvas.stats
+    assert stats is not None
+    assert stats.calls == {
+        "set_pixels": 1,
+        "draw_line": 1,
+        "fill_rectangle": 1,
+        "flood_fill": 1,
+    }
+    assert stats.pixels == 3 + 10 + 20 + (400 - 3 - 10 - 20)
+    canvas.reset_stats()
+    assert canvas.stats is not None
+    assert canvas.stats.calls == {}
+    assert canvas.stats.pixels == 0
+
+
+##############################################################################
+@mark.parametrize("numpy", [True, False])
+def test_clipped_points(numpy: bool, monkeypatch: MonkeyPatch) -> None:
+    """Points that are clipped away shouldn't be counted as written."""
+    if numpy:
+        importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "textual_canvas.arrays", None)
+    canvas = Canvas(20, 20, UNSET).instrument()
+    canvas.set_points([-1, 5, 20, 6], [5, 5, 5, 5], SET, clip=True)
+    canvas.set_points([-1], [-1], SET, clip=True)
+    assert canvas.stats is not None
+    assert canvas.stats.pixels == 2
+
+
+##############################################################################
+def test_nested_drawing() -> None:
+    """Drawing built on other drawing should only count the method called."""
+    canvas = Canvas(20, 20, UNSET).instrument()
+    canvas.draw_rectangle(0, 0, 5, 4, SET)
+    canvas.draw_circle(10, 10, 3, SET)
+    canvas.set_pixel(19, 19, SET)
+    canvas.clear_pixel(19, 19)
+    stats = canvas.stats
+    assert stats is not None
+    assert stats.calls == {
+        "draw_rectangle": 1,
+        "draw_circle": 1,
+        "set_pixel": 1,
+        "clear_pixel": 1,
+    }
+    assert stats.pixels == 5 + 4 + 5 + 4 + 24 + 1 + 1
+
+
+##############################################################################
+def test_whole_refreshes() -> None:
+    """Refreshes of the whole canvas should be counted."""
+    canvas = Canvas(20, 20, UNSET, palette=[SET]).instrument()
+    canvas.set_palette([UNSET])
+    canvas.set_render_mode("braille")
+    canvas.clear()
+    stats = canvas.stats
+    assert stats is not None
+    assert stats.refreshes == 3
+
+
+##############################################################################
+def test_refreshes() -> None:
+    """Refreshes put off by a batch should be counted."""
+    canvas = Canvas(20, 20, UNSET).instrument()
+    with canvas.batch_refresh():
+        canvas.set_pixel(0, 0, SET)
+        canvas.set_pixel(1, 0, SET)
+    canvas.set_pixel(2, 0, SET, refresh=False)
+    stats = canvas.stats
+    assert stats is not None
+    assert stats.suppressed_refreshes == 3
+
+
+##############################################################################
+async def test_rendering() -> None:
+    """Rendering lines should be counted and timed."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).instrument()
+        canvas.set_pixel(0, 0, SET)
+        await pilot.pause()
+        assert canvas.stats is not None
+        assert canvas.stats.refreshes == 1
+        canvas.reset_stats()
+        canvas.set_pixel(1, 0, SET, refresh=False)
+        canvas.render_line(0)
+        canvas.render_line(0)
+        stats = canvas.stats
+        assert stats is not None
+        assert stats.lines_rendered == 2
+        assert stats.line_cache_hits == 1
+        assert stats.render_time > 0
+        assert stats.mean_render_time == stats.render_time / 2
+        assert stats.segment_hits + stats.segment_misses > 0
+
+
+##############################################################################
+async def test_messages() -> None:
+    """An instrumented canvas should post its statistics at intervals."""
+
+    app = CanvasApp(0.01)
+    async with app.run_test() as pilot:
+        await pilot.pause(0.1)
+        assert app.reports
+        assert app.reports[-1].lines_rendered > 0
+        app.query_one(Canvas).instrument(False)
+        await pilot.pause()
+        count = len(app.reports)
+        await pilot.pause(0.05)
+        assert len(app.reports) == count
+
+
+### test_instruments.py ends here
@@ -0,0 +1,148 @@
+"""Test the layers of the canvas."""
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import CanvasError
+from textual_canvas.layers import BASE_LAYER
+
+##############################################################################
+# Test helper imports.
+from counting import CountingCanvas
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+RED = Color(255, 0, 0)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield CountingCanvas()
+
+
+##############################################################################
+async def test_layers_stack() -> None:
+    """Upper layers should cover lower layers, except where transparent."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        canvas.fill_rectangle(0, 0, 20, 20, SET)
+        canvas.add_layer("overlay").use_layer("overlay").set_pixel(5, 5, RED)
+        assert canvas.layers == (BASE_LAYER, "overlay")
+        assert canvas.layer == "overlay"
+        assert canvas.get_pixel(5, 5) == RED
+        assert canvas.get_pixel(6, 6) == SET
+        assert canvas.render_line(2) != canvas.render_line(3)
+
+
+##############################################################################
+async def test_clear_layer() -> None:
+    """Clearing a layer should leave the other layers alone."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        canvas.draw_line(0, 0, 19, 0, SET)
+        canvas.add_layer("overlay").use_layer("overlay").draw_line(0, 0, 0, 19, RED)
+        assert canvas.get_pixel(0, 0) == RED
+        canvas.clear_layer()
+        assert canvas.get_pixel(0, 0) == SET
+        assert canvas.get_pixel(0, 5) == UNSET
+        canvas.set_pixel(3, 3, RED).clear_layer(BASE_LAYER)
+        assert canvas.get_pixel(1, 0) == UNSET
+        assert canvas.get_pixel(3, 3) == RED
+
+
+##############################################################################
+async def test_remove_layer() -> None:
+    """Removing a layer should remove what was drawn on it."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        canvas.add_layer("overlay").use_layer("overlay").set_pixel(5, 5, RED)
+        canvas.remove_layer("overlay")
+        assert canvas.layers == (BASE_LAYER,)
+        assert canvas.layer == BASE_LAYER
+        assert canvas.get_pixel(5, 5) == UNSET
+
+
+##############################################################################
+async def test_layer_errors() -> None:
+    """Misusing layers should be an error."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas).add_layer("overlay")
+        with raises(CanvasError):
+            canvas.add_layer("overlay")
+        with raises(CanvasError):
+            canvas.use_layer("nope")
+        with raises(CanvasError):
+            canvas.remove_layer(BASE_LAYER)
+        with raises(CanvasError):
+            canvas.clear_layer("nope")
+
+
+##############################################################################
+async def test_drawing_on_a_layer_refreshes_its_lines() -> None:
+    """Drawing on one layer should only re-render the lines it touches."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        canvas.fill_rectangle(0, 0, 20, 20, SET).add_layer("overlay")
+        await pilot.pause()
+        canvas.rendered.clear()
+        canvas.use_layer("overlay").set_pixel(3, 5, RED)
+        await pilot.pause()
+        assert canvas.rendered == [2]
+
+
+##############################################################################
+async def test_composite_rows_are_cached() -> None:
+    """Rows of the composite should only be rebuilt when a layer changes them."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        canvas.add_layer("overlay")
+        layers = [canvas._layers[name] for name in canvas.layers]
+        canvas.get_pixel(0, 0)
+        canvas.get_pixel(0, 4)
+        assert not any(0 in layer.dirty or 4 in layer.dirty for layer in layers)
+        canvas.use_layer("overlay").set_pixel(0, 4, RED)
+        assert [4 in layer.dirty for layer in layers] == [False, True]
+        assert not any(0 in layer.dirty for layer in layers)
+
+
+##############################################################################
+async def test_sprites_on_layers() -> None:
+    """Sprites should be drawn on the layer they were added on."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        canvas.set_pixel(0, 0, RED)
+        block = canvas.get_region(0, 0, 1, 1)
+        canvas.clear().fill_rectangle(0, 0, 20, 20, SET).add_layer("sprites")
+        sprite = canvas.use_layer("sprites").add_sprite(block, 5, 5)
+        canvas.use_layer(BASE_LAYER).clear_layer()
+        assert canvas.get_pixel(5, 5) == RED
+        canvas.move_sprite(sprite, 6, 6)
+        assert canvas.get_pixel(5, 5) == UNSET
+        assert canvas.get_pixel(6, 6) == RED
+        canvas.remove_layer("sprites")
+        assert canvas.get_pixel(6, 6) == UNSET
+        with raises(CanvasError):
+            canvas.move_sprite(sprite, 0, 0)
+
+
+### test_layers.py ends here
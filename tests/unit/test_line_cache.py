@@ -0,0 +1,59 @@
+"""Test the caching of rendered lines in the canvas."""
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(20, 20, UNSET)
+
+
+##############################################################################
+async def test_unchanged_line_is_reused() -> None:
+    """Rendering an unchanged line twice should give the same strip."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        assert canvas.render_line(0) is canvas.render_line(0)
+
+
+##############################################################################
+async def test_drawing_invalidates_only_touched_lines() -> None:
+    """Drawing should only cause the lines that were drawn on to be rebuilt."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        first, second = canvas.render_line(0), canvas.render_line(1)
+        canvas.set_pixel(0, 3, SET)
+        assert canvas.render_line(0) is first
+        assert canvas.render_line(1) is not second
+        assert canvas.render_line(1) != second
+
+
+##############################################################################
+async def test_style_change_invalidates_lines() -> None:
+    """Changing the canvas colour should cause lines to be rebuilt."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        first = canvas.render_line(0)
+        canvas.clear(Color(255, 0, 0))
+        assert canvas.render_line(0) is not first
+
+
+### test_line_cache.py ends here
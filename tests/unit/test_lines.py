@@ -0,0 +1,135 @@
+"""Test the drawing of lines on the canvas."""
+
+##############################################################################
+# Python imports.
+from collections.abc import Iterable
+from random import Random
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Typing extension imports.
+from typing_extensions import Self
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas
+
+##############################################################################
+# Helpful constants.
+WIDTH = 23
+HEIGHT = 17
+SET = Color(255, 255, 255)
+
+
+##############################################################################
+class RecordingCanvas(Canvas):
+    """A canvas that records the pixels it is asked to set."""
+
+    def __init__(self) -> None:
+        super().__init__(WIDTH, HEIGHT)
+        self.pixels: list[tuple[int, int]] = []
+
+    def _set_pixels(
+        self,
+        locations: Iterable[tuple[int, int]],
+        color: Color | None,
+        refresh: bool | None,
+    ) -> Self:
+        self.pixels = list(locations)
+        return super()._set_pixels(self.pixels, color, refresh)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield RecordingCanvas()
+
+
+##############################################################################
+def bresenham(x0: int, y0: int, x1: int, y1: int) -> list[tuple[int, int]]:
+    """The unclipped line drawing that the canvas used to do."""
+    pixels: list[tuple[int, int]] = []
+    dx = abs(x1 - x0)
+    sx = 1 if x0 < x1 else -1
+    dy = -abs(y1 - y0)
+    sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    while True:
+        if 0 <= x0 < WIDTH and 0 <= y0 < HEIGHT:
+            pixels.append((x0, y0))
+        if x0 == x1 and y0 == y1:
+            break
+        e2 = 2 * err
+        if e2 >= dy:
+            if x0 == x1:
+                break
+            err += dy
+            x0 += sx
+        if e2 <= dx:
+            if y0 == y1:
+                break
+            err += dx
+            y0 += sy
+    return pixels
+
+
+##############################################################################
+async def test_lines_match_bresenham() -> None:
+    """Clipped lines should plot exactly the pixels of the unclipped algorithm."""
+
+    random = Random(42)
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(RecordingCanvas)
+        with canvas.batch_refresh():
+            for _ in range(5000):
+                x0, y0, x1, y1 = (random.randint(-40, 60) for _ in range(4))
+                canvas.draw_line(x0, y0, x1, y1, SET)
+                assert canvas.pixels == bresenham(x0, y0, x1, y1), (x0, y0, x1, y1)
+
+
+##############################################################################
+async def test_lines_on_the_edges() -> None:
+    """Lines that run along or touch the edges should match the unclipped algorithm."""
+
+    right, bottom = WIDTH - 1, HEIGHT - 1
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(RecordingCanvas)
+        for line in (
+            (0, 0, 0, 0),
+            (right, bottom, right, bottom),
+            (-1, -1, -1, -1),
+            (0, 0, right, 0),
+            (0, bottom, right, bottom),
+            (0, 0, 0, bottom),
+            (right, 0, right, bottom),
+            (0, 0, right, bottom),
+            (right, bottom, 0, 0),
+            (-1, 0, -1, bottom),
+            (0, -1, right, -1),
+            (WIDTH, 0, WIDTH, bottom),
+            (0, HEIGHT, right, HEIGHT),
+            (-5, -5, right + 5, bottom + 5),
+            (right + 5, -5, -5, bottom + 5),
+        ):
+            canvas.draw_line(*line, SET)
+            assert canvas.pixels == bresenham(*line), line
+
+
+##############################################################################
+async def test_very_long_line() -> None:
+    """A very long line should only plot the pixels within the canvas."""
+
+    line = (-(10**6), 0, 10**6, 50)
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(RecordingCanvas)
+        canvas.draw_line(*line, SET)
+        assert canvas.pixels == bresenham(*line)
+
+
+### test_lines.py ends here
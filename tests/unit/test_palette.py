@@ -0,0 +1,120 @@
+"""Test canvases that use a palette."""
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas, CanvasError
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+RED = Color(255, 0, 0)
+GREEN = Color(0, 255, 0)
+BLUE = Color(0, 0, 255)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(10, 10, UNSET, palette=[RED, GREEN])
+
+
+##############################################################################
+async def test_draw_with_palette() -> None:
+    """Drawing with colours in the palette should work as normal."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.draw_line(0, 0, 9, 0, RED).set_pixel(5, 5, GREEN)
+        assert canvas.get_pixel(9, 0) == RED
+        assert canvas.get_pixel(5, 5) == GREEN
+        assert canvas.get_pixel(5, 6) == UNSET
+        canvas.clear_pixel(5, 5)
+        assert canvas.get_pixel(5, 5) == UNSET
+
+
+##############################################################################
+async def test_draw_outwith_palette() -> None:
+    """Drawing with a colour that isn't in the palette should be an error."""
+
+    async with CanvasApp().run_test() as pilot:
+        with raises(CanvasError):
+            pilot.app.query_one(Canvas).set_pixel(0, 0, BLUE)
+
+
+##############################################################################
+async def test_pixels_are_bytes() -> None:
+    """A palette canvas should hold one byte per pixel."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).set_pixel(1, 0, GREEN)
+        assert canvas._canvas.row(0).itemsize == 1
+        assert list(canvas._canvas.row(0, 0, 3)) == [0, 2, 0]
+
+
+##############################################################################
+async def test_swap_palette() -> None:
+    """Swapping the palette should recolour the canvas."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).set_pixel(0, 0, RED)
+        before = canvas.render_line(0)
+        canvas.set_palette([BLUE, GREEN])
+        assert canvas.get_pixel(0, 0) == BLUE
+        assert canvas.render_line(0) != before
+        assert canvas.palette == (BLUE, GREEN)
+
+
+##############################################################################
+async def test_set_palette_without_palette() -> None:
+    """Setting the palette of a canvas without a palette should be an error."""
+
+    class PlainApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Canvas(10, 10)
+
+    async with PlainApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        assert canvas.palette is None
+        with raises(CanvasError):
+            canvas.set_palette([RED])
+
+
+##############################################################################
+async def test_palette_too_big() -> None:
+    """A palette with too many colours should be an error."""
+    with raises(CanvasError):
+        Canvas(10, 10, palette=[Color(n, 0, 0) for n in range(256)])
+
+
+##############################################################################
+async def test_odd_size_in_cells() -> None:
+    """Cells that are partly outwith an odd-sized canvas should be in the table."""
+
+    class OddApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Canvas(11, 11, UNSET, palette=[RED, GREEN])
+
+    async with OddApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.set_pixel(10, 0, RED).set_pixel(10, 1, GREEN).set_pixel(10, 10, RED)
+        for mode in ("quadrant", "braille"):
+            canvas.set_render_mode(mode)
+            for line in range(6):
+                canvas.render_line(line)
+            stats = canvas.segment_cache.stats
+            assert stats.misses == 0
+            assert stats.evictions == 0
+
+
+### test_palette.py ends here
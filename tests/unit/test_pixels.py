@@ -0,0 +1,208 @@
+"""Test the packed pixel storage."""
+
+##############################################################################
+# Pytest imports.
+from pytest import MonkeyPatch, raises
+
+##############################################################################
+# Textual imports.
+from textual.color import Color
+from textual.geometry import Region
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas, pixels
+from textual_canvas.pixels import (
+    NO_COLOR,
+    PALETTE_TYPE,
+    PixelBuffer,
+    pack_color,
+    unpack_color,
+)
+
+##############################################################################
+# Helpful constants.
+RED_CLEAR = Color(255, 0, 0, 0)
+
+
+##############################################################################
+def test_pack_round_trip() -> None:
+    """An opaque colour should survive being packed and unpacked."""
+    for colour in (Color(0, 0, 0), Color(255, 255, 255), Color(12, 34, 56)):
+        assert unpack_color(pack_color(colour)) == colour
+
+
+##############################################################################
+def test_pack_no_colour() -> None:
+    """No colour should pack to the no colour value, and back again."""
+    assert pack_color(None) == NO_COLOR
+    assert unpack_color(NO_COLOR) is None
+
+
+##############################################################################
+def test_pack_special_colours() -> None:
+    """Colours that RGBA can't describe should unpack to exactly what was packed."""
+    ansi, auto = Color(128, 0, 0, ansi=1), Color(0, 0, 0, auto=True)
+    for colour in (ansi, auto):
+        assert pack_color(colour) != NO_COLOR
+        assert unpack_color(pack_color(colour)) == colour
+    assert pack_color(ansi) != pack_color(Color(128, 0, 0))
+    assert pack_color(ansi) == pack_color(Color(128, 0, 0, ansi=1))
+
+
+##############################################################################
+def test_pack_alpha() -> None:
+    """Alpha should be packed to 8 bits, and no alpha should be no colour."""
+    assert unpack_color(pack_color(Color(10, 20, 30, 0.5))) == Color(
+        10, 20, 30, 128 / 255
+    )
+    for clear in (RED_CLEAR, Color(0, 0, 0, 0), Color(0, 0, 0, 0.001)):
+        assert pack_color(clear) == NO_COLOR
+
+
+##############################################################################
+def test_special_colours_are_bounded(monkeypatch: MonkeyPatch) -> None:
+    """Only the most recently packed special colours should be held."""
+    monkeypatch.setattr(pixels, "SPECIAL_COLOURS", 2)
+    monkeypatch.setattr(pixels, "_special_colours", {})
+    monkeypatch.setattr(pixels, "_special_values", {})
+    first, second, third = (Color(0, 0, 0, ansi=ansi) for ansi in range(3))
+    first_value = pack_color(first)
+    second_value = pack_color(second)
+    assert pack_color(first) == first_value
+    third_value = pack_color(third)
+    assert len({first_value, second_value, third_value}) == 3
+    assert unpack_color(first_value) == first
+    assert unpack_color(second_value) is None
+    assert unpack_color(third_value) == third
+    assert pack_color(second) not in (first_value, second_value, third_value)
+
+
+##############################################################################
+def test_canvas_special_colours() -> None:
+    """A canvas should give back, and render, the ANSI and auto colours drawn."""
+    canvas = Canvas(2, 2, Color(0, 0, 0))
+    canvas.set_pixel(0, 0, Color(128, 0, 0, ansi=1))
+    canvas.set_pixel(1, 0, Color(255, 255, 255, auto=True))
+    assert canvas.get_pixel(0, 0) == Color(128, 0, 0, ansi=1)
+    assert canvas.get_pixel(1, 0) == Color(255, 255, 255, auto=True)
+    ansi = pack_color(Color(128, 0, 0, ansi=1))
+    style = canvas._segments[ansi, ansi].style
+    assert style is not None
+    assert style.bgcolor is not None
+    assert style.bgcolor.number == 1
+
+
+##############################################################################
+def test_buffer_starts_blank() -> None:
+    """A new buffer should have no colour in any pixel."""
+    buffer = PixelBuffer(10, 5)
+    assert len(buffer.data) == 50
+    assert all(value == NO_COLOR for value in buffer.data)
+
+
+##############################################################################
+def test_buffer_rows() -> None:
+    """Rows of the buffer should be laid out one after the other."""
+    buffer = PixelBuffer(10, 5)
+    buffer.data[2 * 10 + 3] = 42
+    assert buffer.get(3, 2) == 42
+    assert list(buffer.row(2, 2, 5)) == [NO_COLOR, 42, NO_COLOR]
+    buffer.fill()
+    assert buffer.get(3, 2) == NO_COLOR
+
+
+##############################################################################
+def numbered(width: int, height: int) -> PixelBuffer:
+    """Make a buffer where each pixel's value is one more than its index."""
+    buffer = PixelBuffer(width, height)
+    for index in range(width * height):
+        buffer.data[index] = index + 1
+    return buffer
+
+
+##############################################################################
+def test_buffer_region() -> None:
+    """A region of a buffer should be a copy of that block of pixels."""
+    block = numbered(10, 5).region(2, 1, 3, 2)
+    assert (block.width, block.height) == (3, 2)
+    assert list(block.data) == [13, 14, 15, 23, 24, 25]
+
+
+##############################################################################
+def test_buffer_region_outwith() -> None:
+    """Any part of a region outwith the buffer should have no colour."""
+    block = numbered(10, 5).region(-1, 4, 3, 2)
+    assert list(block.data) == [NO_COLOR, 41, 42, NO_COLOR, NO_COLOR, NO_COLOR]
+    assert list(numbered(10, 5).region(20, 20, 2, 1).data) == [NO_COLOR] * 2
+
+
+##############################################################################
+def test_buffer_blit() -> None:
+    """Blitting a block should copy it into the buffer."""
+    buffer = PixelBuffer(4, 3)
+    assert buffer.blit(numbered(2, 2), 1, 1) == Region(1, 1, 2, 2)
+    assert list(buffer.data) == [0, 0, 0, 0, 0, 1, 2, 0, 0, 3, 4, 0]
+
+
+##############################################################################
+def test_buffer_blit_clips() -> None:
+    """Blitting a block should ignore any of it that is outwith the buffer."""
+    buffer = PixelBuffer(4, 3)
+    assert buffer.blit(numbered(3, 3), 2, -1) == Region(2, 0, 2, 2)
+    assert list(buffer.data) == [0, 0, 4, 5, 0, 0, 7, 8, 0, 0, 0, 0]
+    assert buffer.blit(numbered(3, 3), 4, 0) is None
+
+
+##############################################################################
+def test_buffer_blit_transparent() -> None:
+    """Blitting with a transparent value should leave those pixels alone."""
+    buffer = PixelBuffer(5, 1, 9)
+    block = PixelBuffer(5, 1)
+    block.data[1] = block.data[3] = 1
+    buffer.blit(block, 0, 0, NO_COLOR)
+    assert list(buffer.data) == [9, 1, 9, 1, 9]
+
+
+##############################################################################
+def test_buffer_blit_wrong_type() -> None:
+    """Blitting a block of a different type should be an error."""
+    with raises(ValueError):
+        PixelBuffer(4, 4).blit(PixelBuffer(2, 2, typecode=PALETTE_TYPE), 0, 0)
+
+
+##############################################################################
+def test_buffer_shift() -> None:
+    """Shifting a buffer should move the pixels and clear what is exposed."""
+    buffer = numbered(3, 3)
+    buffer.shift(1, -1)
+    assert list(buffer.data) == [0, 4, 5, 0, 7, 8, 0, 0, 0]
+    buffer.shift(-3, 0)
+    assert list(buffer.data) == [0] * 9
+
+
+##############################################################################
+def test_buffer_resize() -> None:
+    """Resizing a buffer should keep its pixels where they are placed."""
+    buffer = numbered(3, 2)
+    buffer.resize(3, 3)
+    assert list(buffer.data) == [1, 2, 3, 4, 5, 6, 0, 0, 0]
+    buffer.resize(3, 2, 0, -1)
+    assert list(buffer.data) == [4, 5, 6, 0, 0, 0]
+    buffer.resize(4, 3, 1, 1)
+    assert list(buffer.data) == [0, 0, 0, 0, 0, 4, 5, 6, 0, 0, 0, 0]
+    assert (buffer.width, buffer.height) == (4, 3)
+
+
+##############################################################################
+def test_buffer_changed_rows() -> None:
+    """Comparing buffers should give the runs of rows that differ."""
+    buffer = PixelBuffer(3, 6)
+    other = PixelBuffer(3, 6)
+    assert buffer.changed_rows(other) == []
+    other.data[4] = other.data[8] = 1
+    other.data[17] = 1
+    assert buffer.changed_rows(other) == [(1, 3), (5, 6)]
+
+
+### test_pixels.py ends here
@@ -0,0 +1,150 @@
+"""Test setting many pixels at once with set_points."""
+
+##############################################################################
+# Python imports.
+import sys
+
+##############################################################################
+# Pytest imports.
+from pytest import FixtureRequest, MonkeyPatch, fixture, importorskip, raises
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas, CanvasError
+from textual_canvas.pixels import pack_color
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+RED = Color(255, 0, 0)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(10, 10, UNSET)
+
+
+##############################################################################
+@fixture(params=["numpy", "python"])
+def implementation(request: FixtureRequest, monkeypatch: MonkeyPatch) -> str:
+    """Run the test both with and without the help of NumPy."""
+    if request.param == "python":
+        monkeypatch.setitem(sys.modules, "textual_canvas.arrays", None)
+    else:
+        importorskip("numpy")
+    return str(request.param)
+
+
+##############################################################################
+async def test_single_colour(implementation: str) -> None:
+    """Setting points with one colour should set all of them."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).set_points([1, 2, 3], [4, 5, 6], SET)
+        assert canvas.get_pixel(1, 4) == SET
+        assert canvas.get_pixel(2, 5) == SET
+        assert canvas.get_pixel(3, 6) == SET
+        assert canvas.get_pixel(1, 5) == UNSET
+
+
+##############################################################################
+async def test_colour_per_point(implementation: str) -> None:
+    """Setting points with a colour per point should use those colours."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).set_points(
+            [0, 9], [0, 9], colors=[RED, SET]
+        )
+        assert canvas.get_pixel(0, 0) == RED
+        assert canvas.get_pixel(9, 9) == SET
+
+
+##############################################################################
+async def test_clipped(implementation: str) -> None:
+    """Points outwith the canvas should be ignored when clipping."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).set_points(
+            [-1, 5, 10], [5, 5, 5], colors=[SET, RED, SET], clip=True
+        )
+        assert canvas.get_pixel(0, 5) == UNSET
+        assert canvas.get_pixel(5, 5) == RED
+        assert canvas.get_pixel(9, 5) == UNSET
+
+
+##############################################################################
+async def test_outwith_canvas(implementation: str) -> None:
+    """Points outwith the canvas should be an error when not clipping."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        with raises(CanvasError):
+            canvas.set_points([5, 10], [5, 5], SET)
+        assert canvas.get_pixel(5, 5) == UNSET
+
+
+##############################################################################
+async def test_outwith_tiled_canvas() -> None:
+    """Points outwith a tiled canvas should be an error, and draw nothing."""
+
+    class TiledApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Canvas(10, 10, UNSET, tile_size=4)
+
+    async with TiledApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        with raises(CanvasError):
+            canvas.set_points([5, 10], [5, 5], colors=[SET, SET])
+        assert canvas.get_pixel(5, 5) == UNSET
+
+
+##############################################################################
+async def test_tiled_canvas_array_colours() -> None:
+    """A tiled canvas should take its colours from NumPy arrays too."""
+
+    np = importorskip("numpy")
+
+    class TiledApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Canvas(10, 10, UNSET, tile_size=4)
+
+    async with TiledApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.set_points(
+            np.array([1, 8]),
+            np.array([2, 9]),
+            colors=np.array([[255, 0, 0], [255, 255, 255]], dtype=np.uint8),
+        )
+        assert canvas.get_pixel(1, 2) == RED
+        assert canvas.get_pixel(8, 9) == SET
+        canvas.set_points([3], [3], colors=np.array([pack_color(RED)]))
+        assert canvas.get_pixel(3, 3) == RED
+        with raises(CanvasError):
+            canvas.set_points([4], [4], colors=np.zeros((1, 2)))
+        with raises(CanvasError):
+            canvas.set_points([4, 5], [4, 5], colors=np.array([pack_color(RED)]))
+        assert canvas.get_pixel(4, 4) == UNSET
+
+
+##############################################################################
+async def test_mismatched_lengths(implementation: str) -> None:
+    """Locations and colours of different lengths should be an error."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        with raises(CanvasError):
+            canvas.set_points([1, 2], [1], SET)
+        with raises(CanvasError):
+            canvas.set_points([1, 2], [1, 2], colors=[SET])
+
+
+### test_points.py ends here
@@ -0,0 +1,94 @@
+"""Test reading and writing blocks of pixels on the canvas."""
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas, CanvasError
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+RED = Color(255, 0, 0)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(20, 20, UNSET)
+        yield Canvas(20, 20, UNSET, palette=[SET, RED])
+
+
+##############################################################################
+async def test_copy_a_region() -> None:
+    """Copying a region to elsewhere on the canvas should copy its pixels."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query(Canvas).first()
+        canvas.fill_rectangle(0, 0, 3, 3, SET).set_pixel(1, 1, RED)
+        canvas.put_region(canvas.get_region(0, 0, 3, 3), 10, 10)
+        assert canvas.get_pixel(10, 10) == SET
+        assert canvas.get_pixel(11, 11) == RED
+        assert canvas.get_pixel(12, 12) == SET
+        assert canvas.get_pixel(13, 13) == UNSET
+
+
+##############################################################################
+async def test_put_region_clips() -> None:
+    """Putting a region partly outwith the canvas should place what fits."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query(Canvas).first().fill_rectangle(0, 0, 4, 4, SET)
+        canvas.put_region(canvas.get_region(0, 0, 4, 4), 18, -2)
+        assert canvas.get_pixel(18, 0) == SET
+        assert canvas.get_pixel(19, 1) == SET
+        assert canvas.get_pixel(17, 0) == UNSET
+        assert canvas.get_pixel(18, 2) == UNSET
+
+
+##############################################################################
+async def test_put_region_transparent() -> None:
+    """Putting a region with a transparent colour should skip those pixels."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query(Canvas).first().set_pixel(1, 0, RED)
+        canvas.set_pixel(2, 0, SET)
+        block = canvas.get_region(0, 0, 3, 1)
+        canvas.fill_rectangle(10, 0, 3, 2, Color(0, 0, 255))
+        canvas.put_region(block, 10, 0, transparent=SET)
+        canvas.put_region(block, 10, 1, transparent=Color(0, 0, 0, 0))
+        assert canvas.get_pixel(10, 0) == UNSET
+        assert canvas.get_pixel(11, 0) == RED
+        assert canvas.get_pixel(12, 0) == Color(0, 0, 255)
+        assert canvas.get_pixel(10, 1) == Color(0, 0, 255)
+        assert canvas.get_pixel(11, 1) == RED
+        assert canvas.get_pixel(12, 1) == SET
+
+
+##############################################################################
+async def test_put_region_palette() -> None:
+    """Regions should be able to move between palette canvases only."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas, palette = pilot.app.query(Canvas)
+        palette.set_pixel(0, 0, RED)
+        block = palette.get_region(0, 0, 2, 2)
+        palette.fill_rectangle(5, 5, 2, 2, SET)
+        palette.put_region(block, 5, 5, transparent=Color(0, 0, 0, 0))
+        assert palette.get_pixel(5, 5) == RED
+        assert palette.get_pixel(6, 6) == SET
+        with raises(CanvasError):
+            canvas.put_region(block, 0, 0)
+
+
+### test_regions.py ends here
@@ -0,0 +1,146 @@
+"""Test the rendering of lines of the canvas."""
+
+##############################################################################
+# Python imports.
+from array import array
+
+##############################################################################
+# Pytest imports.
+from pytest import MonkeyPatch
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas
+from textual_canvas.pixels import PixelBuffer
+from textual_canvas.render import join_runs
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+VIEW_WIDTH = 80
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def __init__(self, width: int, height: int) -> None:
+        super().__init__()
+        self._width = width
+        self._height = height
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(self._width, self._height, UNSET)
+
+
+##############################################################################
+async def pixels_fetched(width: int, monkeypatch: MonkeyPatch) -> list[int]:
+    """Find how many pixels are fetched, from each row, to render a line."""
+
+    fetched: list[int] = []
+    row = PixelBuffer.row
+
+    def counted_row(
+        pixels: PixelBuffer, y: int, start: int = 0, end: int | None = None
+    ) -> array[int]:
+        values = row(pixels, y, start, end)
+        fetched.append(len(values))
+        return values
+
+    async with CanvasApp(width, 10).run_test(size=(VIEW_WIDTH, 24)) as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.set_pixel(width - 1, 0, SET)
+        with monkeypatch.context() as patch:
+            patch.setattr(PixelBuffer, "row", counted_row)
+            canvas.render_line(0)
+    return fetched
+
+
+##############################################################################
+async def test_line_cost_is_flat(monkeypatch: MonkeyPatch) -> None:
+    """The work of rendering a line should not grow with the canvas width."""
+    narrow = await pixels_fetched(VIEW_WIDTH * 2, monkeypatch)
+    wide = await pixels_fetched(VIEW_WIDTH * 100, monkeypatch)
+    assert narrow == wide == [VIEW_WIDTH, VIEW_WIDTH]
+
+
+##############################################################################
+async def test_only_visible_cells_rendered() -> None:
+    """A line of a wide canvas should only be as wide as the view."""
+
+    async with CanvasApp(VIEW_WIDTH * 10, 10).run_test(size=(VIEW_WIDTH, 24)) as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        assert canvas.render_line(0).cell_length <= VIEW_WIDTH
+
+
+##############################################################################
+async def test_scrolled_line() -> None:
+    """A scrolled line should show the pixels that have been scrolled to."""
+
+    async with CanvasApp(VIEW_WIDTH * 10, 10).run_test(size=(VIEW_WIDTH, 24)) as pilot:
+        canvas = pilot.app.query_one(Canvas).set_pixel(VIEW_WIDTH * 5, 0, SET)
+        canvas.scroll_to(VIEW_WIDTH * 5, 0, animate=False)
+        await pilot.pause()
+        segment = list(canvas.render_line(0))[0]
+        assert segment.style is not None
+        assert segment.style.bgcolor is not None
+        assert segment.style.bgcolor.triplet == SET.rich_color.triplet
+
+
+##############################################################################
+async def test_odd_height_last_line() -> None:
+    """The bottom half of the last line of an odd-height canvas should be background."""
+
+    async with CanvasApp(10, 3).run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        segment = list(canvas.render_line(1))[0]
+        assert segment.style is not None
+        assert segment.style.color is not None
+        assert (
+            segment.style.color.triplet == canvas.styles.background.rich_color.triplet
+        )
+
+
+##############################################################################
+async def test_flat_line_is_one_segment() -> None:
+    """A line of pixels all the same colour should render as one segment."""
+
+    async with CanvasApp(20, 10).run_test() as pilot:
+        strip = pilot.app.query_one(Canvas).render_line(0)
+        assert len(strip) == 1
+        assert strip.cell_length == 20
+
+
+##############################################################################
+async def test_one_segment_per_run() -> None:
+    """A line should render as one segment per run of matching cells."""
+
+    async with CanvasApp(20, 10).run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.draw_line(5, 0, 9, 0, SET)
+        canvas.set_pixel(12, 1, SET)
+        strip = canvas.render_line(0)
+        assert [segment.cell_length for segment in strip] == [5, 5, 2, 1, 7]
+
+
+##############################################################################
+async def test_join_runs() -> None:
+    """Joining lines should merge the runs that meet at each join."""
+
+    async with CanvasApp(20, 10).run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.draw_line(5, 0, 9, 0, SET)
+        strip = canvas.render_line(0)
+        joined = join_runs([strip.crop(0, 7), strip.crop(7, 14), strip.crop(14, 20)])
+        assert [segment.cell_length for segment in joined] == [5, 5, 10]
+        assert joined.cell_length == 20
+        assert joined == strip
+
+
+### test_render.py ends here
@@ -0,0 +1,168 @@
+"""Test the render modes that show more than two pixels in each cell."""
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+from textual.geometry import Size
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas, CanvasError
+from textual_canvas.pixels import NO_COLOR, pack_color
+from textual_canvas.segments import (
+    BRAILLE,
+    OUTSIDE,
+    QUADRANTS,
+    SegmentCache,
+    braille_cell,
+    cell_runs,
+    quadrant_cell,
+)
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+RED = pack_color(Color(255, 0, 0))
+GREEN = pack_color(Color(0, 255, 0))
+BLUE = pack_color(Color(0, 0, 255))
+
+
+##############################################################################
+def test_quadrant_glyphs() -> None:
+    """Each quadrant should be drawn by its own bit of the glyph index."""
+    assert QUADRANTS[1 | 2] == "▀"
+    assert QUADRANTS[4 | 8] == "▄"
+    assert QUADRANTS[1 | 4] == "▌"
+    assert QUADRANTS[1 | 2 | 4 | 8] == "█"
+
+
+##############################################################################
+def test_quadrant_two_colours() -> None:
+    """A quadrant cell of two colours should show both exactly."""
+    assert quadrant_cell((NO_COLOR, NO_COLOR, RED, NO_COLOR)) == (
+        QUADRANTS[4],
+        NO_COLOR,
+        RED,
+    )
+    assert quadrant_cell((RED, RED, RED, RED)) == (" ", RED, RED)
+
+
+##############################################################################
+def test_quadrant_ties_go_to_reading_order() -> None:
+    """When two colours are as common, the first in reading order is the background."""
+    assert quadrant_cell((RED, GREEN, GREEN, RED)) == (QUADRANTS[2 | 4], RED, GREEN)
+    assert quadrant_cell((GREEN, RED, RED, GREEN)) == (QUADRANTS[2 | 4], GREEN, RED)
+
+
+##############################################################################
+def test_quadrant_more_than_two_colours() -> None:
+    """Pixels of a third colour should be drawn in the foreground colour."""
+    assert quadrant_cell((BLUE, RED, GREEN, GREEN)) == (
+        QUADRANTS[1 | 2],
+        GREEN,
+        BLUE,
+    )
+
+
+##############################################################################
+def test_braille_glyphs() -> None:
+    """Each pixel of a braille cell should be its own dot."""
+    assert braille_cell((NO_COLOR,) * 8) == (" ", NO_COLOR, NO_COLOR)
+    assert braille_cell((RED,) + (NO_COLOR,) * 7)[0] == "⠁"
+    assert braille_cell((NO_COLOR,) * 7 + (RED,))[0] == "⢀"
+    assert braille_cell((RED,) * 8) == ("⣿", NO_COLOR, RED)
+    assert len(set(BRAILLE)) == 256
+
+
+##############################################################################
+def test_braille_colour() -> None:
+    """A braille cell should use the most common colour of its dots."""
+    pixels = (GREEN, RED, NO_COLOR, RED, OUTSIDE, NO_COLOR, GREEN, GREEN)
+    assert braille_cell(pixels) == (BRAILLE[1 | 8 | 16 | 64 | 128], NO_COLOR, GREEN)
+    pixels = (GREEN, RED, RED, GREEN, NO_COLOR, NO_COLOR, NO_COLOR, NO_COLOR)
+    assert braille_cell(pixels)[2] == GREEN
+
+
+##############################################################################
+def test_cell_runs() -> None:
+    """Cells with the same colours should be merged into one run."""
+    cache = SegmentCache()
+    runs = cell_runs(
+        cache,
+        [[RED, NO_COLOR, NO_COLOR, RED, GREEN], [NO_COLOR] * 5],
+        "quadrant",
+    )
+    assert [run.text for run in runs] == [
+        QUADRANTS[1] + QUADRANTS[2],
+        QUADRANTS[1 | 4],
+    ]
+    assert runs[0].style == cache[NO_COLOR, RED].style
+    assert runs[1].style == cache[OUTSIDE, GREEN].style
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(21, 21, UNSET, render_mode="braille")
+
+
+##############################################################################
+def test_unknown_mode() -> None:
+    """An unknown render mode should be an error."""
+    with raises(CanvasError):
+        Canvas(10, 10, render_mode="sextant")  # type: ignore[arg-type]
+
+
+##############################################################################
+async def test_virtual_size() -> None:
+    """The size of the canvas in cells should follow the render mode."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        assert canvas.render_mode == "braille"
+        assert canvas.virtual_size == Size(11, 6)
+        assert canvas.set_render_mode("quadrant").virtual_size == Size(11, 11)
+        assert canvas.set_render_mode("half").virtual_size == Size(21, 11)
+        with raises(CanvasError):
+            canvas.set_render_mode("sextant")  # type: ignore[arg-type]
+        assert canvas.virtual_size == Size(21, 11)
+
+
+##############################################################################
+async def test_render_braille() -> None:
+    """Pixels should be drawn as braille dots in pixel coordinates."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.set_pixel(3, 5, SET)
+        assert canvas.render_line(1).text == f"{BRAILLE[0]}{BRAILLE[16]}" + " " * 9
+        assert canvas.get_pixel(3, 5) == SET
+        canvas.set_pixel(3, 6, SET)
+        assert canvas.render_line(1).text[1] == BRAILLE[16 | 32]
+        canvas.set_render_mode("quadrant")
+        assert canvas.render_line(2).text[1] == QUADRANTS[8]
+        assert canvas.render_line(3).text[1] == QUADRANTS[2]
+
+
+##############################################################################
+async def test_dirty_cells() -> None:
+    """Drawing should refresh the cell that shows the pixels."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.set_pixel(0, 0, SET)
+        first, second = canvas.render_line(0), canvas.render_line(1)
+        canvas.set_pixel(1, 3, SET)
+        assert canvas.render_line(0) is not first
+        assert canvas.render_line(1) is second
+
+
+### test_render_modes.py ends here
@@ -0,0 +1,137 @@
+"""Test rendering pixels without a running application."""
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Rich imports.
+from rich.color import ColorSystem
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+from textual.geometry import Size
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas
+from textual_canvas.layers import Composite, Layer
+from textual_canvas.pixels import PALETTE_TYPE, PixelBuffer, pack_color
+from textual_canvas.render import Renderer
+from textual_canvas.segments import BRAILLE, CELL
+from textual_canvas.tiles import TiledPixelBuffer
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+RED = Color(255, 0, 0)
+
+
+##############################################################################
+def test_line() -> None:
+    """A line should be rendered as runs of cells."""
+    pixels = PixelBuffer(4, 3)
+    pixels.put(1, 0, pack_color(SET))
+    renderer = Renderer(UNSET, RED)
+    assert [segment.text for segment in renderer.line(pixels, 0)] == [
+        CELL,
+        CELL,
+        CELL * 2,
+    ]
+    (segment,) = renderer.line(pixels, 1)
+    assert segment.text == CELL * 4
+    assert segment.style is not None
+    assert segment.style.bgcolor is not None
+    assert segment.style.bgcolor.triplet == UNSET.rich_color.triplet
+    assert segment.style.color is not None
+    assert segment.style.color.triplet == RED.rich_color.triplet
+    assert renderer.line(pixels, 2) == []
+
+
+##############################################################################
+def test_strips() -> None:
+    """Every line of cells should be rendered as a strip."""
+    pixels = TiledPixelBuffer(10, 5, tile_size=4)
+    renderer = Renderer(UNSET)
+    assert renderer.size_of(10, 5) == Size(10, 3)
+    strips = renderer.strips(pixels)
+    assert len(strips) == 3
+    assert all(strip.cell_length == 10 for strip in strips)
+    assert renderer.strip(pixels, 0, 2, 6).cell_length == 4
+    assert renderer.strip(pixels, 0, 8, 20).cell_length == 2
+
+
+##############################################################################
+def test_render_mode() -> None:
+    """The renderer should render with its render mode."""
+    pixels = PixelBuffer(4, 8)
+    pixels.put(0, 0, pack_color(SET))
+    renderer = Renderer(UNSET, render_mode="braille")
+    assert renderer.size_of(4, 8) == Size(2, 2)
+    assert renderer.strip(pixels, 0).text == BRAILLE[1] + " "
+    with raises(ValueError):
+        renderer.render_mode = "sextant"  # type: ignore[assignment]
+    assert renderer.render_mode == "braille"
+
+
+##############################################################################
+def test_palette() -> None:
+    """A renderer with a palette should render palette indexes."""
+    pixels = PixelBuffer(2, 2, typecode=PALETTE_TYPE)
+    pixels.put(0, 0, 1)
+    (first, _) = Renderer(UNSET, palette=[RED]).line(pixels, 0)
+    assert first.style is not None
+    assert first.style.bgcolor is not None
+    assert first.style.bgcolor.triplet == RED.rich_color.triplet
+
+
+##############################################################################
+def test_composite() -> None:
+    """A composite of layers should be rendered as it is seen."""
+    base, top = PixelBuffer(2, 2), PixelBuffer(2, 2)
+    base.put(0, 0, pack_color(RED))
+    top.put(1, 0, pack_color(SET))
+    composite = Composite([Layer("base", base), Layer("top", top)])
+    renderer = Renderer(UNSET)
+    assert renderer.line(composite, 0) == renderer.line(composite.pixels, 0)
+    assert len(renderer.line(composite, 0)) == 2
+
+
+##############################################################################
+def test_ansi() -> None:
+    """Pixels should be rendered as ANSI text, one line per line of cells."""
+    pixels = PixelBuffer(3, 4)
+    pixels.put(0, 0, pack_color(RED))
+    text = Renderer(UNSET).ansi(pixels)
+    assert len(text.splitlines()) == 2
+    assert "\x1b[38;2;0;0;0;48;2;255;0;0m" in text
+    assert text.count(CELL) == 6
+    assert "\x1b[" in Renderer(UNSET).ansi(pixels, ColorSystem.STANDARD)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(30, 30, UNSET)
+
+
+##############################################################################
+async def test_same_as_canvas() -> None:
+    """A renderer should render the pixels of a canvas as the canvas does."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.draw_circle(15, 15, 10, RED)
+        pixels = PixelBuffer(30, 30)
+        pixels.copy_from(canvas._canvas)
+        renderer = Renderer(UNSET, canvas.styles.background)
+        for line in range(15):
+            assert canvas.render_line(line) == renderer.strip(pixels, line)
+
+
+### test_renderer.py ends here
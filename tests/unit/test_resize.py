@@ -0,0 +1,94 @@
+"""Test resizing the canvas."""
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+from textual.geometry import Size
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas, CanvasError
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+RED = Color(255, 0, 0)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def __init__(self, tile_size: int | None = None) -> None:
+        super().__init__()
+        self._tile_size = tile_size
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(20, 20, UNSET, tile_size=self._tile_size)
+
+
+##############################################################################
+async def test_resize_keeps_pixels() -> None:
+    """Resizing from the top left should keep the pixels where they are."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.set_pixel(0, 0, SET).set_pixel(19, 19, RED)
+        canvas.resize(30, 10)
+        assert (canvas.width, canvas.height) == (30, 10)
+        assert canvas.virtual_size == Size(30, 5)
+        assert canvas.get_pixel(0, 0) == SET
+        assert canvas.get_pixel(29, 9) == UNSET
+        canvas.resize(30, 20)
+        assert canvas.get_pixel(19, 19) == UNSET
+
+
+##############################################################################
+async def test_resize_anchors() -> None:
+    """The anchor should say where the pixels end up."""
+
+    for tile_size in (None, 4):
+        async with CanvasApp(tile_size).run_test() as pilot:
+            canvas = pilot.app.query_one(Canvas)
+            canvas.set_pixel(10, 10, SET)
+            canvas.resize(30, 24, "center")
+            assert canvas.get_pixel(15, 12) == SET
+            canvas.resize(20, 20, "bottom-right")
+            assert canvas.get_pixel(5, 8) == SET
+            canvas.resize(22, 20, "right")
+            assert canvas.get_pixel(7, 8) == SET
+
+
+##############################################################################
+async def test_resize_moves_sprites() -> None:
+    """Sprites should move along with the pixels when the canvas is resized."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.set_pixel(0, 0, RED)
+        block = canvas.get_region(0, 0, 1, 1)
+        canvas.clear().set_pixel(5, 5, SET)
+        sprite = canvas.add_sprite(block, 5, 5)
+        canvas.resize(24, 24, "bottom-right")
+        assert (sprite.x, sprite.y) == (9, 9)
+        assert canvas.get_pixel(9, 9) == RED
+        canvas.move_sprite(sprite, 0, 0)
+        assert canvas.get_pixel(9, 9) == SET
+
+
+##############################################################################
+async def test_resize_with_unknown_anchor() -> None:
+    """Resizing with an anchor that isn't known should be an error."""
+
+    async with CanvasApp().run_test() as pilot:
+        with raises(CanvasError):
+            pilot.app.query_one(Canvas).resize(10, 10, "middle")  # type: ignore[arg-type]
+
+
+### test_resize.py ends here
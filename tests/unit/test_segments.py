@@ -0,0 +1,82 @@
+"""Test the segment cache."""
+
+##############################################################################
+# Textual imports.
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas.pixels import NO_COLOR, pack_color
+from textual_canvas.segments import (
+    OUTSIDE,
+    PaletteSegmentCache,
+    SegmentCache,
+    runs_of,
+)
+
+##############################################################################
+# Helpful constants.
+BLACK = Color(0, 0, 0)
+RED = Color(255, 0, 0)
+GREEN = Color(0, 255, 0)
+
+
+##############################################################################
+def test_hits_and_misses() -> None:
+    """The cache should count the hits and misses of lookups."""
+    cache = SegmentCache()
+    red = pack_color(RED)
+    runs_of(cache, [red, NO_COLOR, red], [red, NO_COLOR, red])
+    stats = cache.stats
+    assert stats.misses == 2
+    assert stats.hits == 1
+    assert stats.size == 2
+    assert stats.hit_rate == 1 / 3
+
+
+##############################################################################
+def test_evictions() -> None:
+    """A full cache should drop the oldest segments."""
+    cache = SegmentCache(2)
+    cache[1, 1], cache[2, 2], cache[3, 3]
+    assert list(cache) == [(2, 2), (3, 3)]
+    assert cache.stats.evictions == 1
+    cache.maxsize = 1
+    assert list(cache) == [(3, 3)]
+    assert cache.stats.evictions == 2
+
+
+##############################################################################
+def test_warm() -> None:
+    """Warming the cache should build every pairing of the palette."""
+    cache = SegmentCache()
+    cache.warm([RED, GREEN])
+    assert len(cache) == 3 * 3 + 3
+    assert (pack_color(RED), OUTSIDE) in cache
+    cache[pack_color(GREEN), NO_COLOR]
+    assert cache.stats.misses == 0
+
+
+##############################################################################
+def test_colour_change() -> None:
+    """Changing colours should empty the cache and warm it again."""
+    cache = SegmentCache()
+    cache[1, 1]
+    cache.warm([RED])
+    cache.use_colours(RED, BLACK)
+    assert (1, 1) not in cache
+    assert len(cache) == 2 * 2 + 2
+
+
+##############################################################################
+def test_palette_table() -> None:
+    """A palette table should hold every pairing of palette indexes."""
+    table = PaletteSegmentCache([RED, GREEN])
+    assert len(table) == 4 * 4
+    red_on_green = table[1, 2]
+    table.palette = [GREEN, RED]
+    assert table[2, 1] == red_on_green
+    assert table.stats.misses == 0
+
+
+### test_segments.py ends here
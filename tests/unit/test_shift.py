@@ -0,0 +1,97 @@
+"""Test shifting the pixels of the canvas."""
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+RED = Color(255, 0, 0)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(20, 20, UNSET)
+        yield Canvas(20, 20, UNSET)
+
+
+##############################################################################
+async def test_shift_moves_pixels() -> None:
+    """Shifting should move the pixels and leave the exposed pixels unset."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.draw_line(0, 0, 19, 0, SET).draw_line(0, 0, 0, 19, RED)
+        canvas.shift_pixels(-1, 2)
+        assert canvas.get_pixel(0, 2) == SET
+        assert canvas.get_pixel(18, 2) == SET
+        assert canvas.get_pixel(19, 2) == UNSET
+        assert canvas.get_pixel(0, 5) == UNSET
+        assert canvas.get_pixel(5, 0) == UNSET
+
+
+##############################################################################
+async def test_shift_rebuilds_lines() -> None:
+    """Shifting should cause the lines in view to be rebuilt."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.set_pixel(10, 0, SET)
+        first = canvas.render_line(0)
+        canvas.shift_pixels(0, 2)
+        assert canvas.render_line(0) != first
+        assert canvas.render_line(1) == first
+
+
+##############################################################################
+async def test_shifted_lines_match() -> None:
+    """Lines moved with the pixels should look as they would if redrawn."""
+
+    async with CanvasApp().run_test() as pilot:
+        shifted, drawn = pilot.app.query(Canvas)
+        for offset in range(20):
+            shifted.set_pixel(offset, offset, SET).set_pixel(19 - offset, offset, RED)
+        for line in range(10):
+            shifted.render_line(line)
+        shifted.shift_pixels(-3, 0).shift_pixels(0, 4).shift_pixels(2, -2)
+        # Anything shifted off the canvas is lost, even if shifted back.
+        for offset in range(16):
+            if offset >= 3:
+                drawn.set_pixel(offset - 1, offset + 2, SET)
+            drawn.set_pixel(18 - offset, offset + 2, RED)
+        for line in range(10):
+            assert (
+                shifted.render_line(line).simplify()
+                == drawn.render_line(line).simplify()
+            )
+
+
+##############################################################################
+async def test_shift_leaves_sprites() -> None:
+    """Shifting should move what is under sprites, but not the sprites."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        canvas.set_pixel(0, 0, RED)
+        block = canvas.get_region(0, 0, 1, 1)
+        canvas.clear().set_pixel(5, 5, SET)
+        sprite = canvas.add_sprite(block, 5, 5)
+        canvas.shift_pixels(1, 0)
+        assert canvas.get_pixel(5, 5) == RED
+        assert canvas.get_pixel(6, 5) == SET
+        canvas.move_sprite(sprite, 0, 0)
+        assert canvas.get_pixel(5, 5) == UNSET
+        assert canvas.get_pixel(6, 5) == SET
+
+
+### test_shift.py ends here
@@ -0,0 +1,192 @@
+"""Test sprites on the canvas."""
+
+##############################################################################
+# Python imports.
+from random import Random
+from time import perf_counter
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas, CanvasError
+from textual_canvas.pixels import PixelBuffer
+
+##############################################################################
+# Test helper imports.
+from counting import CountingCanvas
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+RED = Color(255, 0, 0)
+GREEN = Color(0, 255, 0)
+CLEAR = Color(0, 0, 0, 0)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def __init__(self, width: int = 20, height: int = 20) -> None:
+        super().__init__()
+        self._width = width
+        self._height = height
+
+    def compose(self) -> ComposeResult:
+        yield CountingCanvas(self._width, self._height)
+
+
+##############################################################################
+def block_of(canvas: Canvas, colour: Color, width: int, height: int) -> PixelBuffer:
+    """Make a solid block of a colour, using the corner of the canvas."""
+    canvas.fill_rectangle(0, 0, width, height, colour)
+    block = canvas.get_region(0, 0, width, height)
+    canvas.clear()
+    return block
+
+
+##############################################################################
+async def test_sprite_restores_background() -> None:
+    """Moving a sprite should put back what was under it."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        block = block_of(canvas, RED, 2, 2)
+        canvas.set_pixel(5, 5, GREEN)
+        sprite = canvas.add_sprite(block, 4, 4)
+        assert canvas.get_pixel(5, 5) == RED
+        canvas.move_sprite(sprite, 10, 10)
+        assert canvas.get_pixel(5, 5) == GREEN
+        assert canvas.get_pixel(4, 4) == UNSET
+        assert canvas.get_pixel(11, 11) == RED
+        canvas.remove_sprite(sprite)
+        assert canvas.get_pixel(11, 11) == UNSET
+        with raises(CanvasError):
+            canvas.move_sprite(sprite, 0, 0)
+
+
+##############################################################################
+async def test_transparent_sprite() -> None:
+    """The transparent pixels of a sprite should not be drawn."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        canvas.set_pixel(1, 1, RED)
+        block = canvas.get_region(0, 0, 3, 3)
+        canvas.clear().fill_rectangle(5, 5, 3, 3, GREEN)
+        canvas.add_sprite(block, 5, 5, transparent=CLEAR)
+        assert canvas.get_pixel(5, 5) == GREEN
+        assert canvas.get_pixel(6, 6) == RED
+
+
+##############################################################################
+async def test_overlapping_sprites() -> None:
+    """Overlapping sprites should stack and restore correctly."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        red, green = block_of(canvas, RED, 4, 4), block_of(canvas, GREEN, 4, 4)
+        canvas.fill_rectangle(0, 0, 20, 20, SET)
+        bottom = canvas.add_sprite(red, 0, 0)
+        top = canvas.add_sprite(green, 2, 2)
+        canvas.move_sprite(bottom, 3, 3)
+        assert canvas.get_pixel(0, 0) == SET
+        assert canvas.get_pixel(3, 3) == GREEN
+        assert canvas.get_pixel(6, 6) == RED
+        canvas.move_sprite(top, 15, 15)
+        assert canvas.get_pixel(3, 3) == RED
+        assert canvas.get_pixel(2, 2) == SET
+        canvas.remove_sprite(bottom).remove_sprite(top)
+        assert all(canvas.get_pixel(x, y) == SET for x in range(20) for y in range(20))
+
+
+##############################################################################
+async def test_sprites_survive_clear() -> None:
+    """Clearing the canvas should leave the sprites on it."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        sprite = canvas.add_sprite(block_of(canvas, RED, 2, 2), 4, 4)
+        canvas.fill_rectangle(0, 0, 20, 20, SET).clear()
+        assert canvas.get_pixel(4, 4) == RED
+        canvas.move_sprite(sprite, 10, 10)
+        assert canvas.get_pixel(4, 4) == UNSET
+
+
+##############################################################################
+async def test_sprites_in_a_batch() -> None:
+    """Sprites moved in a batch should be drawn when the batch ends."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        sprite = canvas.add_sprite(block_of(canvas, RED, 2, 2), 0, 0)
+        with canvas.batch_refresh():
+            for position in range(10):
+                canvas.move_sprite(sprite, position, position)
+            assert canvas.get_pixel(0, 0) == RED
+        assert canvas.get_pixel(0, 0) == UNSET
+        assert canvas.get_pixel(9, 9) == RED
+
+
+##############################################################################
+async def test_moving_refreshes_old_and_new() -> None:
+    """Moving a sprite should only refresh where it was and where it is."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        sprite = canvas.add_sprite(block_of(canvas, RED, 2, 2), 0, 0)
+        await pilot.pause()
+        canvas.rendered.clear()
+        canvas.move_sprite(sprite, 0, 4)
+        await pilot.pause()
+        assert sorted(canvas.rendered) == [0, 1, 2]
+
+
+##############################################################################
+async def test_wrong_sprite_type() -> None:
+    """A sprite made from a different type of block should be an error."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        with raises(CanvasError):
+            canvas.add_sprite(PixelBuffer(2, 2, typecode="B"), 0, 0)
+
+
+##############################################################################
+async def test_many_sprites() -> None:
+    """Hundreds of sprites should be quick to move."""
+
+    random = Random(42)
+    async with CanvasApp(200, 100).run_test() as pilot:
+        canvas = pilot.app.query_one(CountingCanvas)
+        block = block_of(canvas, RED, 4, 4)
+        canvas.fill_rectangle(0, 0, 200, 100, SET)
+        sprites = [
+            canvas.add_sprite(block, random.randrange(200), random.randrange(100))
+            for _ in range(300)
+        ]
+        start = perf_counter()
+        for _ in range(10):
+            with canvas.batch_refresh():
+                for sprite in sprites:
+                    canvas.move_sprite(
+                        sprite, random.randrange(-4, 200), random.randrange(-4, 100)
+                    )
+        assert (perf_counter() - start) / 10 < 1 / 30
+        for sprite in sprites:
+            canvas.remove_sprite(sprite)
+        assert all(
+            canvas.get_pixel(x, y) == SET for x in range(200) for y in range(100)
+        )
+
+
+### test_sprites.py ends here
@@ -0,0 +1,139 @@
+"""Test drawing on the canvas from other threads."""
+
+##############################################################################
+# Python imports.
+from threading import Thread
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Textual imports.
+from textual import work
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas, CanvasError
+from textual_canvas.threads import DrawingQueue
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+RED = Color(255, 0, 0)
+
+
+##############################################################################
+def test_queued_drawing() -> None:
+    """Drawing should only be done when the queue is drained, in order."""
+    canvas = Canvas(10, 10, UNSET)
+    queue = DrawingQueue(canvas)
+    queue.set_pixel(0, 0, SET).set_pixels([(1, 1), (2, 2)], SET)
+    queue.draw_line(0, 9, 9, 9, SET).fill_rectangle(5, 0, 2, 2, SET)
+    queue.set_row(4, [RED] * 3, 8).call(lambda canvas: canvas.clear_pixel(2, 2))
+    assert queue.pending == 6
+    assert canvas.get_pixel(0, 0) == UNSET
+    assert queue.drain() == 6
+    assert queue.pending == 0
+    assert canvas.get_pixel(0, 0) == SET
+    assert canvas.get_pixel(1, 1) == SET
+    assert canvas.get_pixel(2, 2) == UNSET
+    assert all(canvas.get_pixel(x, 9) == SET for x in range(10))
+    assert canvas.get_pixel(6, 1) == SET
+    assert canvas.get_pixel(8, 4) == RED
+    assert canvas.get_pixel(9, 4) == RED
+    queue.clear(RED).drain()
+    assert canvas.get_pixel(0, 0) == RED
+
+
+##############################################################################
+def test_budget() -> None:
+    """Draining with a budget should leave what it couldn't draw."""
+    canvas = Canvas(10, 10, UNSET)
+    queue = DrawingQueue(canvas)
+    for y in range(10):
+        queue.set_row(y, [SET] * 10)
+    assert queue.drain(1e-9) == 1
+    assert queue.pending == 9
+    assert queue.drain() == 9
+
+
+##############################################################################
+def test_closed() -> None:
+    """Nothing should be queued once the queue is closed."""
+    with DrawingQueue(Canvas(10, 10, UNSET)) as queue:
+        queue.set_pixel(0, 0, SET)
+    assert queue.closed
+    with raises(RuntimeError):
+        queue.set_pixel(1, 1, SET)
+    assert queue.pending == 1
+
+
+##############################################################################
+def test_from_threads() -> None:
+    """Drawing queued from many threads at once should all be drawn."""
+    canvas = Canvas(100, 40, UNSET)
+    queue = DrawingQueue(canvas)
+
+    def draw(row: int) -> None:
+        for y in range(row, row + 10):
+            for x in range(100):
+                queue.set_pixel(x, y, SET)
+
+    threads = [Thread(target=draw, args=(row,)) for row in range(0, 40, 10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert queue.drain() == 4000
+    assert all(canvas.get_pixel(x, y) == SET for x in range(100) for y in range(40))
+
+
+##############################################################################
+def test_bad_queue() -> None:
+    """A drawing queue needs a positive frame rate and budget."""
+    canvas = Canvas(10, 10, UNSET)
+    with raises(CanvasError):
+        canvas.queue_drawing(fps=0)
+    with raises(CanvasError):
+        canvas.queue_drawing(budget=0)
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(40, 40, UNSET)
+
+    def on_mount(self) -> None:
+        self.queue = self.query_one(Canvas).queue_drawing(fps=100)
+        self.draw(self.queue)
+
+    @work(thread=True)
+    def draw(self, queue: DrawingQueue) -> None:
+        with queue:
+            for y in range(40):
+                queue.set_row(y, [SET] * 40)
+
+
+##############################################################################
+async def test_worker() -> None:
+    """Drawing queued by a worker should be drawn in frames until it is done."""
+
+    app = CanvasApp()
+    async with app.run_test() as pilot:
+        await app.workers.wait_for_complete()
+        await pilot.pause(0.2)
+        canvas = app.query_one(Canvas)
+        assert all(canvas.get_pixel(x, y) == SET for x in range(40) for y in range(40))
+        assert app.queue.closed
+        assert not app.queue.running
+        assert app.queue.stats is not None
+        assert app.queue.stats.frames > 0
+
+
+### test_threads.py ends here
@@ -0,0 +1,132 @@
+"""Test the sparse, tiled, storage of pixels."""
+
+##############################################################################
+# Python imports.
+from array import array
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.color import Color
+
+##############################################################################
+# Local imports.
+from textual_canvas import Canvas, CanvasError
+from textual_canvas.pixels import PIXEL_TYPE, PixelBuffer
+from textual_canvas.tiles import TiledPixelBuffer
+
+##############################################################################
+# Helpful constants.
+UNSET = Color(0, 0, 0)
+SET = Color(255, 255, 255)
+RED = Color(255, 0, 0)
+
+
+##############################################################################
+def test_tiles_are_allocated_on_write() -> None:
+    """Only the tiles that are written to should be allocated."""
+    buffer = TiledPixelBuffer(100, 100, tile_size=10)
+    assert buffer.tiles == {}
+    buffer.put(15, 25, 0)
+    assert buffer.tiles == {}
+    buffer.put(15, 25, 7)
+    assert list(buffer.tiles) == [(1, 2)]
+    assert buffer.get(15, 25) == 7
+    assert buffer.get(50, 50) == 0
+
+
+##############################################################################
+def test_tiled_rows() -> None:
+    """Rows should be read and written across tiles."""
+    buffer = TiledPixelBuffer(10, 2, tile_size=4)
+    buffer.set_row(1, 2, array(PIXEL_TYPE, [1, 2, 3, 4, 5]))
+    assert list(buffer.row(1)) == [0, 0, 1, 2, 3, 4, 5, 0, 0, 0]
+    assert list(buffer.row(1, 3, 9)) == [2, 3, 4, 5, 0, 0]
+    assert list(buffer.row(0)) == [0] * 10
+    assert sorted(buffer.tiles) == [(0, 0), (1, 0)]
+    buffer.set_row(1, 8, array(PIXEL_TYPE, [0, 0]))
+    assert sorted(buffer.tiles) == [(0, 0), (1, 0)]
+
+
+##############################################################################
+def test_tiled_region_and_blit() -> None:
+    """Blocks copied in and out of a tiled buffer should be contiguous."""
+    buffer = TiledPixelBuffer(10, 10, tile_size=3)
+    block = PixelBuffer(3, 2)
+    block.data[:] = array(PIXEL_TYPE, [1, 0, 2, 3, 0, 4])
+    assert buffer.blit(block, 2, 2, transparent=0) is not None
+    assert list(buffer.region(2, 2, 3, 2).data) == [1, 0, 2, 3, 0, 4]
+    assert list(buffer.region(-1, 2, 2, 1).data) == [0, 0]
+
+
+##############################################################################
+def test_tiled_shift() -> None:
+    """Shifting a tiled buffer should move the pixels of its tiles."""
+    flat = PixelBuffer(7, 5)
+    tiled = TiledPixelBuffer(7, 5, tile_size=2)
+    for index in range(35):
+        flat.data[index] = index + 1
+        tiled.put(index % 7, index // 7, index + 1)
+    for x, y in ((1, -1), (-3, 2), (0, 0), (8, 0)):
+        flat.shift(x, y)
+        tiled.shift(x, y)
+        assert [tiled.row(row) for row in range(5)] == [
+            flat.row(row) for row in range(5)
+        ]
+
+
+##############################################################################
+def test_tiled_changed_rows() -> None:
+    """Comparing tiled buffers should find the rows that differ."""
+    buffer = TiledPixelBuffer(20, 20, tile_size=8)
+    other = buffer.empty()
+    assert buffer.changed_rows(other) == []
+    other.put(3, 9, 1)
+    other.put(19, 10, 1)
+    buffer.put(0, 17, 1)
+    assert buffer.changed_rows(other) == [(9, 11), (17, 18)]
+    other.copy_from(buffer)
+    assert buffer.changed_rows(other) == []
+
+
+##############################################################################
+class CanvasApp(App[None]):
+    """The application for these tests."""
+
+    def compose(self) -> ComposeResult:
+        yield Canvas(50_000, 50_000, UNSET, tile_size=64)
+
+
+##############################################################################
+async def test_huge_tiled_canvas() -> None:
+    """Memory for a tiled canvas should grow with what is drawn on it."""
+
+    async with CanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas)
+        assert isinstance(tiles := canvas._canvas, TiledPixelBuffer)
+        assert tiles.tiles == {}
+        canvas.fill_circle(25_000, 25_000, 50, RED).set_pixel(49_999, 49_999, SET)
+        canvas.flood_fill(25_000, 25_000, SET)
+        assert len(tiles.tiles) <= 9
+        assert canvas.get_pixel(25_000, 25_049) == SET
+        assert canvas.get_pixel(49_999, 49_999) == SET
+        assert canvas.get_pixel(0, 0) == UNSET
+        assert (
+            canvas.render_line(0).cell_length == canvas.scrollable_content_region.width
+        )
+
+
+##############################################################################
+async def test_tiled_canvas_has_no_pixel_array() -> None:
+    """The pixels of a tiled canvas can't be viewed as an array."""
+
+    async with CanvasApp().run_test() as pilot:
+        with raises(CanvasError), pilot.app.query_one(Canvas).pixel_array():
+            pass
+
+
+### test_tiles.py ends here
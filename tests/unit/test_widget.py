@@ -85,6 +85,20 @@ async def test_clear_within_canvas() -> None:
         assert canvas.get_pixel(1, 1) == UNSET
 
 
+##############################################################################
+async def test_clear_without_canvas_colour() -> None:
+    """Clearing a pixel with no canvas colour should use the widget's background."""
+
+    class DefaultCanvasApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Canvas(WIDTH, HEIGHT, pen_color=SET)
+
+    async with DefaultCanvasApp().run_test() as pilot:
+        canvas = pilot.app.query_one(Canvas).set_pixel(1, 1)
+        canvas.clear_pixel(1, 1)
+        assert canvas.get_pixel(1, 1) == canvas.styles.background
+
+
 ##############################################################################
 async def test_clear_outwith_canvas() -> None:
     """Clearing a outwith the canvas should raise an error."""